@@ -0,0 +1,85 @@
+"""Compares loading compressed csv files with loading the plain file.
+
+A generated file is compressed with gzip, bz2 and xz and every version is
+loaded with the default and the fast loader. Throughput is in MB of csv text
+per second, so the formats compare directly. The last row decompresses the
+gzip file to a temporary file first and loads that, which is what callers
+had to do before the loaders read compressed files.
+
+Run from the repository root with: python benchmarks/bench_compressed.py [--rows N]
+"""
+import argparse
+import bz2
+import gzip
+import lzma
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import weather  # noqa: E402
+from generate_data import generate_csv  # noqa: E402
+
+COMPRESSORS = (("gzip", gzip.compress), ("bz2", bz2.compress), ("xz", lzma.compress))
+
+
+def best_time(function, repeat):
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - started)
+    return min(times)
+
+
+def load_via_temporary_file(path):
+    handle, plain = tempfile.mkstemp(suffix=".csv")
+    try:
+        with os.fdopen(handle, "wb") as output, gzip.open(path, "rb") as source:
+            shutil.copyfileobj(source, output, weather.DECOMPRESS_BUFFER_SIZE)
+        return weather.load_data_from_csv(plain)
+    finally:
+        os.remove(plain)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=lambda text: int(float(text)), default=200000, help="rows in the generated file")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case, the fastest is shown")
+    arguments = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    try:
+        plain = generate_csv(os.path.join(directory, "plain.csv"), arguments.rows)
+        with open(plain, "rb") as file:
+            data = file.read()
+        text_mb = len(data) / 2 ** 20
+        files = [("plain", plain)]
+        for name, compress in COMPRESSORS:
+            path = os.path.join(directory, f"data.{name}")
+            with open(path, "wb") as file:
+                file.write(compress(data))
+            files.append((name, path))
+        expected = weather.load_data_from_csv(plain)
+        print(f"{arguments.rows} rows, {text_mb:.1f} MB of csv text, fastest of {arguments.repeat} runs")
+        print(f"{'input':23} {'size':>8} {'loader':>16} {'fast loader':>16}")
+        for name, path in files:
+            if weather.load_data_from_csv(path) != expected or weather.load_data_from_csv(path, fast=True) != expected:
+                raise SystemExit(f"{name} loaded different rows")
+            cells = []
+            for options in ({}, {"fast": True}):
+                seconds = best_time(lambda: weather.load_data_from_csv(path, **options), arguments.repeat)
+                cells.append(f"{seconds:6.2f}s {text_mb / seconds:5.1f}MB/s")
+            print(f"{name:23} {os.path.getsize(path) / 2 ** 20:6.1f}MB {cells[0]:>16} {cells[1]:>16}")
+        seconds = best_time(lambda: load_via_temporary_file(files[1][1]), arguments.repeat)
+        print(f"{'gzip via temporary file':23} {os.path.getsize(files[1][1]) / 2 ** 20:6.1f}MB "
+              f"{seconds:6.2f}s {text_mb / seconds:5.1f}MB/s")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
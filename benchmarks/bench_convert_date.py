@@ -0,0 +1,41 @@
+"""Times convert_date against the plain fromisoformat + strftime conversion.
+
+Run from the repository root with: python benchmarks/bench_convert_date.py
+"""
+import os
+import sys
+import timeit
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import weather  # noqa: E402
+
+
+def original_convert_date(iso_string):
+    return datetime.fromisoformat(iso_string).strftime("%A %d %B %Y")
+
+
+def main():
+    start = datetime(2020, 1, 1, 7)
+    # one year of daily readings, repeated for 20 stations
+    unique = [(start + timedelta(days=day)).isoformat() + "+08:00" for day in range(365)]
+    dates = unique * 20
+    uncached = weather.convert_date.__wrapped__
+
+    def run(function):
+        return min(timeit.repeat(lambda: [function(date) for date in dates], number=5, repeat=5)) / 5
+
+    original = run(original_convert_date)
+    fast_path = run(uncached)
+    weather.convert_date.cache_clear()
+    cached = run(weather.convert_date)
+    print(f"{len(dates)} dates, {len(unique)} distinct")
+    print(f"fromisoformat + strftime: {original * 1000:8.2f} ms")
+    print(f"fixed-shape fast path:    {fast_path * 1000:8.2f} ms  ({original / fast_path:.1f}x)")
+    print(f"fast path + LRU cache:    {cached * 1000:8.2f} ms  ({original / cached:.1f}x)")
+    print(weather.convert_date.cache_info())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Measures how long "import weather" takes, as a guard against slow imports.
+
+Runs "python -X importtime -c 'import weather'" several times with a warm
+bytecode cache and reports the median cumulative time of the weather module.
+Exits with status 1 if the median is above --max-ms or if one of the modules
+that weather only imports on demand was loaded.
+
+Run from the repository root with: python benchmarks/bench_import_time.py [--max-ms 15]
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Imported inside the functions that need them, never by "import weather".
+DEFERRED_MODULES = ("argparse", "contextlib", "csv", "glob", "mmap", "re", "concurrent.futures", "multiprocessing",
+                    "asyncio", "json", "urllib.parse", "gzip", "bz2", "lzma", "hashlib")
+
+LINE = re.compile(r"import time:\s*(\d+) \|\s*(\d+) \|( *)(\S+)")
+
+
+def import_times(env):
+    """Returns {module: cumulative microseconds} for the modules a fresh "import weather" loads."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import weather"],
+                            cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    if result.stdout:
+        raise SystemExit(f"importing weather printed to stdout:\n{result.stdout}")
+    times = {}
+    for match in LINE.finditer(result.stderr):
+        times[match[4]] = int(match[2])
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--max-ms", type=float, default=15.0)
+    arguments = parser.parse_args()
+
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    with tempfile.TemporaryDirectory() as cache:
+        # compiled bytecode goes to a scratch directory, the first run fills it
+        env["PYTHONPYCACHEPREFIX"] = cache
+        import_times(env)
+        runs = [import_times(env) for _ in range(arguments.runs)]
+
+    median_ms = statistics.median(times["weather"] for times in runs) / 1000
+    loaded = sorted(name for name in DEFERRED_MODULES if name in runs[-1])
+    print(f"import weather: median {median_ms:.2f} ms over {arguments.runs} runs (limit {arguments.max_ms} ms)")
+    heaviest = sorted(runs[-1].items(), key=lambda item: item[1], reverse=True)[:8]
+    for name, microseconds in heaviest:
+        print(f"  {microseconds / 1000:7.2f} ms  {name}")
+    if loaded:
+        print(f"deferred modules imported eagerly: {', '.join(loaded)}")
+    return 1 if median_ms > arguments.max_ms or loaded else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
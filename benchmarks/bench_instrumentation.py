@@ -0,0 +1,137 @@
+"""Measures what the Instrumentation hooks cost, switched off and switched on.
+
+The instrumented functions are timed against copies of the same code without
+the hooks, alternating between the two. With instrumentation off the difference
+should be within noise; the script exits with 1 when any case is more than
+--max-overhead percent slower.
+
+Run from the repository root with: python benchmarks/bench_instrumentation.py [--rows N]
+"""
+import argparse
+import csv
+import io
+import os
+import statistics
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import weather  # noqa: E402
+from generate_data import generate_csv  # noqa: E402
+
+
+# The references are copies of weather's code with the hooks taken out, so
+# that the comparison only measures the hooks.
+def reference_parse_row(row):
+    if row == []:
+        return None
+    try:
+        return [row[0], float(row[1]), float(row[2])]
+    except ValueError:
+        return None
+
+
+def reference_iter_data(csv_file, chunk_size=None):
+    with weather._open_csv(csv_file) as file:
+        reader = csv.reader(file)
+        next(reader, None)
+        chunk = []
+        for row in reader:
+            reading = reference_parse_row(row)
+            if reading is None:
+                continue
+            if chunk_size is None:
+                yield reading
+                continue
+            chunk.append(reading)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def reference_load_data(csv_file):
+    return list(reference_iter_data(csv_file))
+
+
+def reference_generate_summary(weather_data):
+    return weather.SummaryAccumulator().update(weather_data).summary()
+
+
+def reference_generate_daily_summary(weather_data):
+    output = io.StringIO()
+    write = output.write
+    batch = []
+    days = 0
+    for date, min_f, max_f in weather._iter_readings(weather_data):
+        batch.append(weather._daily_block(date, min_f, max_f))
+        days += 1
+        if len(batch) == weather.DAILY_SUMMARY_BATCH:
+            write("".join(batch))
+            batch = []
+    if days == 0:
+        batch.append("\n")
+    if batch:
+        write("".join(batch))
+    return output.getvalue()
+
+
+def paired(functions, repeat):
+    """Runs the functions in turn, so a noisy moment hits all of them alike.
+
+    Returns the fastest time of each function and, for every function after
+    the first, the median of its per-round time ratios to the first one.
+    """
+    times = [[] for _ in functions]
+    for _ in range(repeat):
+        for position, function in enumerate(functions):
+            times[position].append(timeit.timeit(function, number=1))
+    ratios = [statistics.median(mine / first for mine, first in zip(own, times[0])) for own in times[1:]]
+    return [min(own) for own in times], ratios
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=lambda text: int(float(text)), default=5000, help="rows in the generated file")
+    parser.add_argument("--repeat", type=int, default=40, help="rounds per case")
+    parser.add_argument("--max-overhead", type=float, default=5.0, help="allowed slowdown with instrumentation off, in percent")
+    arguments = parser.parse_args()
+
+    handle, path = tempfile.mkstemp(suffix=".csv")
+    os.close(handle)
+    try:
+        # 5% malformed rows, so the rows_rejected hook is exercised too
+        generate_csv(path, arguments.rows, bad_fraction=0.05)
+        rows = weather.load_data_from_csv(path)
+        cases = (
+            ("load_data_from_csv", lambda: reference_load_data(path), lambda: weather.load_data_from_csv(path)),
+            ("generate_summary", lambda: reference_generate_summary(rows), lambda: weather.generate_summary(rows)),
+            ("generate_daily_summary", lambda: reference_generate_daily_summary(rows),
+             lambda: weather.generate_daily_summary(rows)),
+        )
+        print(f"{arguments.rows} rows, fastest of {arguments.repeat} runs; costs are median ratios of paired runs")
+        print(f"{'case':24} {'no hooks':>10} {'off':>10} {'on':>10} {'off cost':>9} {'on cost':>9}")
+        failed = False
+        for name, reference, instrumented in cases:
+            reference()
+            instrumented()
+            (plain, off), (off_ratio,) = paired((reference, instrumented), arguments.repeat)
+            with weather.Instrumentation():
+                (plain, on), (on_ratio,) = paired((reference, instrumented), arguments.repeat)
+            off_cost = (off_ratio - 1) * 100
+            on_cost = (on_ratio - 1) * 100
+            failed = failed or off_cost > arguments.max_overhead
+            print(f"{name:24} {plain * 1000:8.2f}ms {off * 1000:8.2f}ms {on * 1000:8.2f}ms {off_cost:8.1f}% {on_cost:8.1f}%")
+    finally:
+        os.remove(path)
+    if failed:
+        print(f"instrumentation costs more than {arguments.max_overhead}% while switched off", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""Compares the memory per row and the speed of the in-memory formats.
+
+A generated file is loaded as [date, min, max] lists, as DailyReading records
+and as a WeatherSeries. For each format the memory still allocated after
+loading (measured with tracemalloc, the file's text included in every row's
+date) is divided by the number of rows. The load time and the time of a daily
+summary are shown next to it, since readings parse their dates while loading
+instead of in every function that formats them.
+
+Run from the repository root with: python benchmarks/bench_memory.py [--rows N]
+"""
+import argparse
+import gc
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import weather  # noqa: E402
+from generate_data import generate_csv  # noqa: E402
+
+FORMATS = (
+    ("lists", {}),
+    ("DailyReading", {"as_readings": True}),
+    ("WeatherSeries", {"as_series": True}),
+)
+
+
+def measure(path, options):
+    """Returns (bytes per row, rows, load seconds, daily summary seconds) for one format."""
+    started = time.perf_counter()
+    data = weather.load_data_from_csv(path, fast=True, **options)
+    loaded = time.perf_counter() - started
+    # every date is different, so convert_date's cache doesn't hide the parsing
+    weather.convert_date.cache_clear()
+    started = time.perf_counter()
+    weather.write_daily_summary(data, io.StringIO())
+    daily = time.perf_counter() - started
+    rows = len(data)
+    del data
+    # loaded again for the memory, tracemalloc makes allocations a lot slower
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    data = weather.load_data_from_csv(path, fast=True, **options)
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del data
+    return size / rows, rows, loaded, daily
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=lambda text: int(float(text)), default=1000000, help="rows in the generated file")
+    arguments = parser.parse_args()
+
+    handle, path = tempfile.mkstemp(suffix=".csv")
+    os.close(handle)
+    try:
+        generate_csv(path, arguments.rows)
+        print(f"{arguments.rows} rows, loaded with fast=True")
+        print(f"{'format':14} {'bytes/row':>10} {'total':>10} {'load':>9} {'daily':>9}")
+        for name, options in FORMATS:
+            per_row, rows, loaded, daily = measure(path, options)
+            print(f"{name:14} {per_row:10.1f} {per_row * rows / 2 ** 20:8.1f}MB {loaded:8.2f}s {daily:8.2f}s")
+    finally:
+        os.remove(path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+"""Times generate_summary_parallel on one large file with 1, 2, 4 and 8 workers.
+
+The single-process loaders are timed first for reference: the default csv
+loader and the fast (mmap) loader, each followed by generate_summary.
+Speedups are relative to the default loader; the worker processes are
+started inside the timed call, like a caller would.
+
+Run from the repository root with: python benchmarks/bench_parallel_summary.py [--rows N]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import weather  # noqa: E402
+from generate_data import generate_csv  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=lambda text: int(float(text)), default=2000000, help="rows in the generated file")
+    parser.add_argument("--workers", type=lambda text: [int(part) for part in text.split(",")], default=[1, 2, 4, 8],
+                        help="comma separated worker counts")
+    arguments = parser.parse_args()
+
+    handle, path = tempfile.mkstemp(suffix=".csv")
+    os.close(handle)
+    try:
+        generate_csv(path, arguments.rows)
+        print(f"{arguments.rows} rows, {os.path.getsize(path) / 2 ** 20:.0f} MB, {os.cpu_count()} cpus")
+        cases = [
+            ("csv loader", lambda: weather.generate_summary(weather.iter_data_from_csv(path))),
+            ("fast loader", lambda: weather.generate_summary(weather.load_data_from_csv(path, fast=True))),
+        ]
+        for workers in arguments.workers:
+            cases.append((f"{workers} workers", lambda workers=workers: weather.generate_summary_parallel(path, workers)))
+        expected = None
+        baseline = None
+        for name, function in cases:
+            started = time.perf_counter()
+            summary = function()
+            elapsed = time.perf_counter() - started
+            expected = expected or summary
+            baseline = baseline or elapsed
+            same = "same" if summary == expected else "DIFFERENT"
+            print(f"{name:12} {elapsed:7.2f} s  {arguments.rows / elapsed:10.0f} rows/s  speedup {baseline / elapsed:5.2f}x  {same}")
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
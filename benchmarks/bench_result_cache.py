@@ -0,0 +1,71 @@
+"""Times ResultCache: computing a summary, hashing the input, and the memory and disk hits.
+
+A generated file is summarised without a cache, then through a ResultCache
+with a directory: the first call is a miss, the second a memory hit, and a
+new ResultCache on the same directory (as another worker process would
+have) gets a disk hit. Hashing the file is the cost every lookup pays.
+
+Run from the repository root with: python benchmarks/bench_result_cache.py [--rows N]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import weather  # noqa: E402
+from generate_data import generate_csv  # noqa: E402
+
+
+def best_time(function, repeat):
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - started)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=lambda text: int(float(text)), default=200000, help="rows in the generated file")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case, the fastest is shown")
+    arguments = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    try:
+        path = generate_csv(os.path.join(directory, "data.csv"), arguments.rows)
+        cache_dir = os.path.join(directory, "cache")
+        print(f"{arguments.rows} rows, {os.path.getsize(path) / 2 ** 20:.1f} MB, fastest of {arguments.repeat} runs")
+        for daily in (False, True):
+            name = "daily summary" if daily else "summary"
+            compute = weather.generate_daily_summary if daily else weather.generate_summary
+            uncached = best_time(lambda: compute(weather.iter_data_from_csv(path)), arguments.repeat)
+            hashing = best_time(lambda: weather.ResultCache.key(path, daily), arguments.repeat)
+
+            def miss():
+                shutil.rmtree(cache_dir, ignore_errors=True)
+                weather.ResultCache(directory=cache_dir).summary(path, daily)
+
+            missed = best_time(miss, arguments.repeat)
+            cache = weather.ResultCache(directory=cache_dir)
+            expected = cache.summary(path, daily)
+            if expected != compute(weather.iter_data_from_csv(path)):
+                raise SystemExit(f"the cached {name} differs")
+            memory_hit = best_time(lambda: cache.summary(path, daily), arguments.repeat)
+            disk_hit = best_time(lambda: weather.ResultCache(directory=cache_dir).summary(path, daily), arguments.repeat)
+            print(f"{name}:")
+            print(f"  no cache      {uncached * 1000:9.1f} ms")
+            print(f"  miss          {missed * 1000:9.1f} ms")
+            print(f"  memory hit    {memory_hit * 1000:9.1f} ms  ({uncached / memory_hit:.0f}x)")
+            print(f"  disk hit      {disk_hit * 1000:9.1f} ms  ({uncached / disk_hit:.0f}x)")
+            print(f"  hashing alone {hashing * 1000:9.1f} ms")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
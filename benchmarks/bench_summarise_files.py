@@ -0,0 +1,51 @@
+"""Times summarise_files on many small station files with 1, 2, 4 and 8 workers.
+
+Run from the repository root with: python benchmarks/bench_summarise_files.py [--files N] [--rows N]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import weather  # noqa: E402
+
+
+def write_files(directory, files, rows):
+    start = datetime(2021, 7, 1, 7)
+    for number in range(files):
+        with open(os.path.join(directory, f"station_{number:05d}.csv"), "w") as file:
+            file.write("date,min,max\n")
+            for row in range(rows):
+                moment = (start + timedelta(hours=row)).isoformat()
+                file.write(f"{moment}+08:00,{40 + (number + row) % 30},{60 + (number * row) % 35}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=lambda text: int(float(text)), default=2000, help="number of station files")
+    parser.add_argument("--rows", type=lambda text: int(float(text)), default=240, help="rows in each file")
+    arguments = parser.parse_args()
+    files, rows = arguments.files, arguments.rows
+    directory = tempfile.mkdtemp()
+    try:
+        write_files(directory, files, rows)
+        print(f"{files} files x {rows} rows, {os.cpu_count()} cpus")
+        baseline = None
+        for workers in (1, 2, 4, 8):
+            chunk_size = max(1, files // (workers * 16))
+            started = time.perf_counter()
+            errors = sum(result.error is not None for result in weather.summarise_files(directory, workers=workers, chunk_size=chunk_size))
+            elapsed = time.perf_counter() - started
+            baseline = baseline or elapsed
+            print(f"{workers} workers: {elapsed:7.2f} s  {files / elapsed:9.0f} files/s  speedup {baseline / elapsed:4.2f}x  errors {errors}")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
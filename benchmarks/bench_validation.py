@@ -0,0 +1,95 @@
+"""Compares the exception-free temperature checks with catching ValueError.
+
+calculate_mean used to try float() on every value and catch the ValueError of
+bad ones; now it checks values with _classify_number, which keeps the texts it
+has seen in an LRU cache. load_data_from_csv still tries float() first, which
+is the cheapest on clean rows, and is timed to show it costs what the
+ValueError loader did. Both are timed, alternating, on a generated file where
+30% of the temperature cells are malformed, on a clean one and on texts that
+never repeat. "cold" runs empty the cache first, as in a fresh process.
+load_data_with_report is compared with the old loader too, although it does
+more: it checks every value with _classify_number to give the reason, and
+records every rejected row unless max_rejected is given.
+
+Run from the repository root with: python benchmarks/bench_validation.py [--rows N]
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import weather  # noqa: E402
+from bench_instrumentation import paired, reference_load_data  # noqa: E402
+from generate_data import generate_csv  # noqa: E402
+
+
+def reference_mean(values):
+    numeric_values = []
+    for item in values:
+        try:
+            numeric_values.append(float(item))
+        except ValueError:
+            pass
+    if not numeric_values:
+        return 0.0
+    return sum(numeric_values) / len(numeric_values)
+
+
+def cold(function):
+    def run():
+        weather._classify_number.cache_clear()
+        return function()
+    return run
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=lambda text: int(float(text)), default=20000, help="rows in the generated files")
+    parser.add_argument("--repeat", type=int, default=15, help="rounds per case")
+    arguments = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    try:
+        # each bad row has one bad cell out of two, so 0.6 gives 30% bad cells
+        files = (("30% bad cells", generate_csv(os.path.join(directory, "bad.csv"), arguments.rows, bad_fraction=0.6)),
+                 ("clean", generate_csv(os.path.join(directory, "clean.csv"), arguments.rows, bad_fraction=0.0)))
+        print(f"{arguments.rows} rows, fastest of {arguments.repeat} runs; speedups are median ratios of paired runs")
+        print(f"{'case':56} {'ValueError':>11} {'checked':>10} {'speedup':>8}")
+        for label, path in files:
+            with open(path) as file:
+                raw_minimums = [line.split(",")[1] for line in file.read().splitlines()[1:] if line.count(",") == 2]
+            cases = (
+                ("load_data_from_csv", lambda: reference_load_data(path), lambda: weather.load_data_from_csv(path)),
+                ("load_data_with_report", lambda: reference_load_data(path),
+                 lambda: weather.load_data_with_report(path)),
+                ("load_data_with_report, max_rejected=100", lambda: reference_load_data(path),
+                 lambda: weather.load_data_with_report(path, max_rejected=100)),
+                ("calculate_mean[raw strings]", lambda: reference_mean(raw_minimums),
+                 lambda: weather.calculate_mean(raw_minimums)),
+                ("calculate_mean[raw strings], cold", lambda: reference_mean(raw_minimums),
+                 cold(lambda: weather.calculate_mean(raw_minimums))),
+            )
+            for name, reference, checked in cases:
+                reference()
+                checked()
+                (before, after), (ratio,) = paired((reference, checked), arguments.repeat)
+                print(f"{name + ' (' + label + ')':56} {before * 1000:9.2f}ms {after * 1000:8.2f}ms {1 / ratio:7.2f}x")
+        # texts that are all different miss the cache every time; the "N/A" at
+        # the end makes calculate_mean check them one by one
+        distinct = [f"{number / 1000:.3f}" for number in range(-arguments.rows * 5, 0)]
+        for name, values in (("calculate_mean[distinct texts]", distinct),
+                             ("calculate_mean[distinct texts, one bad]", distinct + ["N/A"])):
+            checked = cold(lambda values=values: weather.calculate_mean(values))
+            (before, after), (ratio,) = paired((lambda values=values: reference_mean(values), checked), arguments.repeat)
+            print(f"{name:56} {before * 1000:9.2f}ms {after * 1000:8.2f}ms {1 / ratio:7.2f}x")
+    finally:
+        for name in os.listdir(directory):
+            os.remove(os.path.join(directory, name))
+        os.rmdir(directory)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
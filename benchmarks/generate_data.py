@@ -0,0 +1,70 @@
+"""Deterministic generator of weather csv files for the benchmarks.
+
+The files use the "date,min,max" layout of tests/data, with hourly readings
+spread over several UTC offsets and a configurable share of malformed rows
+(non-numeric or missing temperatures) and blank lines.
+
+Run from the repository root with: python benchmarks/generate_data.py ROWS PATH [--seed N]
+"""
+import argparse
+import random
+from datetime import datetime, timedelta, timezone
+
+# Offsets the generated timestamps are written in, "Z" included.
+OFFSETS = (timedelta(hours=8), timedelta(hours=-5), timedelta(0), timedelta(hours=5, minutes=30), timedelta(hours=-9, minutes=-30))
+
+BAD_VALUES = ("N/A", "", "abc", "--", "nan?")
+
+
+def format_moment(moment):
+    text = moment.isoformat()
+    return text[:-6] + "Z" if text.endswith("+00:00") else text
+
+
+def generate_rows(rows, seed=0, bad_fraction=0.01, blank_fraction=0.01):
+    """Yields the lines of a generated csv file, header first.
+
+    Args:
+        rows: the number of data rows (blank lines are not counted).
+        seed: the random seed; the same arguments always give the same lines.
+        bad_fraction: the share of rows with a malformed temperature.
+        blank_fraction: the share of rows followed by a blank line.
+    """
+    generator = random.Random(seed)
+    start = datetime(2015, 1, 1, tzinfo=timezone.utc)
+    yield "date,min,max\n"
+    for row in range(rows):
+        offset = OFFSETS[row % len(OFFSETS)]
+        moment = (start + timedelta(hours=row)).astimezone(timezone(offset))
+        low = round(generator.gauss(50, 15), generator.choice((0, 1, 1, 2)))
+        high = round(low + abs(generator.gauss(12, 5)), 1)
+        if generator.random() < bad_fraction:
+            if generator.random() < 0.5:
+                low = generator.choice(BAD_VALUES)
+            else:
+                high = generator.choice(BAD_VALUES)
+        yield f"{format_moment(moment)},{low},{high}\n"
+        if generator.random() < blank_fraction:
+            yield "\n"
+
+
+def generate_csv(path, rows, seed=0, bad_fraction=0.01, blank_fraction=0.01):
+    """Writes a generated csv file, see generate_rows for the arguments."""
+    with open(path, "w", newline="") as file:
+        file.writelines(generate_rows(rows, seed, bad_fraction, blank_fraction))
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a deterministic weather csv file.")
+    parser.add_argument("rows", type=lambda text: int(float(text)), help="number of rows, e.g. 1e6")
+    parser.add_argument("path")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--bad-fraction", type=float, default=0.01)
+    parser.add_argument("--blank-fraction", type=float, default=0.01)
+    arguments = parser.parse_args()
+    generate_csv(arguments.path, arguments.rows, arguments.seed, arguments.bad_fraction, arguments.blank_fraction)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Load test for "python -m weather serve".
+
+Starts a local service on generated csv files (or uses --url), sends requests
+from --concurrency keep-alive connections and reports the p50/p99 latency and
+requests per second, plus the service's cache counters.
+
+Run from the repository root with: python benchmarks/load_test.py [--requests N] [--concurrency C]
+"""
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from generate_data import generate_csv  # noqa: E402
+
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def start_service(root, ttl, workers):
+    """Starts "python -m weather serve" on a free port and returns (process, url)."""
+    command = [sys.executable, "-m", "weather", "serve", root, "--port", "0", "--ttl", str(ttl)]
+    if workers:
+        command += ["--workers", str(workers)]
+    process = subprocess.Popen(command, cwd=REPOSITORY, stderr=subprocess.PIPE, text=True)
+    line = process.stderr.readline()
+    if " on " not in line:
+        process.kill()
+        raise RuntimeError(f"the service didn't start: {line}{process.stderr.read()}")
+    return process, line.rsplit(" on ", 1)[1].strip()
+
+
+async def fetch(reader, writer, host, target):
+    """Sends one GET on a keep-alive connection and returns (status, body)."""
+    writer.write(f"GET {target} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode("latin-1"))
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        name, _, value = line.partition(b":")
+        if name.lower() == b"content-length":
+            length = int(value)
+    return status, await reader.readexactly(length)
+
+
+async def run_load(url, targets, requests, concurrency):
+    """Sends the requests and returns (latencies in seconds, errors, elapsed seconds)."""
+    address = urlsplit(url)
+    latencies = []
+    errors = 0
+    sent = 0
+
+    async def client():
+        nonlocal errors, sent
+        reader, writer = await asyncio.open_connection(address.hostname, address.port)
+        try:
+            while sent < requests:
+                target = targets[sent % len(targets)]
+                sent += 1
+                started = time.perf_counter()
+                status, _ = await fetch(reader, writer, address.netloc, target)
+                latencies.append(time.perf_counter() - started)
+                errors += status != 200
+        finally:
+            writer.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - started
+
+
+async def fetch_stats(url):
+    address = urlsplit(url)
+    reader, writer = await asyncio.open_connection(address.hostname, address.port)
+    try:
+        return json.loads((await fetch(reader, writer, address.netloc, "/stats"))[1])
+    finally:
+        writer.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="an already running service; by default one is started on generated files")
+    parser.add_argument("--paths", nargs="+", help="files to request from --url (relative to its root)")
+    parser.add_argument("--files", type=int, default=8, help="number of generated files")
+    parser.add_argument("--rows", type=lambda text: int(float(text)), default=10000, help="rows per generated file")
+    parser.add_argument("--requests", type=int, default=2000, help="total number of requests")
+    parser.add_argument("--concurrency", type=int, default=32, help="number of concurrent connections")
+    parser.add_argument("--daily", action="store_true", help="request daily summaries instead of overviews")
+    parser.add_argument("--ttl", type=float, default=60.0, help="cache ttl of the started service (0 turns caching off)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes of the started service")
+    arguments = parser.parse_args()
+
+    root = process = None
+    url = arguments.url
+    paths = arguments.paths
+    try:
+        if url is None:
+            root = tempfile.mkdtemp(prefix="weather-load-")
+            paths = [f"station_{number:03}.csv" for number in range(arguments.files)]
+            for number, name in enumerate(paths):
+                generate_csv(os.path.join(root, name), arguments.rows, seed=number)
+            process, url = start_service(root, arguments.ttl, arguments.workers)
+        elif not paths:
+            parser.error("--paths is required with --url")
+        route = "/daily" if arguments.daily else "/summary"
+        targets = [f"{route}?path={path}" for path in paths]
+
+        latencies, errors, elapsed = asyncio.run(run_load(url, targets, arguments.requests, arguments.concurrency))
+        cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+        print(f"{len(latencies)} requests over {len(targets)} files, {arguments.concurrency} connections, {errors} errors")
+        print(f"throughput: {len(latencies) / elapsed:10.1f} requests/s")
+        print(f"latency p50: {cuts[49] * 1000:9.2f} ms")
+        print(f"latency p99: {cuts[98] * 1000:9.2f} ms")
+        print(f"latency max: {max(latencies) * 1000:9.2f} ms")
+        print(f"service: {asyncio.run(fetch_stats(url))}")
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+        if root is not None:
+            shutil.rmtree(root)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+"""Benchmark suite for the public functions of weather.py.
+
+For each size, a deterministic csv file is generated (see generate_data.py)
+and every case is timed on it. The best of --repeat runs gives the
+throughput, and one more run under tracemalloc gives the peak memory.
+Results can be written as JSON and compared against a stored baseline.
+
+Run from the repository root, e.g.:
+
+    python benchmarks/run.py --sizes 1e3,1e4,1e5 --output results.json
+    python benchmarks/run.py --baseline benchmarks/baseline.json
+    python benchmarks/run.py --sizes 1e3,1e4 --save-baseline benchmarks/baseline.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import weather  # noqa: E402
+from generate_data import generate_csv  # noqa: E402
+
+
+def build_cases(path):
+    """Returns (name, function) pairs for every benchmarked call on one data file."""
+    rows = weather.load_data_from_csv(path)
+    series = weather.load_data_from_csv(path, as_series=True)
+    dates = [row[0] for row in rows]
+    minimums = [row[1] for row in rows]
+    with open(path) as file:
+        # the raw text of the min column, malformed values included
+        raw_minimums = [line.split(",")[1] for line in file.read().splitlines()[1:] if line.count(",") == 2]
+
+    def convert_dates_cold():
+        weather.convert_date.cache_clear()
+        for date in dates:
+            weather.convert_date(date)
+
+    def convert_dates_warm():
+        for date in dates:
+            weather.convert_date(date)
+
+    range_index = weather.RangeIndex(series)
+    query_generator = random.Random(0)
+    queries = [sorted(query_generator.sample(range(len(series)), 2)) for _ in range(1000)] if len(series) > 1 else []
+    bounds = [(series.timestamps[first], series.timestamps[last]) for first, last in queries]
+
+    def range_queries():
+        for start, end in bounds:
+            range_index.summary_for_range(start, end)
+
+    def convert_temperatures():
+        for value in minimums:
+            weather.convert_f_to_c(value)
+
+    def mean_on_python_backend():
+        # the pure Python path, to compare calculate_mean[column] on the auto backend with
+        previous = weather._BACKEND
+        weather.set_backend("python")
+        try:
+            weather.calculate_mean(series.minimums)
+        finally:
+            weather.set_backend(previous)
+
+    return [
+        ("load_data_from_csv", lambda: weather.load_data_from_csv(path)),
+        ("load_data_from_csv[fast]", lambda: weather.load_data_from_csv(path, fast=True)),
+        ("load_data_from_csv[fast,series]", lambda: weather.load_data_from_csv(path, fast=True, as_series=True)),
+        ("convert_date[cold cache]", convert_dates_cold),
+        ("convert_date[warm cache]", convert_dates_warm),
+        ("convert_f_to_c", convert_temperatures),
+        ("calculate_mean[raw strings]", lambda: weather.calculate_mean(raw_minimums)),
+        ("calculate_mean[column]", lambda: weather.calculate_mean(series.minimums)),
+        ("calculate_mean[column,python]", mean_on_python_backend),
+        ("find_min[list]", lambda: weather.find_min(minimums)),
+        ("find_min[series]", lambda: weather.find_min(series)),
+        ("find_max[series]", lambda: weather.find_max(series)),
+        ("generate_summary[list]", lambda: weather.generate_summary(rows)),
+        ("generate_summary[series]", lambda: weather.generate_summary(series)),
+        ("generate_daily_summary[list]", lambda: weather.generate_daily_summary(rows)),
+        ("rolling_summaries[window=7]", lambda: consume(weather.rolling_summaries(series, 7))),
+        ("rolling_summaries[window=365]", lambda: consume(weather.rolling_summaries(series, 365))),
+        ("calendar_summaries[week]", lambda: consume(weather.calendar_summaries(series, "week"))),
+        ("quantiles[list]", lambda: weather.quantiles(minimums)),
+        ("quantiles[column]", lambda: weather.quantiles(series.minimums)),
+        ("QuantileSketch[update]", lambda: weather.QuantileSketch().update(series.minimums).quantiles()),
+        ("hottest_days[k=10]", lambda: weather.hottest_days(series, 10)),
+        ("RangeIndex[build]", lambda: weather.RangeIndex(series)),
+        ("summary_for_range[1000 queries]", range_queries),
+        ("calendar_summaries[month]", lambda: consume(weather.calendar_summaries(series, "month"))),
+    ]
+
+
+def consume(iterator):
+    for _ in iterator:
+        pass
+
+
+def measure(function, repeat):
+    """Returns the best time in seconds and the peak traced memory in bytes."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    tracemalloc.start()
+    try:
+        function()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def run(sizes, repeat, seed, only, data_dir):
+    results = []
+    for rows in sizes:
+        path = os.path.join(data_dir, f"weather_{rows}_{seed}.csv")
+        if not os.path.exists(path):
+            generate_csv(path, rows, seed)
+        for name, function in build_cases(path):
+            if only and not any(part in name for part in only):
+                continue
+            seconds, peak = measure(function, repeat)
+            results.append({"name": name, "rows": rows, "seconds": seconds,
+                            "rows_per_second": rows / seconds if seconds else None, "peak_bytes": peak})
+            print(f"{rows:>9} {name:<34} {seconds * 1000:10.2f} ms {rows / seconds:14,.0f} rows/s {peak / 1e6:9.2f} MB", flush=True)
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Prints the change against the baseline and returns the number of regressions.
+
+    Cases the baseline has no entry for are listed too, so a stale baseline
+    doesn't hide them; they don't count as regressions.
+    """
+    previous = {(entry["name"], entry["rows"]): entry for entry in baseline["results"]}
+    regressions = 0
+    missing = 0
+    print(f"\ncompared with baseline ({baseline.get('python', '?')}, tolerance {tolerance:.0%}):")
+    for entry in results:
+        old = previous.get((entry["name"], entry["rows"]))
+        if old is None:
+            missing += 1
+            print(f"{entry['rows']:>9} {entry['name']:<34}   no baseline entry")
+            continue
+        ratio = entry["seconds"] / old["seconds"]
+        flag = ""
+        if ratio > 1 + tolerance:
+            regressions += 1
+            flag = "  REGRESSION"
+        print(f"{entry['rows']:>9} {entry['name']:<34} {ratio:6.2f}x time{flag}")
+    if missing:
+        print(f"{missing} case(s) have no baseline entry; record them with --save-baseline")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the public functions of weather.py.")
+    parser.add_argument("--sizes", default="1e3,1e4,1e5", help="comma separated row counts, up to 1e7")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", action="append", help="only run cases whose name contains this text")
+    parser.add_argument("--data-dir", help="keep the generated csv files here instead of a temporary directory")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against this JSON file and exit with 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown against the baseline")
+    parser.add_argument("--save-baseline", help="write the results as a new baseline file")
+    arguments = parser.parse_args()
+
+    sizes = [int(float(size)) for size in arguments.sizes.split(",")]
+    with tempfile.TemporaryDirectory() as temporary:
+        data_dir = arguments.data_dir or temporary
+        os.makedirs(data_dir, exist_ok=True)
+        results = run(sizes, arguments.repeat, arguments.seed, arguments.only, data_dir)
+
+    report = {"python": platform.python_version(), "platform": platform.platform(), "results": results}
+    for path in (arguments.output, arguments.save_baseline):
+        if path:
+            with open(path, "w") as file:
+                json.dump(report, file, indent=2)
+                file.write("\n")
+    if arguments.baseline:
+        with open(arguments.baseline) as file:
+            baseline = json.load(file)
+        return 1 if compare(results, baseline, arguments.tolerance) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
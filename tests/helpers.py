@@ -0,0 +1,24 @@
+"""Helpers shared by the test modules."""
+import os
+import tempfile
+
+
+def write_csv(testcase, text):
+    """Writes text to a new .csv file that is removed when the test ends.
+
+    Args:
+        testcase: The unittest.TestCase to register the cleanup with.
+        text: The file content, written exactly as given (str or bytes).
+
+    Returns:
+        The path of the file.
+    """
+    handle, path = tempfile.mkstemp(suffix=".csv")
+    if isinstance(text, bytes):
+        file = os.fdopen(handle, "wb")
+    else:
+        file = os.fdopen(handle, "w", newline="")
+    with file:
+        file.write(text)
+    testcase.addCleanup(os.remove, path)
+    return path
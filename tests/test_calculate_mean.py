@@ -1,3 +1,4 @@
+import math
 import unittest
 import weather
 
@@ -31,3 +32,39 @@ class CalculateMeanTests(unittest.TestCase):
         expected_result = -52.5
         result = weather.calculate_mean(temperatures)
         self.assertEqual(result, expected_result)
+
+    def test_calculate_mean_skips_what_float_refuses(self):
+        temperatures = ["N/A", "", " ", "1_0", " 20 ", "\t-5e1\n", "+.5", "5.", ".", "1__0", "_1", "1e",
+                        "0x10", "1,5", "١٢", "２", "\x1c5", " 5", "--5", "²",
+                        "-", "1.2.3", "12a3", "-.25"]
+        # what a float() loop that catches ValueError keeps
+        kept = []
+        for text in temperatures:
+            try:
+                kept.append(float(text))
+            except ValueError:
+                pass
+        self.assertEqual(kept, [10.0, 20.0, -50.0, 0.5, 5.0, 12.0, 2.0, 5.0, -0.25])
+        self.assertEqual(weather.calculate_mean(temperatures), sum(kept) / len(kept))
+        self.assertEqual(weather.calculate_mean(["inf", "N/A", "1"]), float("inf"))
+        self.assertTrue(math.isnan(weather.calculate_mean(["inf", "-Infinity"])))
+
+    def test_calculate_mean_long_lists(self):
+        # every group of values but one is converted in bulk
+        temperatures = [f"{number / 10}" for number in range(1000)]
+        temperatures[500] = "N/A"
+        kept = [number / 10 for number in range(1000) if number != 500]
+        self.assertEqual(weather.calculate_mean(temperatures), sum(kept) / len(kept))
+        self.assertEqual(weather.calculate_mean(tuple(range(1000))), 499.5)
+
+    def test_number_cache_keeps_recent_texts(self):
+        classify = weather._classify_number
+        classify.cache_clear()
+        for number in range(weather.NUMBER_CACHE_SIZE + 100):
+            classify(str(number))
+        self.assertIs(classify("N/A"), classify("N/A"))
+        self.assertEqual(classify("0"), 0.0)
+        info = classify.cache_info()
+        # the cache is full, but keeps the texts seen last
+        self.assertEqual((info.hits, info.misses - weather.NUMBER_CACHE_SIZE - 100), (1, 2))
+        self.assertEqual(info.currsize, weather.NUMBER_CACHE_SIZE)
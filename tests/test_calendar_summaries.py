@@ -0,0 +1,45 @@
+import unittest
+from datetime import date, timedelta
+import weather
+
+
+class CalendarSummariesTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+        self.example_one = weather.load_data_from_csv("tests/data/example_one.csv")
+
+    def test_weeks(self):
+        rows = self.example_one
+        # Friday 02 to Sunday 04 July 2021, then Monday 05 and Tuesday 06
+        self.assertEqual(list(weather.calendar_summaries(rows)), [
+            weather.PeriodSummary("2021-W26", rows[0][0], rows[2][0], weather.generate_summary(rows[:3])),
+            weather.PeriodSummary("2021-W27", rows[3][0], rows[4][0], weather.generate_summary(rows[3:])),
+        ])
+
+    def test_months_and_iso_years(self):
+        start = date(2020, 12, 20)
+        rows = [[(start + timedelta(days=day)).isoformat() + "T07:00:00-05:00", 30 + day % 7, 40 + day % 5]
+                for day in range(60)]
+        months = list(weather.calendar_summaries(rows, "month"))
+        self.assertEqual([month.period for month in months], ["2020-12", "2021-01", "2021-02"])
+        self.assertEqual(months[1].summary, weather.generate_summary(rows[12:43]))
+        self.assertEqual((months[1].first_date, months[1].last_date), (rows[12][0], rows[42][0]))
+        weeks = list(weather.calendar_summaries(rows, "week"))
+        # 01-03 January 2021 belong to the last ISO week of 2020
+        self.assertEqual([week.period for week in weeks[:3]], ["2020-W51", "2020-W52", "2020-W53"])
+        self.assertEqual(weeks[2].summary, weather.generate_summary(rows[8:15]))
+
+    def test_local_date_decides_the_bucket(self):
+        rows = [["2021-07-31T23:00:00+08:00", 10, 20], ["2021-08-01T01:00:00+08:00", 11, 21]]
+        self.assertEqual([month.period for month in weather.calendar_summaries(rows, "month")], ["2021-07", "2021-08"])
+
+    def test_series_and_empty_input(self):
+        series = weather.load_data_from_csv("tests/data/example_one.csv", as_series=True)
+        self.assertEqual(list(weather.calendar_summaries(series)), list(weather.calendar_summaries(self.example_one)))
+        self.assertEqual(list(weather.calendar_summaries([], "month")), [])
+
+    def test_unknown_period(self):
+        with self.assertRaises(ValueError):
+            list(weather.calendar_summaries(self.example_one, "year"))
@@ -0,0 +1,24 @@
+import unittest
+import weather
+
+
+class ColdestDaysTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def test_coldest_days(self):
+        rows = weather.load_data_from_csv("tests/data/example_two.csv")
+        self.assertEqual(weather.coldest_days(rows, 4), [
+            (47.0, 0, "2020-06-19T07:00:00+08:00"),
+            (48.0, 6, "2020-06-25T07:00:00+08:00"),
+            (51.0, 1, "2020-06-20T07:00:00+08:00"),
+            (52.0, 5, "2020-06-24T07:00:00+08:00"),
+        ])
+
+    def test_coldest_days_series(self):
+        series = weather.load_data_from_csv("tests/data/example_three.csv", as_series=True)
+        coldest = weather.coldest_days(series, 1)[0]
+        self.assertEqual((coldest.temperature, coldest.index), weather.find_min(series))
+        self.assertEqual(coldest.date, series.dates[coldest.index])
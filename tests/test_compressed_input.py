@@ -0,0 +1,105 @@
+import bz2
+import gzip
+import lzma
+import os
+import random
+import shutil
+import tempfile
+import unittest
+import weather
+from tests.helpers import write_csv
+
+COMPRESSORS = {"gzip": gzip.compress, "bz2": bz2.compress, "xz": lzma.compress}
+
+
+class CompressedInputTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def compressed_copies(self, path):
+        """Writes a compressed copy of a file per format, named without a telling suffix."""
+        with open(path, "rb") as file:
+            data = file.read()
+        copies = {}
+        for name, compress in COMPRESSORS.items():
+            copy = os.path.join(self.directory, f"{name}_{os.path.basename(path)}")
+            with open(copy, "wb") as file:
+                file.write(compress(data))
+            copies[name] = copy
+        return copies
+
+    def test_loaders(self):
+        for name in ("example_one", "example_two", "example_three"):
+            path = f"tests/data/{name}.csv"
+            expected = weather.load_data_from_csv(path)
+            for copy in self.compressed_copies(path).values():
+                self.assertListEqual(weather.load_data_from_csv(copy), expected)
+                self.assertListEqual(weather.load_data_from_csv(copy, fast=True), expected)
+                self.assertListEqual(list(weather.load_data_from_csv(copy, as_series=True, fast=True)), expected)
+                self.assertListEqual([list(reading[:3]) for reading in weather.load_data_from_csv(copy, as_readings=True)],
+                                     expected)
+                self.assertListEqual(weather.load_data_with_report(copy)[0], expected)
+
+    def test_streaming(self):
+        path = "tests/data/example_two.csv"
+        for copy in self.compressed_copies(path).values():
+            self.assertListEqual(list(weather.iter_data_from_csv(copy, chunk_size=3)),
+                                 list(weather.iter_data_from_csv(path, chunk_size=3)))
+            self.assertEqual(weather.generate_daily_summary(weather.iter_data_from_csv(copy)),
+                             weather.generate_daily_summary(weather.iter_data_from_csv(path)))
+            self.assertEqual(weather.generate_summary_parallel(copy, workers=1),
+                             weather.generate_summary(weather.iter_data_from_csv(path)))
+        path = "tests/data/example_stations.csv"
+        for copy in self.compressed_copies(path).values():
+            self.assertListEqual(list(weather.iter_station_data(copy)), list(weather.iter_station_data(path)))
+
+    def test_fast_block_borders(self):
+        generator = random.Random(3)
+        lines = ["date,min,max"]
+        for hour in range(2000):
+            low = round(generator.gauss(50, 15), 1)
+            lines.append(f"2021-01-01T{hour % 24:02}:00:00+08:00,{'N/A' if hour % 97 == 0 else low},{low + 9}")
+            if hour % 50 == 0:
+                lines.append("")
+        path = write_csv(self, "\r\n".join(lines))
+        expected = weather.load_data_from_csv(path)
+        original = weather.DECOMPRESS_BUFFER_SIZE
+        self.addCleanup(setattr, weather, "DECOMPRESS_BUFFER_SIZE", original)
+        for size in (7, 100, 4096):
+            weather.DECOMPRESS_BUFFER_SIZE = size
+            for copy in self.compressed_copies(path).values():
+                self.assertListEqual(weather.load_data_from_csv(copy, fast=True), expected)
+
+    def test_fast_falls_back_for_quotes(self):
+        path = write_csv(self, 'date,min,max\n2021-07-02T07:00:00+08:00,49,67\n"2021-07-03T07:00:00+08:00",57,"68"\n')
+        for copy in self.compressed_copies(path).values():
+            self.assertIsNone(weather._load_columns_fast(copy))
+            self.assertListEqual(weather.load_data_from_csv(copy, fast=True), weather.load_data_from_csv(path))
+
+    def test_header_only_and_empty(self):
+        for text in ("date,min,max", "date,min,max\n", ""):
+            path = write_csv(self, text)
+            for copy in self.compressed_copies(path).values():
+                self.assertListEqual(weather.load_data_from_csv(copy), [])
+                self.assertListEqual(weather.load_data_from_csv(copy, fast=True), [])
+
+    def test_directory_includes_compressed_files(self):
+        shutil.copy("tests/data/example_one.csv", self.directory)
+        for name, suffix, compress in (("example_two", ".gz", gzip.compress), ("example_three", ".xz", lzma.compress)):
+            with open(f"tests/data/{name}.csv", "rb") as source, open(os.path.join(self.directory, name + ".csv" + suffix), "wb") as file:
+                file.write(compress(source.read()))
+        for name in ("notes.txt", "example_one.csv.wscache"):
+            with open(os.path.join(self.directory, name), "w") as file:
+                file.write("not a csv file\n")
+        results = list(weather.summarise_files(self.directory, workers=1))
+        self.assertEqual([os.path.basename(result.path) for result in results],
+                         ["example_one.csv", "example_three.csv.xz", "example_two.csv.gz"])
+        for result in results:
+            with open(f"tests/expected_output/{os.path.basename(result.path).split('.')[0]}_summary.txt", encoding="utf8") as txt_file:
+                self.assertEqual(txt_file.read(), result.summary)
@@ -46,3 +46,22 @@ class ConvertDateTests(unittest.TestCase):
         expected_result = "Sunday 31 October 2021"
         result = weather.convert_date(date)
         self.assertEqual(result, expected_result)
+
+    def test_convert_date_other_shapes(self):
+        self.assertEqual(weather.convert_date("2021-07-06"), "Tuesday 06 July 2021")
+        self.assertEqual(weather.convert_date("2021-07-06T07:00:00"), "Tuesday 06 July 2021")
+        self.assertEqual(weather.convert_date("2021-07-06T23:30:00-05:30"), "Tuesday 06 July 2021")
+        self.assertEqual(weather.convert_date("2021-07-06T07:00:00.500+08:00"), "Tuesday 06 July 2021")
+
+    def test_convert_date_invalid(self):
+        for date in ("2021-02-30T07:00:00+08:00", "2021-07-06T24:00:00+08:00", "2021-07-06T07:00:00+24:00", "not a date"):
+            with self.assertRaises(ValueError):
+                weather.convert_date(date)
+
+    def test_convert_date_cache(self):
+        weather.convert_date.cache_clear()
+        weather.convert_date("2021-07-05T07:00:00+08:00")
+        weather.convert_date("2021-07-05T07:00:00+08:00")
+        weather.convert_date("2021-07-06T07:00:00+08:00")
+        info = weather.convert_date.cache_info()
+        self.assertEqual((info.hits, info.misses, info.maxsize), (1, 2, weather.DATE_CACHE_SIZE))
@@ -31,3 +31,16 @@ class ConvertTempTests(unittest.TestCase):
         expected_result = 25.0
         result = weather.convert_f_to_c(temp_in_f)
         self.assertEqual(result, expected_result)
+
+    def test_convert_f_to_c_table_matches_formula(self):
+        for tenths in range(-1010, 1511):
+            temp_in_f = tenths / 10
+            expected_result = round((temp_in_f - 32) * 5 / 9, 1)
+            result = weather.convert_f_to_c(temp_in_f)
+            self.assertEqual(repr(result), repr(expected_result))
+
+    def test_convert_f_to_c_out_of_table(self):
+        for temp_in_f in (-459.67, 1000, 64.45, 0.123):
+            expected_result = round((temp_in_f - 32) * 5 / 9, 1)
+            result = weather.convert_f_to_c(temp_in_f)
+            self.assertEqual(result, expected_result)
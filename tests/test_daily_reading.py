@@ -0,0 +1,89 @@
+import copy
+import math
+import pickle
+import unittest
+from datetime import datetime, timedelta, timezone
+import weather
+
+
+class DailyReadingTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def test_fields(self):
+        reading = weather.DailyReading("2021-07-02T07:00:00+08:00", "49", 67)
+        self.assertEqual(reading.date, "2021-07-02T07:00:00+08:00")
+        self.assertEqual(reading.min_f, 49.0)
+        self.assertEqual(reading.max_f, 67.0)
+        self.assertEqual(reading.moment, datetime(2021, 7, 2, 7, tzinfo=timezone(timedelta(hours=8))))
+        self.assertEqual(reading[:3], ("2021-07-02T07:00:00+08:00", 49.0, 67.0))
+        self.assertEqual(reading.min_c, 9.4)
+        self.assertEqual(reading.max_c, 19.4)
+        self.assertEqual(reading.day, "Friday 02 July 2021")
+
+    def test_immutable(self):
+        reading = weather.DailyReading("2021-07-02T07:00:00+08:00", 49, 67)
+        with self.assertRaises(AttributeError):
+            reading.min_f = 50
+        with self.assertRaises(AttributeError):
+            reading.extra = 1
+        with self.assertRaises(TypeError):
+            reading[1] = 50
+
+    def test_shared_timezones(self):
+        first = weather.DailyReading("2021-07-02T07:00:00+08:00", 49, 67)
+        second = weather.DailyReading("2021-07-03T07:00:00+08:00", 57, 68)
+        self.assertIs(first.moment.tzinfo, second.moment.tzinfo)
+
+    def test_unparsed_date(self):
+        reading = weather.DailyReading("yesterday", 49, 67)
+        self.assertIsNone(reading.moment)
+        with self.assertRaises(ValueError):
+            reading.day
+        self.assertTrue(math.isnan(weather.WeatherSeries([reading]).timestamps[0]))
+
+    def test_bad_temperature(self):
+        with self.assertRaises(ValueError):
+            weather.DailyReading("2021-07-02T07:00:00+08:00", "N/A", 67)
+
+    def test_pickle_copy_and_replace(self):
+        for reading in (weather.DailyReading("2021-07-02T07:00:00+08:00", 49, 67), weather.DailyReading("yesterday", 49, 67)):
+            copies = [copy.copy(reading), copy.deepcopy(reading)]
+            copies += [pickle.loads(pickle.dumps(reading, protocol)) for protocol in range(pickle.HIGHEST_PROTOCOL + 1)]
+            for result in copies:
+                self.assertIs(type(result), weather.DailyReading)
+                self.assertEqual(result, reading)
+        reading = weather.DailyReading("2021-07-02T07:00:00+08:00", 49, 67)
+        moved = reading._replace(date="2021-07-03T07:00:00Z", max_f="70")
+        self.assertEqual(moved, ("2021-07-03T07:00:00Z", 49.0, 70.0, datetime(2021, 7, 3, 7, tzinfo=timezone.utc)))
+        self.assertEqual(moved.day, "Saturday 03 July 2021")
+        with self.assertRaises(ValueError):
+            reading._replace(moment=None)
+
+    def test_load_readings(self):
+        for name in ("example_one", "example_two", "example_three"):
+            path = f"tests/data/{name}.csv"
+            rows = weather.load_data_from_csv(path)
+            for fast in (False, True):
+                readings = weather.load_data_from_csv(path, fast=fast, as_readings=True)
+                self.assertTrue(all(type(reading) is weather.DailyReading for reading in readings))
+                self.assertListEqual([list(reading[:3]) for reading in readings], rows)
+        with self.assertRaises(ValueError):
+            weather.load_data_from_csv("tests/data/example_one.csv", as_series=True, as_readings=True)
+
+    def test_functions_accept_readings(self):
+        rows = weather.load_data_from_csv("tests/data/example_two.csv")
+        readings = weather.load_data_from_csv("tests/data/example_two.csv", as_readings=True)
+        self.assertEqual(weather.generate_summary(readings), weather.generate_summary(rows))
+        self.assertEqual(weather.generate_daily_summary(readings), weather.generate_daily_summary(rows))
+        self.assertListEqual(list(weather.calendar_summaries(readings, "week")),
+                             list(weather.calendar_summaries(rows, "week")))
+        self.assertListEqual(list(weather.rolling_summaries(readings, 3)), list(weather.rolling_summaries(rows, 3)))
+        self.assertEqual(weather.hottest_days(readings), weather.hottest_days(rows))
+        series = weather.WeatherSeries(readings)
+        expected = weather.WeatherSeries(rows)
+        self.assertListEqual(list(series), rows)
+        self.assertEqual(series.timestamps, expected.timestamps)
+        self.assertEqual(series.utc_offsets, expected.utc_offsets)
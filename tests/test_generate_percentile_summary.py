@@ -0,0 +1,32 @@
+import unittest
+import weather
+
+
+class GeneratePercentileSummaryTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def test_percentile_summary(self):
+        with open("tests/expected_output/example_two_percentile_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        rows = weather.load_data_from_csv("tests/data/example_two.csv")
+        self.assertEqual(weather.generate_percentile_summary(rows), expected_result)
+        self.assertEqual(weather.generate_percentile_summary(iter(rows)), expected_result)
+
+    def test_percentile_summary_options(self):
+        rows = weather.load_data_from_csv("tests/data/example_one.csv")
+        self.assertEqual(
+            weather.generate_percentile_summary(rows, [1, 2, 3, 11, 50, 99.9], top=0),
+            "Percentiles (1st, 2nd, 3rd, 11th, 50th, 99.9th)\n"
+            "  Lows: 9.5°C, 9.6°C, 9.7°C, 10.4°C, 12.8°C, 13.9°C\n"
+            "  Highs: 16.1°C, 16.2°C, 16.2°C, 16.4°C, 16.7°C, 20.0°C\n",
+        )
+        self.assertEqual(weather.generate_percentile_summary(rows, [], top=1),
+                         "1 Hottest Days\n  20.0°C on Saturday 03 July 2021\n"
+                         "1 Coldest Days\n  9.4°C on Friday 02 July 2021\n")
+
+    def test_percentile_summary_empty(self):
+        with self.assertRaises(ValueError):
+            weather.generate_percentile_summary([])
@@ -0,0 +1,30 @@
+import unittest
+import weather
+
+
+class GenerateStationSummariesTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def read_expected(self, name):
+        with open(f"tests/expected_output/{name}.txt", encoding="utf8") as txt_file:
+            return txt_file.read()
+
+    def test_station_summaries(self):
+        summaries = weather.generate_station_summaries(weather.iter_station_data("tests/data/example_stations.csv"))
+        self.assertEqual(list(summaries), ["one", "two"])
+        self.assertEqual(summaries["one"], self.read_expected("example_one_summary"))
+        self.assertEqual(summaries["two"], self.read_expected("example_two_summary"))
+
+    def test_group_by_station(self):
+        groups = weather.group_by_station(weather.iter_station_data("tests/data/example_stations.csv"))
+        two = groups["two"]
+        self.assertEqual((groups["one"].count, two.count), (5, 8))
+        self.assertEqual((two.min_value, two.min_date), (47.0, "2020-06-19T07:00:00+08:00"))
+        self.assertEqual((two.max_value, two.max_date), (72.0, "2020-06-21T07:00:00+08:00"))
+        self.assertEqual(two.min_total / two.count, 52.5)
+
+    def test_no_rows(self):
+        self.assertEqual(weather.generate_station_summaries([]), {})
@@ -0,0 +1,69 @@
+import random
+import unittest
+import weather
+from tests.helpers import write_csv
+
+
+class GenerateSummaryParallelTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def assertSameAsSequential(self, path, **options):
+        expected = weather.generate_summary(weather.load_data_from_csv(path))
+        self.assertEqual(weather.generate_summary_parallel(path, workers=2, **options), expected)
+
+    def test_fixtures(self):
+        for name in ("example_one", "example_two", "example_three"):
+            self.assertSameAsSequential(f"tests/data/{name}.csv")
+            # one line per range
+            self.assertSameAsSequential(f"tests/data/{name}.csv", chunk_size=1)
+
+    def test_ties_across_ranges(self):
+        lines = ["date,min,max"]
+        for day in range(1, 29):
+            lines.append(f"2021-02-{day:02}T07:00:00+08:00,{40 if day % 7 == 0 else 50},{70 if day % 5 == 0 else 60}")
+        path = write_csv(self, "\n".join(lines) + "\n")
+        for chunk_size in (1, 40, 100, 1000):
+            self.assertSameAsSequential(path, chunk_size=chunk_size)
+
+    def test_synthetic(self):
+        generator = random.Random(7)
+        lines = ["date,min,max"]
+        for hour in range(3000):
+            low = round(generator.gauss(50, 15), generator.choice((0, 1, 2)))
+            high = low + generator.choice((0, 5, 10.5))
+            if generator.random() < 0.02:
+                low = generator.choice(("N/A", "", "abc"))
+            lines.append(f"2021-01-01T{hour % 24:02}:00:00+08:00,{low},{high}")
+            if generator.random() < 0.01:
+                lines.append("")
+        path = write_csv(self, "\n".join(lines))
+        for chunk_size in (None, 997, 5000):
+            self.assertSameAsSequential(path, chunk_size=chunk_size)
+
+    def test_ranges_start_at_lines(self):
+        path = write_csv(self, "date,min,max\n2021-07-02T07:00:00+08:00,49,67\n2021-07-03T07:00:00+08:00,57,68\n")
+        header = len("date,min,max\n")
+        line = len("2021-07-02T07:00:00+08:00,49,67\n")
+        self.assertEqual(weather._line_ranges(path, 1, 1), [(header, header + line), (header + line, header + 2 * line)])
+        self.assertEqual(weather._line_ranges(path, 1, 10 ** 6), [(header, header + 2 * line)])
+
+    def test_single_pass_files(self):
+        # quoting, carriage returns, NaN and an average on a rounding boundary
+        self.assertSameAsSequential(write_csv(self, 'date,min,max\n"2021-07-02T07:00:00+08:00",49,"67"\n'))
+        self.assertSameAsSequential(write_csv(self, b"date,min,max\r\n2021-07-02T07:00:00+08:00,49,67\r\n"))
+        self.assertSameAsSequential(write_csv(self,
+            "date,min,max\n2021-07-02T07:00:00+08:00,nan,67\n2021-07-03T07:00:00+08:00,49,inf\n"), chunk_size=1)
+        self.assertSameAsSequential(write_csv(self,
+            "date,min,max\n2021-07-02T07:00:00+08:00,32.09,67\n2021-07-03T07:00:00+08:00,32.09,68\n"), chunk_size=1)
+
+    def test_no_readings(self):
+        path = write_csv(self, "date,min,max\n\n")
+        with self.assertRaises(ValueError):
+            weather.generate_summary_parallel(path, workers=1)
+
+    def test_bad_chunk_size(self):
+        with self.assertRaises(ValueError):
+            weather.generate_summary_parallel("tests/data/example_one.csv", chunk_size=0)
@@ -0,0 +1,32 @@
+import random
+import unittest
+import weather
+
+
+class HottestDaysTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def test_hottest_days(self):
+        rows = weather.load_data_from_csv("tests/data/example_two.csv")
+        self.assertEqual(weather.hottest_days(rows, 3), [
+            (72.0, 2, "2020-06-21T07:00:00+08:00"),
+            (71.0, 4, "2020-06-23T07:00:00+08:00"),
+            (71.0, 3, "2020-06-22T07:00:00+08:00"),
+        ])
+        self.assertEqual(weather.hottest_days(rows, 1)[0][:2], weather.find_max([row[2] for row in rows]))
+
+    def test_hottest_days_match_sorting(self):
+        generator = random.Random(8)
+        rows = [[f"day {day}", 0, generator.randint(50, 80)] for day in range(2000)]
+        expected = sorted(((row[2], index, row[0]) for index, row in enumerate(rows)), reverse=True)
+        for k in (1, 5, 100, 2000, 3000):
+            self.assertEqual(weather.hottest_days(iter(rows), k), expected[:k])
+
+    def test_hottest_days_edge_cases(self):
+        self.assertEqual(weather.hottest_days([], 3), [])
+        self.assertEqual(weather.hottest_days([["d", 1, 2]], 0), [])
+        rows = [["a", 0, float("nan")], ["b", 0, 5], ["c", 0, float("nan")]]
+        self.assertEqual(weather.hottest_days(rows, 2), [(5.0, 1, "b")])
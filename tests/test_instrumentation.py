@@ -0,0 +1,111 @@
+import io
+import time
+import unittest
+import weather
+from tests.helpers import write_csv
+
+
+class InstrumentationTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def read_expected(self, name):
+        with open(f"tests/expected_output/{name}.txt", encoding="utf8") as txt_file:
+            return txt_file.read()
+
+    def test_output_is_unchanged(self):
+        with weather.Instrumentation():
+            summary = weather.generate_summary(weather.iter_data_from_csv("tests/data/example_one.csv"))
+            daily = weather.generate_daily_summary(weather.load_data_from_csv("tests/data/example_three.csv", fast=True))
+            series = weather.load_data_from_csv("tests/data/example_two.csv", as_series=True)
+        self.assertEqual(self.read_expected("example_one_summary"), summary)
+        self.assertEqual(self.read_expected("example_three_daily_summary"), daily)
+        self.assertEqual(weather.load_data_from_csv("tests/data/example_two.csv"), list(series))
+
+    def test_counters(self):
+        path = write_csv(self,
+            "date,min,max\n"
+            "2021-07-02T07:00:00+08:00,49,67\n"
+            "\n"
+            "2021-07-03T07:00:00+08:00,N/A,68\n"
+            "2021-07-04T07:00:00+08:00,56,62\n"
+        )
+        for fast in (False, True):
+            with weather.Instrumentation() as stats:
+                rows = weather.load_data_from_csv(path, fast=fast)
+                weather.generate_summary(rows)
+                weather.write_daily_summary(rows, io.StringIO())
+            self.assertEqual(stats.as_dict()["counters"],
+                             {"rows_loaded": 2, "rows_rejected": 1, "rows_summarised": 2, "days_written": 2})
+
+    def test_stage_timers(self):
+        with weather.Instrumentation() as stats:
+            weather.generate_summary(weather.iter_data_from_csv("tests/data/example_two.csv"))
+            weather.generate_daily_summary(weather.load_data_from_csv("tests/data/example_one.csv"))
+        timers = stats.as_dict()["timers_ns"]
+        self.assertEqual(sorted(timers), ["aggregation", "csv_parse", "date_parse", "formatting", "unit_conversion"])
+        for stage, nanoseconds in timers.items():
+            self.assertGreater(nanoseconds, 0, stage)
+
+    def test_disabled_outside_the_block(self):
+        with weather.Instrumentation() as stats:
+            pass
+        weather.generate_summary(weather.load_data_from_csv("tests/data/example_one.csv"))
+        self.assertIsNone(weather._stats)
+        self.assertEqual(set(stats.counters.values()), {0})
+        self.assertEqual(set(stats.timers.values()), {0})
+
+    def test_nested_figures_reach_the_outer_block(self):
+        with weather.Instrumentation() as outer:
+            weather.load_data_from_csv("tests/data/example_one.csv")
+            with weather.Instrumentation() as inner:
+                weather.load_data_from_csv("tests/data/example_two.csv")
+            self.assertIs(weather._stats, outer)
+        self.assertEqual(inner.counters["rows_loaded"], 8)
+        self.assertEqual(outer.counters["rows_loaded"], 13)
+
+    def test_errors_leave_no_stage_running(self):
+        with weather.Instrumentation() as stats:
+            with self.assertRaises(ValueError):
+                weather.generate_summary([])
+            self.assertEqual(stats._stack, [])
+            rows = weather.iter_data_from_csv("tests/data/example_one.csv")
+            next(rows)
+            rows.close()
+            self.assertEqual(stats._stack, [])
+
+    def test_claimed_time_is_taken_out_once(self):
+        stats = weather.Instrumentation()
+        started = time.perf_counter_ns()
+        stats.start("aggregation")
+        time.sleep(0.02)
+        stats.claim(10_000_000)
+        stats.add_time("csv_parse", 10_000_000, claimed=True)
+        stats.stop("aggregation")
+        elapsed = time.perf_counter_ns() - started
+        self.assertEqual(stats.timers["csv_parse"], 10_000_000)
+        self.assertGreaterEqual(stats.timers["aggregation"], 10_000_000)
+        self.assertLessEqual(stats.timers["aggregation"], elapsed - 10_000_000)
+
+    def test_prometheus_text(self):
+        stats = weather.Instrumentation()
+        stats.add_time("csv_parse", 1500000000)
+        stats.count("rows_rejected", 3)
+        text = stats.to_prometheus()
+        self.assertTrue(text.endswith("\n"))
+        lines = text.splitlines()
+        self.assertIn("# TYPE weather_stage_seconds_total counter", lines)
+        self.assertIn('weather_stage_seconds_total{stage="csv_parse"} 1.500000000', lines)
+        self.assertIn("# TYPE weather_rows_rejected_total counter", lines)
+        self.assertIn("weather_rows_rejected_total 3", lines)
+        self.assertIn("custom_rows_loaded_total 0", stats.to_prometheus("custom").splitlines())
+
+    def test_reset(self):
+        with weather.Instrumentation() as stats:
+            weather.load_data_from_csv("tests/data/example_one.csv")
+        stats.reset()
+        self.assertEqual(set(stats.counters.values()), {0})
+        self.assertEqual(set(stats.timers.values()), {0})
+
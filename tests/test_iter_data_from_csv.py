@@ -0,0 +1,63 @@
+import gzip
+import os
+import unittest
+import weather
+from tests.helpers import write_csv
+
+
+class IterCSVTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def test_iter_matches_load(self):
+        for name in ("example_one", "example_two", "example_three"):
+            path = f"tests/data/{name}.csv"
+            result = weather.iter_data_from_csv(path)
+            self.assertNotIsInstance(result, list)
+            self.assertListEqual(list(result), weather.load_data_from_csv(path))
+
+    def test_iter_chunks(self):
+        expected = weather.load_data_from_csv("tests/data/example_two.csv")
+        chunks = list(weather.iter_data_from_csv("tests/data/example_two.csv", chunk_size=3))
+        self.assertEqual([len(chunk) for chunk in chunks], [3, 3, 2])
+        self.assertListEqual([row for chunk in chunks for row in chunk], expected)
+
+    def test_iter_skips_bad_rows(self):
+        path = write_csv(self, "date,min,max\n\n2021-07-02T07:00:00+08:00,N/A,67\n2021-07-03T07:00:00+08:00,57,68\n")
+        self.assertListEqual(list(weather.iter_data_from_csv(path)), [["2021-07-03T07:00:00+08:00", 57.0, 68.0]])
+
+    def test_short_row_with_bad_min_is_skipped(self):
+        # float(row[1]) failed before row[2] was read, so these rows were skipped
+        text = "date,min,max\n2021-07-01T07:00:00+08:00,N/A\n2021-07-03T07:00:00+08:00,57,68\n"
+        expected = [["2021-07-03T07:00:00+08:00", 57.0, 68.0]]
+        path = write_csv(self, text)
+        self.assertListEqual(list(weather.iter_data_from_csv(path)), expected)
+        self.assertListEqual(weather.load_data_from_csv(path), expected)
+        self.assertListEqual(list(weather.load_data_from_csv(path, fast=True)), expected)
+        compressed = path + ".gz"
+        with gzip.open(compressed, "wt") as file:
+            file.write(text)
+        self.addCleanup(os.remove, compressed)
+        self.assertListEqual(list(weather.iter_data_from_csv(compressed)), expected)
+
+    def test_iter_empty_file(self):
+        path = write_csv(self, "")
+        self.assertListEqual(list(weather.iter_data_from_csv(path)), [])
+
+    def test_iter_summaries(self):
+        with open("tests/expected_output/example_two_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        self.assertEqual(expected_result, weather.generate_summary(weather.iter_data_from_csv("tests/data/example_two.csv")))
+
+        with open("tests/expected_output/example_two_daily_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        self.assertEqual(expected_result, weather.generate_daily_summary(weather.iter_data_from_csv("tests/data/example_two.csv")))
+
+    def test_iter_chunks_into_accumulator(self):
+        accumulator = weather.SummaryAccumulator()
+        for chunk in weather.iter_data_from_csv("tests/data/example_three.csv", chunk_size=2):
+            accumulator.update(chunk)
+        data = weather.load_data_from_csv("tests/data/example_three.csv")
+        self.assertEqual(weather.generate_summary(data), accumulator.summary())
@@ -0,0 +1,37 @@
+import unittest
+import weather
+from tests.helpers import write_csv
+
+
+class IterStationDataTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def test_stations_fixture(self):
+        pairs = list(weather.iter_station_data("tests/data/example_stations.csv"))
+        self.assertEqual([row for station, row in pairs if station == "one"],
+                         weather.load_data_from_csv("tests/data/example_one.csv"))
+        self.assertEqual([row for station, row in pairs if station == "two"],
+                         weather.load_data_from_csv("tests/data/example_two.csv"))
+        self.assertEqual(pairs[:2], [("one", ["2021-07-02T07:00:00+08:00", 49.0, 67.0]),
+                                     ("two", ["2020-06-19T07:00:00+08:00", 47.0, 46.0])])
+
+    def test_column_order_and_extra_columns(self):
+        path = write_csv(self,
+            "max, min ,site,date,notes\n"
+            "67,49,Perth,2021-07-02T07:00:00+08:00,ok\n"
+            "\n"
+            "68,N/A,Perth,2021-07-03T07:00:00+08:00,sensor fault\n"
+            "62,56,Hobart,2021-07-04T07:00:00+08:00,\n"
+        )
+        self.assertEqual(list(weather.iter_station_data(path, station_column="site")), [
+            ("Perth", ["2021-07-02T07:00:00+08:00", 49.0, 67.0]),
+            ("Hobart", ["2021-07-04T07:00:00+08:00", 56.0, 62.0]),
+        ])
+
+    def test_missing_columns(self):
+        with self.assertRaises(ValueError):
+            list(weather.iter_station_data("tests/data/example_one.csv"))
+        self.assertEqual(list(weather.iter_station_data(write_csv(self, ""))), [])
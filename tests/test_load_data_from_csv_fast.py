@@ -0,0 +1,88 @@
+import os
+import random
+import tempfile
+import unittest
+from itertools import zip_longest
+import weather
+from tests.helpers import write_csv
+
+
+class LoadCSVFastTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def assertSameAsSlowLoader(self, path):
+        expected = weather.load_data_from_csv(path)
+        self.assertListEqual(weather.load_data_from_csv(path, fast=True), expected)
+        series = weather.load_data_from_csv(path, fast=True, as_series=True)
+        self.assertListEqual(list(series), expected)
+        self.assertListEqual(list(series.timestamps), list(weather.WeatherSeries(expected).timestamps))
+
+    def test_fast_fixtures(self):
+        for name in ("example_one", "example_two", "example_three"):
+            self.assertSameAsSlowLoader(f"tests/data/{name}.csv")
+
+    def test_fast_malformed_lines(self):
+        path = write_csv(self,
+            "date,min,max\n"
+            "2021-07-02T07:00:00+08:00,49,67\n"
+            "\n"
+            "2021-07-03T07:00:00+08:00,N/A,68\n"
+            "2021-07-04T07:00:00+08:00, 56 ,62\n"
+            "2021-07-05T07:00:00+08:00,55,61,extra\n"
+            "2021-07-06T07:00:00+08:00,-5.5e1,.5\n"
+            "2021-07-07T07:00:00+08:00,-inf,Infinity\n"
+            "2021-07-08T07:00:00+08:00,1_0,3."
+        )
+        self.assertSameAsSlowLoader(path)
+
+    def test_fast_crlf_and_quotes(self):
+        self.assertSameAsSlowLoader(write_csv(self, b"date,min,max\r\n2021-07-02T07:00:00+08:00,49,67\r\n\r\n"))
+        self.assertSameAsSlowLoader(write_csv(self, 'date,min,max\n"2021-07-02T07:00:00+08:00","49",67\n'))
+
+    def test_fast_header_only_and_empty(self):
+        self.assertSameAsSlowLoader(write_csv(self, "date,min,max"))
+        self.assertSameAsSlowLoader(write_csv(self, ""))
+
+    def test_fast_synthetic(self):
+        rows = int(os.environ.get("WEATHER_FAST_PARITY_ROWS", "20000"))
+        generator = random.Random(4)
+        handle, path = tempfile.mkstemp(suffix=".csv")
+        self.addCleanup(os.remove, path)
+        with os.fdopen(handle, "w") as file:
+            file.write("date,min,max\n")
+            for index in range(rows):
+                low = round(generator.uniform(-40, 90), generator.randint(0, 2))
+                high = "N/A" if index % 97 == 0 else round(low + generator.uniform(0, 30), 1)
+                file.write(f"2021-07-{index % 28 + 1:02d}T07:00:00+08:00,{low},{high}\n")
+                if index % 101 == 0:
+                    file.write("\n")
+        self.assertListEqual(weather.load_data_from_csv(path, fast=True), weather.load_data_from_csv(path))
+
+    @unittest.skipUnless(os.environ.get("WEATHER_LARGE_TESTS"), "set WEATHER_LARGE_TESTS=1 to run")
+    def test_fast_synthetic_ten_million_rows(self):
+        handle, path = tempfile.mkstemp(suffix=".csv")
+        self.addCleanup(os.remove, path)
+        rows = 0
+        with os.fdopen(handle, "w") as file:
+            file.write("date,min,max\n")
+            for index in range(10_000_000):
+                date = f"2021-07-{index % 28 + 1:02d}T07:00:00+08:00"
+                # malformed rows and blank lines now and then, so groups fall back to checking row by row
+                if index % 9973 == 0:
+                    file.write(f"{date},N/A,{index % 7 * 1.5 + 60}\n")
+                elif index % 10007 == 0:
+                    file.write(f"{date},{index % 130 - 40},--\n\n")
+                elif index % 10009 == 0:
+                    file.write(f"{date}, {index % 130 - 40}e0 ,{index % 7 * 1.5 + 60}\n")
+                    rows += 1
+                else:
+                    file.write(f"{date},{index % 130 - 40},{index % 7 * 1.5 + 60}\n")
+                    rows += 1
+        fast = weather.load_data_from_csv(path, fast=True, as_series=True)
+        slow = weather.iter_data_from_csv(path)
+        self.assertEqual(len(fast), rows)
+        for fast_row, slow_row in zip_longest(fast, slow):
+            self.assertEqual(fast_row, slow_row)
@@ -0,0 +1,89 @@
+import unittest
+import weather
+from tests.helpers import write_csv
+
+
+class LoadDataWithReportTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def test_fixtures_have_nothing_to_report(self):
+        for name in ("example_one", "example_two", "example_three"):
+            path = f"tests/data/{name}.csv"
+            data, report = weather.load_data_with_report(path)
+            self.assertListEqual(data, weather.load_data_from_csv(path))
+            self.assertEqual(report.rows_read, len(data) + report.empty_rows)
+            self.assertEqual(report.rows_loaded, len(data))
+            self.assertEqual(report.rows_rejected, 0)
+            self.assertListEqual(report.rejected, [])
+
+    def test_rejected_rows(self):
+        path = write_csv(self,
+            "date,min,max\n"
+            "2021-07-02T07:00:00+08:00,49,67\n"
+            "\n"
+            "2021-07-03T07:00:00+08:00,N/A,68\n"
+            "2021-07-04T07:00:00+08:00, 56 ,62\n"
+            "2021-07-05T07:00:00+08:00,55,\n"
+            "2021-07-06T07:00:00+08:00,-5.5e1,abc\n"
+            "2021-07-07T07:00:00+08:00,  ,--\n"
+            "2021-07-08T07:00:00+08:00,1_0,3.,extra\n"
+        )
+        data, report = weather.load_data_with_report(path)
+        self.assertListEqual(data, weather.load_data_from_csv(path))
+        self.assertListEqual(data, [
+            ["2021-07-02T07:00:00+08:00", 49.0, 67.0],
+            ["2021-07-04T07:00:00+08:00", 56.0, 62.0],
+            ["2021-07-08T07:00:00+08:00", 10.0, 3.0],
+        ])
+        self.assertEqual(report.rows_read, 8)
+        self.assertEqual(report.rows_loaded, 3)
+        self.assertEqual(report.empty_rows, 1)
+        self.assertEqual(report.rows_rejected, 4)
+        self.assertDictEqual(report.reasons, {"invalid min": 1, "empty max": 1, "invalid max": 1, "empty min": 1})
+        self.assertListEqual(report.rejected, [
+            weather.RejectedRow(4, "invalid min", ["2021-07-03T07:00:00+08:00", "N/A", "68"]),
+            weather.RejectedRow(6, "empty max", ["2021-07-05T07:00:00+08:00", "55", ""]),
+            weather.RejectedRow(7, "invalid max", ["2021-07-06T07:00:00+08:00", "-5.5e1", "abc"]),
+            weather.RejectedRow(8, "empty min", ["2021-07-07T07:00:00+08:00", "  ", "--"]),
+        ])
+
+    def test_too_few_columns(self):
+        path = write_csv(self, "date,min,max\n2021-07-02T07:00:00+08:00,49\n2021-07-03T07:00:00+08:00,50,60\n")
+        data, report = weather.load_data_with_report(path)
+        self.assertListEqual(data, [["2021-07-03T07:00:00+08:00", 50.0, 60.0]])
+        self.assertListEqual(report.rejected, [
+            weather.RejectedRow(2, "too few columns", ["2021-07-02T07:00:00+08:00", "49"]),
+        ])
+
+    def test_max_rejected(self):
+        lines = ["date,min,max"] + [f"2021-07-{day:02}T07:00:00+08:00,x{day},60" for day in range(1, 21)]
+        data, report = weather.load_data_with_report(write_csv(self, "\n".join(lines)), max_rejected=2)
+        self.assertListEqual(data, [])
+        self.assertEqual(report.rows_rejected, 20)
+        self.assertListEqual([rejected.line for rejected in report.rejected], [2, 3])
+
+    def test_as_series(self):
+        data, report = weather.load_data_with_report("tests/data/example_two.csv", as_series=True)
+        self.assertIsInstance(data, weather.WeatherSeries)
+        self.assertListEqual(list(data), weather.load_data_from_csv("tests/data/example_two.csv"))
+
+    def test_format(self):
+        path = write_csv(self,
+            "date,min,max\n"
+            "2021-07-02T07:00:00+08:00,49,67\n"
+            "2021-07-03T07:00:00+08:00,N/A,68\n"
+            "2021-07-04T07:00:00+08:00,N/A,\n"
+            "2021-07-05T07:00:00+08:00,55,\n"
+        )
+        report = weather.load_data_with_report(path)[1]
+        self.assertEqual(report.format(limit=2), (
+            "4 rows read: 1 loaded, 0 empty, 3 rejected\n"
+            "  invalid min: 2\n"
+            "  empty max: 1\n"
+            "line 3: invalid min: 2021-07-03T07:00:00+08:00,N/A,68\n"
+            "line 4: invalid min: 2021-07-04T07:00:00+08:00,N/A,\n"
+            "... 1 more rejected rows\n"
+        ))
@@ -0,0 +1,65 @@
+import os
+import shutil
+import tempfile
+import unittest
+import weather
+
+
+class LoadSeriesCachedTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, "example_three.csv")
+        shutil.copy("tests/data/example_three.csv", self.path)
+
+    def assertSameSeries(self, series, expected):
+        self.assertListEqual(list(series), list(expected))
+        self.assertListEqual(list(series.timestamps), list(expected.timestamps))
+        self.assertListEqual(list(series.utc_offsets), list(expected.utc_offsets))
+
+    def test_cache_written_and_reused(self):
+        expected = weather.load_data_from_csv(self.path, as_series=True)
+        first = weather.load_series_cached(self.path)
+        self.assertTrue(os.path.exists(self.path + weather.CACHE_SUFFIX))
+        self.assertSameSeries(first, expected)
+        second = weather.load_series_cached(self.path)
+        self.assertIsInstance(second.minimums, memoryview)
+        self.assertSameSeries(second, expected)
+        self.assertEqual(second[2], ["2020-06-21T07:00:00+08:00", 58.0, 72.0])
+        self.assertEqual(second.dates[-1], "2020-06-26T07:00:00+08:00")
+
+    def test_cached_series_summaries(self):
+        weather.load_series_cached(self.path)
+        series = weather.load_series_cached(self.path)
+        with open("tests/expected_output/example_three_summary.txt", encoding="utf8") as txt_file:
+            self.assertEqual(txt_file.read(), weather.generate_summary(series))
+        with open("tests/expected_output/example_three_daily_summary.txt", encoding="utf8") as txt_file:
+            self.assertEqual(txt_file.read(), weather.generate_daily_summary(series))
+        self.assertEqual(weather.find_min(series), (-52.0, 4))
+        self.assertEqual(weather.find_max(series), (72.0, 2))
+        self.assertEqual(weather.calculate_mean(series.minimums), weather.calculate_mean([-47, -51, 58, 59, -52, 52, -48, 53]))
+
+    def test_cache_invalidated_when_source_changes(self):
+        weather.load_series_cached(self.path)
+        with open(self.path, "a") as file:
+            file.write("2020-06-27T07:00:00+08:00,40,50\n")
+        series = weather.load_series_cached(self.path)
+        self.assertEqual(len(series), 9)
+        self.assertEqual(list(weather.load_series_cached(self.path)), weather.load_data_from_csv(self.path))
+
+    def test_corrupt_cache_is_rebuilt(self):
+        with open(self.path + weather.CACHE_SUFFIX, "wb") as file:
+            file.write(b"not a cache")
+        series = weather.load_series_cached(self.path)
+        self.assertEqual(list(series), weather.load_data_from_csv(self.path))
+        self.assertIsInstance(weather.load_series_cached(self.path).maximums, memoryview)
+
+    def test_empty_csv(self):
+        open(self.path, "w").close()
+        self.assertEqual(len(weather.load_series_cached(self.path)), 0)
+        self.assertEqual(len(weather.load_series_cached(self.path)), 0)
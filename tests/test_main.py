@@ -0,0 +1,105 @@
+import contextlib
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+import weather
+
+
+class MainTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def read_expected(self, name):
+        with open(f"tests/expected_output/{name}.txt", encoding="utf8") as txt_file:
+            return txt_file.read()
+
+    def run_main(self, *argv):
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            code = weather.main(list(argv))
+        self.assertEqual(code, 0)
+        return stdout.getvalue()
+
+    def test_import_is_quiet_and_light(self):
+        # site .pth files may already import some of these; only what weather adds counts
+        code = ("import sys; before = set(sys.modules); import weather; "
+                "print(sorted(m for m in ('argparse', 'asyncio', 'bz2', 'csv', 'gzip', 'lzma', 're', 'concurrent.futures') "
+                "if m in sys.modules and m not in before))")
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout, "[]\n")
+
+    def test_summary_command(self):
+        self.assertEqual(self.read_expected("example_one_summary"), self.run_main("summary", "tests/data/example_one.csv"))
+        self.assertEqual(self.read_expected("example_two_summary"), self.run_main("summary", "--fast", "tests/data/example_two.csv"))
+
+    def test_summary_command_several_files(self):
+        rows = weather.load_data_from_csv("tests/data/example_one.csv") + weather.load_data_from_csv("tests/data/example_two.csv")
+        for options in ([], ["--fast"]):
+            result = self.run_main("summary", *options, "tests/data/example_one.csv", "tests/data/example_two.csv")
+            self.assertEqual(weather.generate_summary(rows), result)
+
+    def test_summary_command_periods(self):
+        rows = weather.load_data_from_csv("tests/data/example_one.csv")
+        result = self.run_main("summary", "--period", "week", "tests/data/example_one.csv")
+        self.assertEqual(result, "".join(f"==> {week.first_date} to {week.last_date} <==\n{week.summary}\n"
+                                         for week in weather.calendar_summaries(rows)))
+        result = self.run_main("summary", "--window", "4", "tests/data/example_one.csv")
+        self.assertEqual(result.count("4 Day Overview"), 2)
+
+    def test_stations_command(self):
+        result = self.run_main("stations", "tests/data/example_stations.csv")
+        self.assertEqual(result, f"==> one <==\n{self.read_expected('example_one_summary')}\n"
+                                 f"==> two <==\n{self.read_expected('example_two_summary')}\n")
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.run_main("stations", "tests/data/example_stations.csv", "--daily-dir", directory)
+        with open(os.path.join(directory, "two.txt"), encoding="utf8") as file:
+            self.assertEqual(self.read_expected("example_two_daily_summary"), file.read())
+
+    def test_validate_command(self):
+        self.assertEqual(self.run_main("validate", "tests/data/example_one.csv"), "5 rows read: 5 loaded, 0 empty, 0 rejected\n")
+        handle, path = tempfile.mkstemp(suffix=".csv")
+        self.addCleanup(os.remove, path)
+        with os.fdopen(handle, "w") as file:
+            file.write("date,min,max\n2021-07-02T07:00:00+08:00,N/A,67\n")
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            self.assertEqual(weather.main(["validate", path]), 1)
+        self.assertEqual(stdout.getvalue(), "1 rows read: 0 loaded, 0 empty, 1 rejected\n"
+                                            "  invalid min: 1\n"
+                                            "line 2: invalid min: 2021-07-02T07:00:00+08:00,N/A,67\n")
+
+    def test_summary_command_percentiles(self):
+        result = self.run_main("summary", "--top", "3", "tests/data/example_two.csv")
+        self.assertEqual(result, self.read_expected("example_two_summary") + "\n"
+                         + self.read_expected("example_two_percentile_summary"))
+        result = self.run_main("summary", "--fast", "--percentiles", "50", "tests/data/example_two.csv")
+        self.assertIn("Percentiles (50th)\n", result)
+        self.assertIn("3 Coldest Days\n", result)
+
+    def test_daily_command_output_file(self):
+        handle, path = tempfile.mkstemp(suffix=".txt")
+        os.close(handle)
+        self.addCleanup(os.remove, path)
+        self.assertEqual(self.run_main("daily", "tests/data/example_three.csv", "-o", path), "")
+        with open(path, encoding="utf8") as file:
+            self.assertEqual(self.read_expected("example_three_daily_summary"), file.read())
+
+    def test_stats_option(self):
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            result = self.run_main("summary", "--stats", "tests/data/example_one.csv")
+        self.assertEqual(self.read_expected("example_one_summary"), result)
+        self.assertIn("weather_rows_loaded_total 5\n", stderr.getvalue())
+        self.assertIsNone(weather._stats)
+
+    def test_module_entry_point(self):
+        result = subprocess.run([sys.executable, "-m", "weather", "daily", "tests/data/example_one.csv"],
+                                capture_output=True, check=True)
+        self.assertEqual(self.read_expected("example_one_daily_summary"), result.stdout.decode("utf8"))
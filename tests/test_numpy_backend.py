@@ -0,0 +1,77 @@
+import unittest
+from array import array
+import weather
+from tests import test_calculate_mean, test_find_max, test_find_min, test_quantiles
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class NumpyBackendMixin:
+
+    def setUp(self):
+        previous = weather._BACKEND
+        weather.set_backend("numpy")
+        self.addCleanup(weather.set_backend, previous)
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class NumpyCalculateMeanTests(NumpyBackendMixin, test_calculate_mean.CalculateMeanTests):
+
+    def test_calculate_mean_mask(self):
+        self.assertEqual(weather.calculate_mean(numpy.array(["51", "N/A", "53", "abc"])), 52.0)
+        self.assertEqual(weather.calculate_mean(["N/A"]), 0.0)
+
+    def test_calculate_mean_arrays(self):
+        values = [0.1 * number for number in range(1, 1001)]
+        # the same sum as the pure Python path, also for a strided view
+        self.assertEqual(weather.calculate_mean(numpy.array(values)[::2]), sum(values[::2]) / 500)
+        self.assertEqual(weather.calculate_mean(numpy.array(values)), sum(values) / 1000)
+        self.assertEqual(weather.calculate_mean(array("d", values)), sum(values) / 1000)
+        self.assertEqual(weather.calculate_mean(numpy.array([1, 2, 4])), 7 / 3)
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class NumpyFindMinTests(NumpyBackendMixin, test_find_min.FindMinTests):
+
+    def test_find_min_columns(self):
+        self.assertEqual(weather.find_min(array("d", [3, 1, 2, 1])), (1.0, 3))
+        self.assertEqual(weather.find_min(numpy.array([3, 1, 2, 1])), (1.0, 3))
+        self.assertEqual(weather.find_min(array("d", [3, float("nan"), 1, 1])), (1.0, 3))
+
+    def test_find_min_invalid(self):
+        with self.assertRaises(ValueError):
+            weather.find_min(["1", "N/A"])
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class NumpyFindMaxTests(NumpyBackendMixin, test_find_max.FindMaxTests):
+
+    def test_find_max_columns(self):
+        series = weather.WeatherSeries([["2021-07-02T07:00:00+08:00", 1, 5], ["2021-07-03T07:00:00+08:00", 2, 5]])
+        self.assertEqual(weather.find_max(series), (5.0, 1))
+        self.assertEqual(weather.find_max(numpy.array([5.5, -1.0, 5.5])), (5.5, 2))
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class NumpyQuantilesTests(NumpyBackendMixin, test_quantiles.QuantilesTests):
+
+    def test_quantiles_arrays(self):
+        self.assertEqual(weather.quantiles(numpy.array([4, 1, 3, 2]), [0.5]), [2.5])
+        self.assertEqual(weather.quantiles(numpy.array(["49", "57", "56"]), [0.5]), [56.0])
+
+
+class SetBackendTests(unittest.TestCase):
+
+    def test_set_backend(self):
+        previous = weather._BACKEND
+        self.addCleanup(setattr, weather, "_BACKEND", previous)
+        weather.set_backend("python")
+        self.assertEqual(weather.find_min(array("d", [2, 1, 1])), (1.0, 2))
+        with self.assertRaises(ValueError):
+            weather.set_backend("fortran")
+        if numpy is None:
+            with self.assertRaises(ImportError):
+                weather.set_backend("numpy")
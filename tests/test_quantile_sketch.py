@@ -0,0 +1,53 @@
+import random
+import unittest
+import weather
+
+
+class QuantileSketchTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+        generator = random.Random(5)
+        self.values = [generator.gauss(50, 20) for _ in range(20000)]
+        self.probabilities = [0, 0.05, 0.5, 0.95, 0.999, 1]
+
+    def assertWithinBound(self, sketch, values):
+        exact = weather.quantiles(values, self.probabilities)
+        for estimate, expected in zip(sketch.quantiles(self.probabilities), exact):
+            self.assertLessEqual(abs(estimate - expected), sketch.resolution / 2 + 1e-9)
+
+    def test_sketch_error_bound(self):
+        for resolution in (0.1, 0.5, 2.0):
+            sketch = weather.QuantileSketch(resolution).update(self.values)
+            self.assertEqual(len(sketch), len(self.values))
+            self.assertWithinBound(sketch, self.values)
+            # the memory depends on the spread of the values, not their number
+            self.assertLess(len(sketch.buckets), 200 / resolution)
+
+    def test_sketch_exact_for_tenths(self):
+        rows = weather.load_data_from_csv("tests/data/example_two.csv")
+        lows = [row[1] for row in rows]
+        sketch = weather.QuantileSketch()
+        for value in lows:
+            sketch.add(value)
+        for estimate, expected in zip(sketch.quantiles([0, 0.5, 1]), weather.quantiles(lows, [0, 0.5, 1])):
+            self.assertAlmostEqual(estimate, expected, places=9)
+
+    def test_sketch_merge(self):
+        parts = [weather.QuantileSketch().update(self.values[start:start + 3000]) for start in range(0, 20000, 3000)]
+        merged = weather.QuantileSketch()
+        for part in parts:
+            merged.merge(part)
+        whole = weather.QuantileSketch().update(self.values)
+        self.assertEqual(merged.buckets, whole.buckets)
+        self.assertEqual(merged.quantiles(self.probabilities), whole.quantiles(self.probabilities))
+        with self.assertRaises(ValueError):
+            merged.merge(weather.QuantileSketch(0.5))
+
+    def test_sketch_skips_non_finite_and_empty(self):
+        sketch = weather.QuantileSketch().update([float("nan"), float("inf"), "12.5"])
+        self.assertEqual(sketch.quantiles([0.5]), [12.5])
+        self.assertEqual(weather.QuantileSketch().quantiles(), [])
+        with self.assertRaises(ValueError):
+            weather.QuantileSketch(0)
@@ -0,0 +1,55 @@
+import random
+import unittest
+from array import array
+import weather
+
+
+def sorted_quantile(values, probability):
+    ordered = sorted(values)
+    position = probability * (len(ordered) - 1)
+    low = int(position)
+    if position == low:
+        return ordered[low]
+    return ordered[low] + (ordered[low + 1] - ordered[low]) * (position - low)
+
+
+class QuantilesTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def test_quantiles_small(self):
+        self.assertEqual(weather.quantiles([1, 2, 3, 4], [0.5]), [2.5])
+        self.assertEqual(weather.quantiles(["49", 57, 56.0], [0, 0.5, 1]), [49.0, 56.0, 57.0])
+        self.assertEqual(weather.quantiles([7], [0.05, 0.95]), [7.0, 7.0])
+        self.assertEqual(weather.quantiles([3, float("nan"), 1, 2]), weather.quantiles([3, 1, 2]))
+
+    def test_quantiles_match_sorting(self):
+        generator = random.Random(2)
+        probabilities = [0, 0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99, 1]
+        for size in (2, 15, 1000, 3001, 20000):
+            for values in ([round(generator.uniform(-40, 120), 1) for _ in range(size)],
+                           [float(generator.randint(0, 3)) for _ in range(size)],
+                           sorted(generator.random() for _ in range(size))):
+                expected = [sorted_quantile(values, probability) for probability in probabilities]
+                self.assertEqual(weather.quantiles(values, probabilities), expected)
+                self.assertEqual(weather.quantiles(array("d", values), probabilities), expected)
+
+    def test_quantiles_at_the_ends_of_large_data(self):
+        generator = random.Random(5)
+        values = [generator.uniform(-40, 120) for _ in range(200000)]
+        ordered = sorted(values)
+        probabilities = [0, 1e-7, 1 - 1e-7, 1]
+        expected = [sorted_quantile(ordered, probability) for probability in probabilities]
+        self.assertEqual(weather.quantiles(values, probabilities), expected)
+        self.assertEqual(weather.quantiles(values, [0]), [ordered[0]])
+        self.assertEqual(weather.quantiles(values, [1]), [ordered[-1]])
+
+    def test_quantiles_empty_and_invalid(self):
+        self.assertEqual(weather.quantiles([]), [])
+        self.assertEqual(weather.quantiles([float("nan")]), [])
+        with self.assertRaises(ValueError):
+            weather.quantiles([1, 2], [1.5])
+        with self.assertRaises(ValueError):
+            weather.quantiles(["1", "N/A"])
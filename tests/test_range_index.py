@@ -0,0 +1,80 @@
+import random
+import unittest
+from datetime import date, datetime, timedelta, timezone
+import weather
+
+
+class RangeIndexTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+        generator = random.Random(7)
+        start = datetime(2015, 1, 1, 7, tzinfo=timezone(timedelta(hours=8)))
+        # two and a half years of daily readings, with plenty of ties
+        self.rows = [[(start + timedelta(days=day)).isoformat(), round(generator.uniform(30, 40), generator.choice((0, 1, 2))),
+                      generator.randint(60, 70)] for day in range(900)]
+
+    def test_whole_series(self):
+        index = weather.RangeIndex(self.rows)
+        self.assertEqual(index.summary_for_range(), weather.generate_summary(self.rows))
+        rows = weather.load_data_from_csv("tests/data/example_two.csv")
+        with open("tests/expected_output/example_two_summary.txt", encoding="utf8") as txt_file:
+            self.assertEqual(weather.RangeIndex(rows).summary_for_range(), txt_file.read())
+
+    def test_random_ranges(self):
+        index = weather.RangeIndex(weather.WeatherSeries(self.rows))
+        generator = random.Random(3)
+        for _ in range(500):
+            first = generator.randrange(len(self.rows))
+            stop = generator.randint(first + 1, len(self.rows))
+            expected = weather.generate_summary(self.rows[first:stop])
+            start, end = self.rows[first][0], self.rows[stop - 1][0]
+            self.assertEqual(index.locate(start, end), (first, stop))
+            self.assertEqual(index.summary_for_range(start, end), expected)
+            self.assertEqual(index.summary_for_range(datetime.fromisoformat(start), datetime.fromisoformat(end)), expected)
+
+    def test_date_ranges(self):
+        index = weather.RangeIndex(self.rows)
+        expected = weather.generate_summary([row for row in self.rows if "2016-03-03" <= row[0][:10] <= "2016-04-17"])
+        self.assertEqual(index.summary_for_range(date(2016, 3, 3), date(2016, 4, 17)), expected)
+        self.assertEqual(index.summary_for_range("2016-03-03", "2016-04-17"), expected)
+        self.assertEqual(index.locate("2016-03-03", "2016-03-03"), (427, 428))
+        self.assertEqual(index.locate(date(2030, 1, 1)), (900, 900))
+
+    def test_averages_on_rounding_boundaries(self):
+        # 50.09F is 10.05C, right between two rounded texts
+        rows = [[f"2021-07-{day:02}T07:00:00+08:00", value, 70]
+                for day, value in zip(range(1, 29), [50.09, 50.1, 50.08] * 9 + [50.09])]
+        index = weather.RangeIndex(rows)
+        for first in range(len(rows)):
+            for stop in range(first + 1, len(rows) + 1):
+                self.assertEqual(index.summary_for_range(rows[first][0], rows[stop - 1][0]),
+                                 weather.generate_summary(rows[first:stop]))
+
+    def test_extremes_keep_the_last_tie(self):
+        rows = [[f"2021-07-{day:02}T07:00:00+08:00", value, 100 - value] for day, value in
+                zip(range(1, 11), [5, 3, 7, 3, 9, 3, 8, 4, 6, 3])]
+        index = weather.RangeIndex(rows)
+        self.assertEqual(index.extremes(0, 10), (9, 9))
+        self.assertEqual(index.extremes(0, 9), (5, 5))
+        self.assertEqual(index.extremes(2, 5), (3, 3))
+        self.assertEqual(index.extremes(4, 5), (4, 4))
+        with self.assertRaises(ValueError):
+            index.extremes(3, 3)
+
+    def test_unsorted_and_unparsable_dates(self):
+        shuffled = self.rows[:50] + [["not a date", 1, 2]]
+        random.Random(1).shuffle(shuffled)
+        index = weather.RangeIndex(shuffled)
+        self.assertEqual(list(index.series), [[row[0], float(row[1]), float(row[2])] for row in self.rows[:50]])
+        self.assertEqual(index.summary_for_range(), weather.generate_summary(self.rows[:50]))
+
+    def test_empty_range(self):
+        index = weather.RangeIndex(self.rows)
+        with self.assertRaises(ValueError):
+            index.summary_for_range("2016-04-17", "2016-03-03")
+        with self.assertRaises(ValueError):
+            weather.RangeIndex([]).summary_for_range()
+        with self.assertRaises(ValueError):
+            index.summary_for_range("yesterday")
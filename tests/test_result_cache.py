@@ -0,0 +1,174 @@
+import os
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+import weather
+
+
+def summarise_in_worker(directory, path):
+    cache = weather.ResultCache(directory=directory)
+    return cache.summary(path), cache.stats()
+
+
+class ResultCacheTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.cache_dir = os.path.join(self.directory, "cache")
+
+    def read_expected(self, name, kind="summary"):
+        with open(f"tests/expected_output/{name}_{kind}.txt", encoding="utf8") as txt_file:
+            return txt_file.read()
+
+    def copy(self, name, target):
+        path = os.path.join(self.directory, target)
+        shutil.copy(f"tests/data/{name}.csv", path)
+        return path
+
+    def test_memory_hits_and_misses(self):
+        cache = weather.ResultCache()
+        for _ in range(2):
+            self.assertEqual(self.read_expected("example_one"), cache.summary("tests/data/example_one.csv"))
+            self.assertEqual(self.read_expected("example_one", "daily_summary"), cache.summary("tests/data/example_one.csv", daily=True))
+        self.assertEqual(cache.stats(), {"hits": 2, "disk_hits": 0, "misses": 2, "evictions": 0, "disk_evictions": 0, "entries": 2})
+
+    def test_key_follows_content_not_name(self):
+        cache = weather.ResultCache()
+        first = self.copy("example_two", "a.csv")
+        second = self.copy("example_two", "b.csv")
+        self.assertEqual(weather.ResultCache.key(first), weather.ResultCache.key(second))
+        self.assertNotEqual(weather.ResultCache.key(first), weather.ResultCache.key(first, daily=True))
+        cache.summary(first)
+        self.assertEqual(self.read_expected("example_two"), cache.summary(second))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        with open(second, "a") as file:
+            file.write("2030-01-01T07:00:00+08:00,-90,120\n")
+        self.assertNotEqual(self.read_expected("example_two"), cache.summary(second))
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_rows_and_series(self):
+        cache = weather.ResultCache()
+        rows = weather.load_data_from_csv("tests/data/example_three.csv")
+        series = weather.load_data_from_csv("tests/data/example_three.csv", as_series=True)
+        self.assertEqual(self.read_expected("example_three"), cache.summary(rows))
+        self.assertEqual(self.read_expected("example_three"), cache.summary([list(row) for row in rows]))
+        self.assertEqual(self.read_expected("example_three"), cache.summary(iter(rows)))
+        self.assertEqual(self.read_expected("example_three", "daily_summary"), cache.summary(series, daily=True))
+        self.assertEqual(self.read_expected("example_three", "daily_summary"), cache.summary(series[:], daily=True))
+        self.assertEqual((cache.hits, cache.misses), (3, 2))
+        changed = [list(row) for row in rows]
+        changed[3][2] = 99.5
+        self.assertNotEqual(weather.ResultCache.key(rows), weather.ResultCache.key(changed))
+        self.assertNotEqual(weather.ResultCache.key(series), weather.ResultCache.key(series[1:]))
+
+    def test_memory_eviction(self):
+        cache = weather.ResultCache(max_entries=2)
+        for name in ("example_one", "example_two", "example_one", "example_three", "example_two"):
+            cache.summary(f"tests/data/{name}.csv")
+        # example_two was the least recently used when example_three came in
+        self.assertEqual(cache.stats(), {"hits": 1, "disk_hits": 0, "misses": 4, "evictions": 2, "disk_evictions": 0, "entries": 2})
+        self.assertEqual(weather.ResultCache(max_entries=0).stats()["entries"], 0)
+        with self.assertRaises(ValueError):
+            weather.ResultCache(max_entries=-1)
+
+    def test_disk_tier_shared_between_instances(self):
+        weather.ResultCache(directory=self.cache_dir).summary("tests/data/example_one.csv")
+        cache = weather.ResultCache(directory=self.cache_dir)
+        self.assertEqual(self.read_expected("example_one"), cache.summary("tests/data/example_one.csv"))
+        self.assertEqual(self.read_expected("example_one"), cache.summary("tests/data/example_one.csv"))
+        self.assertEqual((cache.hits, cache.disk_hits, cache.misses), (1, 1, 0))
+        self.assertEqual([name for name in os.listdir(self.cache_dir) if not name.endswith(".result")], [])
+
+    def test_damaged_files_are_misses(self):
+        cache = weather.ResultCache(directory=self.cache_dir)
+        cache.summary("tests/data/example_one.csv")
+        key = weather.ResultCache.key("tests/data/example_one.csv")
+        path = os.path.join(self.cache_dir, key + ".result")
+        for content in (b"", b"WSRESULT1 " + key.encode() + b"\n\xff", b"WSRESULT1 " + b"0" * len(key) + b"\nwrong"):
+            with open(path, "wb") as file:
+                file.write(content)
+            fresh = weather.ResultCache(directory=self.cache_dir)
+            self.assertEqual(self.read_expected("example_one"), fresh.summary("tests/data/example_one.csv"))
+            self.assertEqual((fresh.disk_hits, fresh.misses), (0, 1))
+        os.remove(path)
+        self.assertIsNone(weather.ResultCache(directory=self.cache_dir).get(key))
+
+    def test_disk_eviction_by_size(self):
+        cache = weather.ResultCache(directory=self.cache_dir)
+        cache.summary("tests/data/example_one.csv", daily=True)
+        size = os.path.getsize(os.path.join(self.cache_dir, os.listdir(self.cache_dir)[0]))
+        old = os.path.join(self.cache_dir, os.listdir(self.cache_dir)[0])
+        os.utime(old, (1, 1))
+        cache = weather.ResultCache(directory=self.cache_dir, max_disk_bytes=size + 10)
+        cache.summary("tests/data/example_one.csv")
+        self.assertEqual(cache.disk_evictions, 1)
+        self.assertFalse(os.path.exists(old))
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+        # a result bigger than the whole directory is only kept in memory
+        cache.summary("tests/data/example_three.csv", daily=True)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+    def test_worker_processes_share_the_directory(self):
+        paths = [self.copy("example_two", f"copy_{number}.csv") for number in range(4)]
+        weather.ResultCache(directory=self.cache_dir).summary(paths[0])
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(summarise_in_worker, [self.cache_dir] * 4, paths))
+        for summary, stats in results:
+            self.assertEqual(self.read_expected("example_two"), summary)
+            self.assertEqual((stats["disk_hits"], stats["misses"]), (1, 0))
+
+    def test_directory_listed_only_when_full(self):
+        listings = []
+
+        class CountingCache(weather.ResultCache):
+            def _trim_directory(self):
+                listings.append(len(os.listdir(self.directory)))
+                weather.ResultCache._trim_directory(self)
+
+        cache = CountingCache(directory=self.cache_dir, max_disk_bytes=10000)
+        for number in range(400):
+            cache.put(f"{number:040x}", "x" * 100)
+        sizes = [os.path.getsize(os.path.join(self.cache_dir, name)) for name in os.listdir(self.cache_dir)]
+        self.assertLessEqual(sum(sizes), 10000)
+        self.assertEqual(cache._disk_bytes, sum(sizes))
+        # the first write, then once per quarter of the limit
+        self.assertLess(len(listings), 30)
+        self.assertGreater(cache.disk_evictions, 300)
+        # a new cache counts what is already there on its first write
+        fresh = weather.ResultCache(directory=self.cache_dir, max_disk_bytes=10000)
+        fresh.put("f" * 40, "x" * 100)
+        self.assertEqual(fresh._disk_bytes, sum(sizes) + sizes[0])
+
+    def test_file_appended_while_summarised(self):
+        path = self.copy("example_two", "live.csv")
+
+        class AppendingCache(weather.ResultCache):
+            def key(self, source, daily=False):
+                key = weather.ResultCache.key(source, daily)
+                with open(source, "a") as file:
+                    file.write("2030-01-01T07:00:00+08:00,-90,120\n")
+                return key
+
+        old_key = weather.ResultCache.key(path)
+        cache = AppendingCache()
+        text = cache.summary(path)
+        self.assertNotEqual(self.read_expected("example_two"), text)
+        self.assertEqual(weather.generate_summary(weather.load_data_from_csv(path)), text)
+        self.assertIsNone(cache.get(old_key))
+        self.assertEqual(cache.get(weather.ResultCache.key(path)), text)
+
+    def test_compressed_file_key_matches(self):
+        import gzip
+        path = os.path.join(self.directory, "data.csv.gz")
+        with open("tests/data/example_one.csv", "rb") as source, open(path, "wb") as file:
+            file.write(gzip.compress(source.read()))
+        cache = weather.ResultCache()
+        self.assertEqual(self.read_expected("example_one"), cache.summary(path))
+        self.assertEqual(self.read_expected("example_one"), cache.summary(path))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
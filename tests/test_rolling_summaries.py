@@ -0,0 +1,62 @@
+import random
+import unittest
+from datetime import date, timedelta
+import weather
+
+
+class RollingSummariesTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def assertSameAsSlices(self, rows, window):
+        expected = [
+            weather.PeriodSummary(start, rows[start][0], rows[start + window - 1][0],
+                                  weather.generate_summary(rows[start:start + window]))
+            for start in range(len(rows) - window + 1)
+        ]
+        self.assertEqual(list(weather.rolling_summaries(rows, window)), expected)
+
+    def test_rolling_fixtures(self):
+        for name in ("example_one", "example_two", "example_three"):
+            rows = weather.load_data_from_csv(f"tests/data/{name}.csv")
+            for window in range(1, len(rows) + 1):
+                self.assertSameAsSlices(rows, window)
+
+    def test_rolling_ties_keep_the_last_day(self):
+        generator = random.Random(4)
+        start = date(2019, 12, 1)
+        rows = [[(start + timedelta(days=day)).isoformat() + "T07:00:00+08:00",
+                 generator.randint(40, 44), generator.randint(60, 64)] for day in range(60)]
+        for window in (1, 2, 3, 7, 30, 60):
+            self.assertSameAsSlices(rows, window)
+
+    def test_rolling_series_and_iterator(self):
+        rows = weather.load_data_from_csv("tests/data/example_two.csv")
+        expected = list(weather.rolling_summaries(rows, 3))
+        self.assertEqual(list(weather.rolling_summaries(weather.WeatherSeries(rows), 3)), expected)
+        self.assertEqual(list(weather.rolling_summaries(weather.iter_data_from_csv("tests/data/example_two.csv"), 3)), expected)
+
+    def test_rolling_window_larger_than_data(self):
+        self.assertEqual(list(weather.rolling_summaries([["2021-07-02T07:00:00+08:00", 49, 67]], 2)), [])
+        self.assertEqual(list(weather.rolling_summaries([], 1)), [])
+
+    def test_rolling_invalid_window(self):
+        with self.assertRaises(ValueError):
+            list(weather.rolling_summaries([], 0))
+
+    def test_rolling_tenths_and_nan(self):
+        # running sums of tenths drift, and a NaN used to stay in them for good
+        generator = random.Random(16)
+        start = date(1970, 1, 1)
+        rows = [[(start + timedelta(days=day)).isoformat() + "T07:00:00+08:00",
+                 generator.randrange(-400, 1000) / 10, generator.randrange(0, 1200) / 10] for day in range(3000)]
+        rows[100][1] = float("nan")
+        rows[1500][2] = float("inf")
+        for window in (1, 7, 30, 365):
+            self.assertSameAsSlices(rows, window)
+        summaries = list(weather.rolling_summaries(rows, 7))
+        self.assertIn("average low this week is nan", summaries[100].summary)
+        self.assertNotIn("nan", summaries[101].summary)
+
@@ -0,0 +1,77 @@
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+import weather
+
+
+class SummariseFilesTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+        self.names = ["example_one", "example_two", "example_three"]
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        for name in self.names:
+            shutil.copy(f"tests/data/{name}.csv", self.directory)
+
+    def read_expected(self, name, kind="summary"):
+        with open(f"tests/expected_output/{name}_{kind}.txt", encoding="utf8") as txt_file:
+            return txt_file.read()
+
+    def test_summarise_directory_in_order(self):
+        results = list(weather.summarise_files(self.directory, workers=2))
+        self.assertEqual([os.path.basename(result.path) for result in results], sorted(f"{name}.csv" for name in self.names))
+        for result in results:
+            name = os.path.basename(result.path)[:-4]
+            self.assertIsNone(result.error)
+            self.assertEqual(self.read_expected(name), result.summary)
+
+    def test_summarise_glob_unordered_daily(self):
+        pattern = os.path.join(self.directory, "example_t*.csv")
+        results = list(weather.summarise_files(pattern, workers=2, chunk_size=2, ordered=False, daily=True))
+        self.assertEqual(len(results), 2)
+        for result in results:
+            name = os.path.basename(result.path)[:-4]
+            self.assertEqual(self.read_expected(name, "daily_summary"), result.summary)
+
+    def test_summarise_reports_errors(self):
+        empty = os.path.join(self.directory, "empty.csv")
+        open(empty, "w").close()
+        missing = os.path.join(self.directory, "missing.csv")
+        paths = [missing, empty, os.path.join(self.directory, "example_one.csv")]
+        results = list(weather.summarise_files(paths, workers=1))
+        self.assertEqual([result.path for result in results], paths)
+        self.assertTrue(results[0].error.startswith("FileNotFoundError"))
+        self.assertTrue(results[1].error.startswith("ValueError"))
+        self.assertEqual(self.read_expected("example_one"), results[2].summary)
+
+    def test_batch_command(self):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            code = weather.main(["batch", "-j", "1", os.path.join(self.directory, "example_one.csv"), os.path.join(self.directory, "nope.csv")])
+        self.assertEqual(code, 1)
+        self.assertIn(self.read_expected("example_one"), stdout.getvalue())
+        self.assertIn("nope.csv: FileNotFoundError", stderr.getvalue())
+
+    def test_cache_dir(self):
+        cache_dir = os.path.join(self.directory, "cache")
+        shutil.copy("tests/data/example_one.csv", os.path.join(self.directory, "copy.csv"))
+        paths = [os.path.join(self.directory, name) for name in ("example_one.csv", "copy.csv", "example_three.csv")]
+        for _ in range(2):
+            results = list(weather.summarise_files(paths, workers=1, daily=True, cache_dir=cache_dir))
+            self.assertEqual([result.summary for result in results], [self.read_expected("example_one", "daily_summary")] * 2
+                             + [self.read_expected("example_three", "daily_summary")])
+        # the copy has the same content, so it shares a result
+        self.assertEqual(len(os.listdir(cache_dir)), 2)
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            code = weather.main(["batch", "-j", "1", "--cache-dir", cache_dir, paths[0]])
+        self.assertEqual(code, 0)
+        self.assertIn(self.read_expected("example_one"), stdout.getvalue())
+        self.assertEqual(len(os.listdir(cache_dir)), 3)
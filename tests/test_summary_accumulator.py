@@ -0,0 +1,86 @@
+import random
+import unittest
+import weather
+
+
+class SummaryAccumulatorTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+        self.example_two = [
+            ["2020-06-19T07:00:00+08:00", 47, 46],
+            ["2020-06-20T07:00:00+08:00", 51, 67],
+            ["2020-06-21T07:00:00+08:00", 58, 72],
+            ["2020-06-22T07:00:00+08:00", 59, 71],
+            ["2020-06-23T07:00:00+08:00", 52, 71],
+            ["2020-06-24T07:00:00+08:00", 52, 67],
+            ["2020-06-25T07:00:00+08:00", 48, 66],
+            ["2020-06-26T07:00:00+08:00", 53, 66]
+        ]
+
+    def test_accumulator_add(self):
+        with open("tests/expected_output/example_two_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        accumulator = weather.SummaryAccumulator()
+        for date, min_temp, max_temp in self.example_two:
+            accumulator.add(date, min_temp, max_temp)
+        self.assertEqual(expected_result, accumulator.summary())
+
+    def test_accumulator_update_in_parts(self):
+        accumulator = weather.SummaryAccumulator()
+        accumulator.update(self.example_two[:3])
+        accumulator.update(iter(self.example_two[3:]))
+        self.assertEqual(weather.generate_summary(self.example_two), accumulator.summary())
+
+    def test_accumulator_last_index_ties(self):
+        accumulator = weather.SummaryAccumulator().update(self.example_two)
+        self.assertEqual((accumulator.min_value, accumulator.min_index), weather.find_min([47, 51, 58, 59, 52, 52, 48, 53]))
+        self.assertEqual((accumulator.max_value, accumulator.max_index), (72.0, 2))
+        accumulator.add("2020-06-27T07:00:00+08:00", 47, 72)
+        self.assertEqual((accumulator.min_index, accumulator.max_index), (8, 8))
+        self.assertEqual(accumulator.min_date, "2020-06-27T07:00:00+08:00")
+
+    def test_accumulator_empty(self):
+        accumulator = weather.SummaryAccumulator()
+        self.assertEqual(accumulator.count, 0)
+        with self.assertRaises(ValueError):
+            accumulator.summary()
+
+    def test_accumulator_merge(self):
+        expected = weather.SummaryAccumulator().update(self.example_two)
+        for split in range(len(self.example_two) + 1):
+            first = weather.SummaryAccumulator().update(self.example_two[:split])
+            second = weather.SummaryAccumulator().update(self.example_two[split:])
+            merged = first.merge(second)
+            self.assertEqual(merged.summary(), expected.summary())
+            self.assertEqual((merged.min_index, merged.max_index, merged.count),
+                             (expected.min_index, expected.max_index, expected.count))
+
+    def test_accumulator_merge_last_index_ties(self):
+        first = weather.SummaryAccumulator().update([["2020-06-19T07:00:00+08:00", 40, 70]])
+        second = weather.SummaryAccumulator().update([["2020-06-20T07:00:00+08:00", 45, 60],
+                                                      ["2020-06-21T07:00:00+08:00", 40, 70]])
+        first.merge(second)
+        self.assertEqual((first.min_index, first.min_date), (2, "2020-06-21T07:00:00+08:00"))
+        self.assertEqual((first.max_index, first.max_date), (2, "2020-06-21T07:00:00+08:00"))
+
+    def test_averages_match_sum(self):
+        # sum() compensates its rounding from Python 3.12 on, and the
+        # accumulator has to add the temperatures up the same way
+        generator = random.Random(20)
+        cases = [[96.0, 18.9, -6.21]]
+        cases += [[generator.randrange(-400, 1200) / 10 for _ in range(generator.randrange(1, 12))] for _ in range(3000)]
+        cases.append([generator.randrange(-400, 1200) / 10 for _ in range(20000)])
+        for minimums in cases:
+            maximums = [value + 10.1 for value in minimums]
+            rows = [[f"2020-06-{day % 28 + 1:02}T07:00:00+08:00", low, high] for day, (low, high) in enumerate(zip(minimums, maximums))]
+            expected = (sum(minimums) / len(minimums), sum(maximums) / len(maximums))
+            added = weather.SummaryAccumulator()
+            for row in rows:
+                added.add(*row)
+            for accumulator in (weather.SummaryAccumulator().update(rows), weather.SummaryAccumulator().update(weather.WeatherSeries(rows)), added):
+                self.assertEqual(expected, accumulator.averages())
+            self.assertIn(f"The average low this week is {weather.format_temperature(weather.convert_f_to_c(expected[0]))}.",
+                          weather.generate_summary(rows))
+
@@ -0,0 +1,109 @@
+import contextlib
+import gzip
+import io
+import os
+import shutil
+import tempfile
+import unittest
+import weather
+
+
+class SummaryFollowerTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+        self.lines = [
+            "date,min,max\n",
+            "2020-06-19T07:00:00+08:00,47,46\n",
+            "2020-06-20T07:00:00+08:00,51,67\n",
+            "\n",
+            "2020-06-21T07:00:00+08:00,58,72\n",
+            "2020-06-22T07:00:00+08:00,N/A,71\n",
+            "2020-06-23T07:00:00+08:00,52,71\n",
+        ]
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, "live.csv")
+
+    def write(self, text, mode="a"):
+        with open(self.path, mode) as file:
+            file.write(text)
+
+    def assertMatchesFullRebuild(self, follower):
+        self.assertEqual(weather.generate_summary(weather.load_data_from_csv(self.path)), follower.summary())
+
+    def test_follow_appended_rows(self):
+        self.write("".join(self.lines[:3]), "w")
+        follower = weather.SummaryFollower(self.path)
+        self.assertEqual(follower.refresh(), 2)
+        self.assertMatchesFullRebuild(follower)
+        self.write("".join(self.lines[3:]))
+        self.assertEqual(follower.refresh(), 2)
+        self.assertEqual(follower.refresh(), 0)
+        self.assertMatchesFullRebuild(follower)
+        self.assertEqual(follower.rebuilds, 0)
+
+    def test_follow_waits_for_complete_lines(self):
+        self.write("".join(self.lines[:2]) + "2020-06-20T07:00:00+08:00,5", "w")
+        follower = weather.SummaryFollower(self.path)
+        self.assertEqual(follower.refresh(), 1)
+        self.write("1,67\n")
+        self.assertEqual(follower.refresh(), 1)
+        self.assertMatchesFullRebuild(follower)
+
+    def test_follow_header_split_across_refreshes(self):
+        self.write("date,m", "w")
+        follower = weather.SummaryFollower(self.path)
+        self.assertEqual(follower.refresh(), 0)
+        self.write("in,max\n" + "".join(self.lines[1:]))
+        self.assertEqual(follower.refresh(), 4)
+        self.assertMatchesFullRebuild(follower)
+
+    def test_follow_truncated(self):
+        self.write("".join(self.lines), "w")
+        follower = weather.SummaryFollower(self.path)
+        follower.refresh()
+        self.write("".join(self.lines[:2]), "w")
+        self.assertEqual(follower.refresh(), 1)
+        self.assertEqual(follower.rebuilds, 1)
+        self.assertMatchesFullRebuild(follower)
+
+    def test_follow_rotated(self):
+        self.write("".join(self.lines[:3]), "w")
+        follower = weather.SummaryFollower(self.path)
+        follower.refresh()
+        replacement = os.path.join(self.directory, "new.csv")
+        with open(replacement, "w") as file:
+            file.write("date,min,max\n2021-07-02T07:00:00+08:00,49,67\n2021-07-03T07:00:00+08:00,57,68\n2021-07-04T07:00:00+08:00,56,62\n")
+        os.replace(replacement, self.path)
+        follower.refresh()
+        self.assertEqual(follower.rebuilds, 1)
+        self.assertMatchesFullRebuild(follower)
+
+    def test_follow_rewritten_in_place(self):
+        self.write("".join(self.lines[:3]), "w")
+        follower = weather.SummaryFollower(self.path)
+        follower.refresh()
+        self.write("date,min,max\n2021-07-02T07:00:00+08:00,49,67\n2021-07-03T07:00:00+08:00,57,68\n2021-07-04T07:00:00+08:00,56,62\n", "r+")
+        follower.refresh()
+        self.assertEqual(follower.rebuilds, 1)
+        self.assertMatchesFullRebuild(follower)
+
+    def test_follow_compressed_file(self):
+        with open("tests/data/example_one.csv", "rb") as source, open(self.path, "wb") as file:
+            file.write(gzip.compress(source.read()))
+        with self.assertRaises(ValueError):
+            weather.SummaryFollower(self.path).refresh()
+        with self.assertRaises(ValueError):
+            weather.main(["follow", self.path, "--count", "1"])
+
+    def test_follow_command(self):
+        shutil.copy("tests/data/example_one.csv", self.path)
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            weather.main(["follow", self.path, "--count", "2", "--interval", "0"])
+        with open("tests/expected_output/example_one_summary.txt", encoding="utf8") as txt_file:
+            self.assertEqual(txt_file.read() + "\n", stdout.getvalue())
@@ -0,0 +1,182 @@
+import asyncio
+import contextlib
+import io
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import unittest
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+import weather
+
+
+class SummaryServiceTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        for name in ("example_one", "example_two"):
+            shutil.copy(f"tests/data/{name}.csv", self.root)
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.addCleanup(self.executor.shutdown)
+
+    def make_service(self, **options):
+        service = weather.SummaryService(self.root, executor=self.executor, **options)
+        self.addCleanup(service.close)
+        return service
+
+    def read_expected(self, name):
+        with open(f"tests/expected_output/{name}.txt", encoding="utf8") as txt_file:
+            return txt_file.read()
+
+    def test_get_summaries(self):
+        service = self.make_service()
+
+        async def run():
+            return (await service.get("example_one.csv"), await service.get("example_two.csv", "daily"))
+
+        summary, daily = asyncio.run(run())
+        self.assertEqual(self.read_expected("example_one_summary"), summary)
+        self.assertEqual(self.read_expected("example_two_daily_summary"), daily)
+
+    def test_concurrent_requests_are_coalesced(self):
+        service = self.make_service()
+
+        async def run():
+            return await asyncio.gather(*(service.get("example_one.csv") for _ in range(10)))
+
+        results = asyncio.run(run())
+        self.assertEqual(results, [self.read_expected("example_one_summary")] * 10)
+        self.assertEqual(service.stats(), {"hits": 0, "misses": 1, "coalesced": 9, "cached": 1, "pending": 0})
+
+    def test_cache_hits_and_file_changes(self):
+        service = self.make_service()
+        path = os.path.join(self.root, "example_one.csv")
+
+        async def run():
+            first = await service.get("example_one.csv")
+            second = await service.get("example_one.csv")
+            with open(path, "a") as file:
+                file.write("2021-07-07T07:00:00+08:00,10,20\n")
+            third = await service.get("example_one.csv")
+            return first, second, third
+
+        first, second, third = asyncio.run(run())
+        self.assertEqual(first, second)
+        self.assertEqual(third, weather.generate_summary(weather.load_data_from_csv(path)))
+        self.assertEqual((service.hits, service.misses), (1, 2))
+
+    def test_ttl_and_lru_eviction(self):
+        service = self.make_service(cache_size=1, ttl=0.05)
+
+        async def run():
+            await service.get("example_one.csv")
+            await service.get("example_two.csv")
+            await service.get("example_two.csv")
+            await asyncio.sleep(0.1)
+            await service.get("example_two.csv")
+
+        asyncio.run(run())
+        self.assertEqual(service.stats(), {"hits": 1, "misses": 3, "coalesced": 0, "cached": 1, "pending": 0})
+
+    def test_errors(self):
+        service = self.make_service()
+        with open(os.path.join(self.root, "short.csv"), "w") as file:
+            file.write("date,min,max\n2021-07-02T07:00:00+08:00,49\n")
+        with self.assertRaises(FileNotFoundError):
+            asyncio.run(service.get("missing.csv"))
+        with self.assertRaises(PermissionError):
+            asyncio.run(service.get("../example_one.csv"))
+        with self.assertRaises(ValueError):
+            asyncio.run(service.get("example_one.csv", "weekly"))
+        with self.assertRaises(ValueError):
+            asyncio.run(service.get("short.csv"))
+        self.assertEqual(service.stats()["cached"], 0)
+
+    def http(self, service, *lines):
+        """Sends requests to the service over one connection and returns (status, body) pairs."""
+
+        async def request(port):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            responses = []
+            for line in lines:
+                writer.write(line.encode("latin-1"))
+                status_line = await reader.readline()
+                if not status_line:
+                    # the server dropped the connection
+                    responses.append((None, ""))
+                    break
+                status = status_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while (header := await reader.readline()) != b"\r\n":
+                    name, _, value = header.decode("latin-1").partition(":")
+                    headers[name.lower()] = value.strip()
+                body = await reader.readexactly(int(headers["content-length"]))
+                responses.append((int(status[1]), body.decode("utf8")))
+            writer.close()
+            await writer.wait_closed()
+            return responses
+
+        async def run():
+            server = await service.start("127.0.0.1", 0)
+            async with server:
+                return await request(server.sockets[0].getsockname()[1])
+
+        return asyncio.run(run())
+
+    def test_http(self):
+        service = self.make_service()
+        responses = self.http(service,
+                              "GET /summary?path=example_one.csv HTTP/1.1\r\nHost: x\r\n\r\n",
+                              "GET /daily?path=example_two.csv HTTP/1.1\r\n\r\n",
+                              "GET /summary?path=missing.csv HTTP/1.1\r\n\r\n",
+                              "GET /summary?path=..%2Fexample_one.csv HTTP/1.1\r\n\r\n",
+                              "GET /summary HTTP/1.1\r\n\r\n",
+                              "GET /weekly?path=example_one.csv HTTP/1.1\r\n\r\n",
+                              "POST /summary?path=example_one.csv HTTP/1.1\r\nContent-Length: 2\r\n\r\n{}",
+                              "GET /stats HTTP/1.1\r\n\r\n")
+        self.assertEqual(responses[0], (200, self.read_expected("example_one_summary")))
+        self.assertEqual(responses[1], (200, self.read_expected("example_two_daily_summary")))
+        self.assertEqual([code for code, _ in responses[2:7]], [404, 403, 400, 404, 405])
+        self.assertEqual(json.loads(responses[7][1])["misses"], 2)
+
+    def test_http_bad_paths_and_errors(self):
+        service = self.make_service()
+        responses = self.http(service,
+                              "GET /summary?path=example_one.csv/x HTTP/1.1\r\n\r\n",
+                              f"GET /summary?path={'x' * 5000}.csv HTTP/1.1\r\n\r\n",
+                              "GET /summary?path=example_one.csv HTTP/1.1\r\n\r\n")
+        self.assertEqual([code for code, _ in responses], [404, 400, 200])
+
+        async def broken(path, kind="summary"):
+            raise RuntimeError("broken")
+
+        service.get = broken
+        with contextlib.redirect_stderr(io.StringIO()) as stderr:
+            responses = self.http(service,
+                                  "GET /summary?path=example_one.csv HTTP/1.1\r\n\r\n",
+                                  "GET /stats HTTP/1.1\r\n\r\n")
+        self.assertEqual([code for code, _ in responses], [500, 200])
+        self.assertIn("RuntimeError: broken", stderr.getvalue())
+
+    @unittest.skipIf(sys.platform == "win32", "Windows has no SIGTERM handlers")
+    def test_serve_stops_on_sigterm(self):
+        process = subprocess.Popen([sys.executable, "-m", "weather", "serve", self.root, "--port", "0", "-j", "1"],
+                                   stderr=subprocess.PIPE, text=True)
+        self.addCleanup(process.stderr.close)
+        self.addCleanup(process.kill)
+        port = int(process.stderr.readline().rsplit(":", 1)[1].strip("/\n"))
+        # the first summary starts the worker process
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/summary?path=example_one.csv") as response:
+            self.assertEqual(response.read().decode("utf8"), self.read_expected("example_one_summary"))
+        process.send_signal(signal.SIGTERM)
+        self.assertEqual(process.wait(timeout=30), 0)
+        self.assertEqual(process.stderr.read(), "")
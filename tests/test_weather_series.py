@@ -0,0 +1,90 @@
+import unittest
+from array import array
+import weather
+
+
+class WeatherSeriesTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+        self.example_one = [
+            ["2021-07-02T07:00:00+08:00", 49, 67],
+            ["2021-07-03T07:00:00+08:00", 57, 68],
+            ["2021-07-04T07:00:00+08:00", 56, 62],
+            ["2021-07-05T07:00:00+08:00", 55, 61],
+            ["2021-07-06T07:00:00+08:00", 53, 62]
+        ]
+        self.example_three = [
+            ["2020-06-19T07:00:00+08:00", -47, -46],
+            ["2020-06-20T07:00:00+08:00", -51, 67],
+            ["2020-06-21T07:00:00+08:00", 58, 72],
+            ["2020-06-22T07:00:00+08:00", 59, 71],
+            ["2020-06-23T07:00:00+08:00", -52, 71],
+            ["2020-06-24T07:00:00+08:00", 52, 67],
+            ["2020-06-25T07:00:00+08:00", -48, 66],
+            ["2020-06-26T07:00:00+08:00", 53, 66]
+        ]
+
+    def test_series_rows(self):
+        series = weather.WeatherSeries(self.example_one)
+        self.assertEqual(len(series), 5)
+        self.assertListEqual(list(series), self.example_one)
+        self.assertEqual(series[1], ["2021-07-03T07:00:00+08:00", 57.0, 68.0])
+
+    def test_series_columns(self):
+        series = weather.WeatherSeries(self.example_one)
+        self.assertEqual(series.minimums, array("d", [49, 57, 56, 55, 53]))
+        self.assertEqual(series.maximums, array("d", [67, 68, 62, 61, 62]))
+        self.assertEqual(series.timestamps[0], 1625180400.0)
+        self.assertEqual(series.utc_offsets[0], 8 * 3600)
+
+    def test_series_slice(self):
+        series = weather.WeatherSeries(self.example_one)
+        self.assertListEqual(list(series[1:3]), self.example_one[1:3])
+
+    def test_series_unparsable_date(self):
+        series = weather.WeatherSeries([["not a date", 1, 2]])
+        self.assertNotEqual(series.timestamps[0], series.timestamps[0])
+
+    def test_series_find_min_max(self):
+        series = weather.WeatherSeries(self.example_three)
+        self.assertEqual(weather.find_min(series), (-52.0, 4))
+        self.assertEqual(weather.find_max(series), (72.0, 2))
+        self.assertEqual(weather.find_min(series.maximums), (-46.0, 0))
+
+    def test_series_calculate_mean(self):
+        series = weather.WeatherSeries(self.example_one)
+        self.assertEqual(weather.calculate_mean(series.minimums), 54)
+        with self.assertRaisesRegex(TypeError, "series.minimums or series.maximums"):
+            weather.calculate_mean(series)
+
+    def test_series_generate_summary(self):
+        with open("tests/expected_output/example_three_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        result = weather.generate_summary(weather.WeatherSeries(self.example_three))
+        self.assertEqual(expected_result, result)
+
+    def test_series_generate_daily_summary(self):
+        with open("tests/expected_output/example_three_daily_summary.txt", encoding="utf8") as txt_file:
+            expected_result = txt_file.read()
+        result = weather.generate_daily_summary(weather.WeatherSeries(self.example_three))
+        self.assertEqual(expected_result, result)
+
+    def test_load_csv_as_series(self):
+        result = weather.load_data_from_csv("tests/data/example_one.csv", as_series=True)
+        self.assertIsInstance(result, weather.WeatherSeries)
+        self.assertListEqual(list(result), self.example_one)
+
+    def test_from_columns_matches_append(self):
+        dates = [
+            "2021-07-02T07:00:00+08:00", "2021-07-02T07:00:00+08:00", "2021-07-02 23:59:59-05:30",
+            "2021-07-02T07:00:00Z", "2021-07-02T07:00:00", "1969-12-31T23:59:59+14:00",
+            "2021-07-02", "2021-07-02T07:00", "2021-07-02T24:00:00", "2021-02-29T07:00:00+08:00",
+            "2021-07-02T07:00:00.5+08:00", "2021-07-02T07:00:00+08:00:30", "2021-07-02x07:00:00",
+            "\N{FULLWIDTH DIGIT TWO}021-07-02T07:00:00", "not a date", "",
+        ]
+        series = weather.WeatherSeries.from_columns(dates, array("d", range(len(dates))), array("d", range(len(dates))))
+        expected = weather.WeatherSeries([date, 0, 0] for date in dates)
+        self.assertEqual(series.timestamps.tobytes(), expected.timestamps.tobytes())
+        self.assertEqual(series.utc_offsets, expected.utc_offsets)
@@ -0,0 +1,57 @@
+import io
+import os
+import tempfile
+import unittest
+import weather
+
+
+class WriteDailySummaryTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def read_expected(self, name):
+        with open(f"tests/expected_output/{name}_daily_summary.txt", encoding="utf8") as txt_file:
+            return txt_file.read()
+
+    def test_write_text_stream(self):
+        for name in ("example_one", "example_two", "example_three"):
+            stream = io.StringIO()
+            days = weather.write_daily_summary(weather.load_data_from_csv(f"tests/data/{name}.csv"), stream)
+            self.assertEqual(self.read_expected(name), stream.getvalue())
+            self.assertEqual(days, self.read_expected(name).count("----") // 2)
+
+    def test_write_binary_stream(self):
+        stream = io.BytesIO()
+        weather.write_daily_summary(weather.iter_data_from_csv("tests/data/example_two.csv"), stream)
+        self.assertEqual(self.read_expected("example_two"), stream.getvalue().decode("utf8"))
+
+    def test_write_file(self):
+        handle, path = tempfile.mkstemp(suffix=".txt")
+        os.close(handle)
+        self.addCleanup(os.remove, path)
+        with open(path, "w", encoding="utf8") as file:
+            weather.write_daily_summary(weather.iter_data_from_csv("tests/data/example_three.csv"), file)
+        with open(path, encoding="utf8") as file:
+            self.assertEqual(self.read_expected("example_three"), file.read())
+
+    def test_write_in_batches(self):
+        data = weather.load_data_from_csv("tests/data/example_two.csv") * 100
+
+        class CountingStream(io.StringIO):
+            writes = 0
+
+            def write(self, text):
+                CountingStream.writes += 1
+                return io.StringIO.write(self, text)
+
+        stream = CountingStream()
+        weather.write_daily_summary(data, stream)
+        self.assertEqual(stream.getvalue(), weather.generate_daily_summary(data))
+        self.assertEqual(CountingStream.writes, -(-len(data) // weather.DAILY_SUMMARY_BATCH))
+
+    def test_write_no_days(self):
+        stream = io.StringIO()
+        self.assertEqual(weather.write_daily_summary([], stream), 0)
+        self.assertEqual(stream.getvalue(), "\n")
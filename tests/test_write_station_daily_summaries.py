@@ -0,0 +1,40 @@
+import os
+import shutil
+import tempfile
+import unittest
+import weather
+
+
+class WriteStationDailySummariesTests(unittest.TestCase):
+
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        self.maxDiff = None
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def read(self, name):
+        with open(os.path.join(self.directory, name), encoding="utf8") as file:
+            return file.read()
+
+    def test_station_files(self):
+        days = weather.write_station_daily_summaries(weather.iter_station_data("tests/data/example_stations.csv"),
+                                                     self.directory)
+        self.assertEqual(days, {"one": 5, "two": 8})
+        for station, name in (("one", "example_one"), ("two", "example_two")):
+            with open(f"tests/expected_output/{name}_daily_summary.txt", encoding="utf8") as txt_file:
+                self.assertEqual(self.read(f"{station}.txt"), txt_file.read())
+
+    def test_batches_and_rewrites(self):
+        rows = weather.load_data_from_csv("tests/data/example_two.csv") * 70
+        pairs = [(station, row) for row in rows for station in ("x/y", "..")]
+        with open(os.path.join(self.directory, "...txt"), "w") as file:
+            file.write("old contents\n")
+        days = weather.write_station_daily_summaries(pairs, self.directory)
+        self.assertEqual(days, {"x/y": 560, "..": 560})
+        expected = weather.generate_daily_summary(rows)
+        self.assertEqual(sorted(os.listdir(self.directory)), ["...txt", "x%2Fy.txt"])
+        self.assertEqual(self.read(weather.station_file_name("x/y")), expected)
+        self.assertEqual(self.read(weather.station_file_name("..")), expected)
@@ -1,8 +1,575 @@
-import csv
-from datetime import datetime
+import io
+import os
+import sys
+from array import array
+from collections import OrderedDict, deque, namedtuple
+from bisect import bisect_left, bisect_right
+from heapq import heappush, heapreplace
+from itertools import accumulate, repeat
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from math import fsum, isfinite
+from time import perf_counter_ns
+
+# argparse, asyncio, bz2, contextlib, csv, glob, gzip, hashlib, json, lzma, mmap, re, signal, urllib.parse and
+# concurrent.futures are imported inside the functions that use them, so that "import weather" stays cheap for workers and
+# tools (see benchmarks/bench_import_time.py).
 
 DEGREE_SYMBOL = u"\N{DEGREE SIGN}C"
 
+# The fast loader reads the file in blocks of about this many bytes and parses
+# the temperatures of a block with one float() pass. When one isn't a number
+# they are parsed again in groups of _FAST_GROUP_SIZE lines, and only the group
+# with the bad one is checked row by row.
+_FAST_BLOCK_SIZE = 1 << 20
+_FAST_GROUP_SIZE = 64
+
+# The loaders recognise compressed files by their first bytes and decode them
+# while reading, with reads of DECOMPRESS_BUFFER_SIZE bytes. gzip, bz2 and lzma
+# are imported when a file needs them.
+_COMPRESSION_MAGIC = ((b"\x1f\x8b", "gzip"), (b"BZh", "bz2"), (b"\xfd7zXZ\x00", "lzma"))
+DECOMPRESS_BUFFER_SIZE = 1 << 20
+# Directories given to summarise_files contribute their files with these endings.
+_CSV_SUFFIXES = (".csv", ".csv.gz", ".csv.bz2", ".csv.xz")
+
+# The parsed-data cache written by load_series_cached: a fixed header (magic,
+# csv size, csv mtime in ns, row count, date blob length) followed by the columns.
+CACHE_SUFFIX = ".wscache"
+_CACHE_MAGIC = b"WSCACHE1"
+_CACHE_HEADER_FORMAT = "<8sqqqq"
+_CACHE_HEADER_SIZE = 40
+
+# Which implementation calculate_mean, find_min and find_max use: "python",
+# "numpy", or "auto" to use NumPy (when installed) for float arrays, series
+# columns and NumPy arrays. See set_backend().
+_BACKENDS = ("auto", "python", "numpy")
+_BACKEND = os.environ.get("WEATHER_BACKEND", "auto")
+_numpy = None
+
+# The averages match sum(), which adds floats with a running compensation
+# (Neumaier's version of Kahan summation) from Python 3.12 on, and one by one
+# before that.
+_COMPENSATED_SUM = sys.version_info >= (3, 12)
+
+# How many distinct date strings convert_date remembers.
+DATE_CACHE_SIZE = 4096
+
+# The timestamp shape used by the weather feeds. The time and offset don't change
+# the date, but they are range checked so fromisoformat would accept them too.
+# The regex is compiled on first use.
+_FIXED_ISO_DATE_PATTERN = r"(\d{4}-\d\d-(\d\d))T(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d[+-](?:[01]\d|2[0-3]):[0-5]\d"
+_FIXED_ISO_DATE = None
+
+# The text float() accepts, so temperatures can be checked without it raising
+# ValueError: Unicode decimal digits with single underscores between them, an
+# optional fraction and exponent, or inf, infinity and nan in any case, with
+# whitespace around it (but not the \x1c-\x1f separators, which str.isspace
+# counts and float doesn't).
+# The regex is compiled on first use.
+_FLOAT_DIGITS = r"\d(?:_?\d)*"
+_FLOAT_SPACE = r"[^\S\x1c-\x1f]*"
+_FLOAT_TEXT_PATTERN = (
+    rf"{_FLOAT_SPACE}[+-]?(?:(?:{_FLOAT_DIGITS}(?:\.(?:{_FLOAT_DIGITS})?)?|\.{_FLOAT_DIGITS})"
+    rf"(?:[eE][+-]?{_FLOAT_DIGITS})?|[iI][nN][fF](?:[iI][nN][iI][tT][yY])?|[nN][aA][nN]){_FLOAT_SPACE}")
+_FLOAT_TEXT = None
+
+# How many temperature texts _classify_number remembers. Readings repeat a lot,
+# so most cells are a cache hit.
+NUMBER_CACHE_SIZE = 32768
+_NOT_A_NUMBER = object()
+
+# The timezone objects DailyReading moments share, one per UTC offset.
+_TIMEZONES = {}
+
+# date(1970, 1, 1).toordinal(), the day timestamps count from.
+_EPOCH_ORDINAL = 719163
+
+# How many days write_daily_summary formats before each write.
+DAILY_SUMMARY_BATCH = 256
+
+# Fahrenheit readings from -100.0 to 150.0 in steps of 0.1 (stored as tenths of a
+# degree) are converted through lookup tables that are filled on first use.
+_TABLE_LOW = -1000
+_TABLE_HIGH = 1500
+_CELSIUS_VALUES = []
+_CELSIUS_TEXTS = []
+
+# Names used by strftime's %A and %B in the default C locale.
+_WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_MONTH_NAMES = ("", "January", "February", "March", "April", "May", "June", "July",
+                "August", "September", "October", "November", "December")
+
+# The Instrumentation that is currently collecting figures, see Instrumentation.
+# While it is None the instrumented functions cost one extra check per call.
+_stats = None
+_STAGES = ("csv_parse", "date_parse", "unit_conversion", "formatting", "aggregation")
+_COUNTERS = {
+    "rows_loaded": "Rows read from csv files.",
+    "rows_rejected": "Csv rows skipped because a temperature isn't a number.",
+    "rows_summarised": "Rows added to generate_summary overviews.",
+    "days_written": "Days written by the daily summary.",
+}
+
+
+class Instrumentation:
+    """Collects per-stage timings and row counters while it is active.
+
+    Use it as a context manager around the code to measure:
+
+        with weather.Instrumentation() as stats:
+            print(weather.generate_summary(weather.iter_data_from_csv(path)))
+        print(stats.as_dict())
+
+    load_data_from_csv, iter_data_from_csv, generate_summary and the daily
+    summary add the time they spend in each stage (in nanoseconds) to timers:
+
+        csv_parse: reading csv rows and converting the temperatures to float.
+        date_parse: convert_date, and the timestamps of a WeatherSeries.
+        unit_conversion: turning Fahrenheit into formatted Celsius.
+        formatting: putting the summary text together (and writing it).
+        aggregation: the min, max and mean of generate_summary.
+
+    Time in a stage that runs inside another one (such as csv_parse while
+    generate_summary reads a lazy iterator) only counts for the inner stage.
+    An iter_data_from_csv iterator is timed if it was made while an
+    Instrumentation was active.
+    Only the current process is measured, so summarise_files workers aren't.
+    Entering a second Instrumentation inside a first one adds its figures to
+    the first when it exits.
+    """
+
+    def __init__(self):
+        self.timers = dict.fromkeys(_STAGES, 0)
+        self.counters = dict.fromkeys(_COUNTERS, 0)
+        # (stage, start time, _claimed_ns at the start) of the running stages
+        self._stack = []
+        # total time already added to some stage; a stage subtracts whatever
+        # was claimed while it ran, so nested stages aren't counted twice
+        self._claimed_ns = 0
+        self._previous = None
+
+    def __enter__(self):
+        global _stats
+        self._previous = _stats
+        _stats = self
+        return self
+
+    def __exit__(self, *exc_info):
+        global _stats
+        _stats = self._previous
+        self._stack = []
+        if self._previous is not None:
+            self._previous.merge(self)
+        self._previous = None
+        return False
+
+    def start(self, stage):
+        """Starts timing a stage."""
+        self._stack.append((stage, perf_counter_ns(), self._claimed_ns))
+
+    def stop(self, stage):
+        """Stops timing a stage.
+
+        Stages started inside it and never stopped (because of an error) are
+        dropped. Stopping a stage that isn't running does nothing.
+        """
+        for position in range(len(self._stack) - 1, -1, -1):
+            if self._stack[position][0] == stage:
+                break
+        else:
+            return
+        _, started, claimed = self._stack[position]
+        del self._stack[position:]
+        self.add_time(stage, perf_counter_ns() - started - (self._claimed_ns - claimed))
+
+    def add_time(self, stage, nanoseconds, claimed=False):
+        """Adds time measured by the caller to a stage.
+
+        The time is taken out of the stage that is running, if there is one,
+        unless claimed is True: then it was already taken out with claim().
+        """
+        self.timers[stage] = self.timers.get(stage, 0) + nanoseconds
+        if not claimed:
+            self._claimed_ns += nanoseconds
+
+    def claim(self, nanoseconds):
+        """Takes time out of the running stage before it is added to a timer.
+
+        For code that hands control back while it is being timed, such as a
+        generator at each yield: the stage that is running then must not
+        count the time, even though the total is only added at the end with
+        add_time(stage, total, claimed=True).
+        """
+        self._claimed_ns += nanoseconds
+
+    def count(self, name, amount=1):
+        """Adds to a counter."""
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def merge(self, other):
+        """Adds the figures of another Instrumentation to this one."""
+        for stage, nanoseconds in other.timers.items():
+            self.add_time(stage, nanoseconds)
+        for name, amount in other.counters.items():
+            self.count(name, amount)
+
+    def reset(self):
+        """Sets every timer and counter back to zero."""
+        self.timers = dict.fromkeys(self.timers, 0)
+        self.counters = dict.fromkeys(self.counters, 0)
+
+    def as_dict(self):
+        """Returns the figures as {"timers_ns": {...}, "counters": {...}}."""
+        return {"timers_ns": dict(self.timers), "counters": dict(self.counters)}
+
+    def to_prometheus(self, prefix="weather"):
+        """Returns the figures in the Prometheus text exposition format.
+
+        Args:
+            prefix: the prefix of every metric name.
+        Returns:
+            A string with one counter per stage timer (in seconds) and one
+            per row counter.
+        """
+        lines = [
+            f"# HELP {prefix}_stage_seconds_total Time spent in each processing stage.",
+            f"# TYPE {prefix}_stage_seconds_total counter",
+        ]
+        for stage, nanoseconds in self.timers.items():
+            lines.append(f'{prefix}_stage_seconds_total{{stage="{stage}"}} {nanoseconds / 1e9:.9f}')
+        for name, amount in self.counters.items():
+            lines.append(f"# HELP {prefix}_{name}_total {_COUNTERS.get(name, name.replace('_', ' ').capitalize() + '.')}")
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total {amount}")
+        return "\n".join(lines) + "\n"
+
+
+class WeatherSeries:
+    """Stores weather data as typed columns instead of a list of lists.
+
+    Dates are kept as the original ISO strings next to pre-parsed epoch
+    timestamps and UTC offsets (in seconds). Minimum and maximum temperatures
+    are stored as arrays of doubles, so they never need another float().
+
+    Iterating over a series yields [date, min, max] rows, so a series can be
+    used anywhere a list of lists is expected.
+    """
+
+    def __init__(self, rows=()):
+        self.dates = []
+        self.timestamps = array("d")
+        self.utc_offsets = array("i")
+        self.minimums = array("d")
+        self.maximums = array("d")
+        for row in rows:
+            if type(row) is DailyReading:
+                # already parsed, see DailyReading
+                timestamp, utc_offset = _moment_timestamp(row[3])
+                self.dates.append(row[0])
+                self.timestamps.append(timestamp)
+                self.utc_offsets.append(utc_offset)
+                self.minimums.append(row[1])
+                self.maximums.append(row[2])
+            else:
+                self.append(row[0], row[1], row[2])
+
+    def append(self, date, min_temp, max_temp):
+        """Adds a single reading to the end of the series.
+
+        Args:
+            date: An ISO date string.
+            min_temp: The minimum temperature, anything float() accepts.
+            max_temp: The maximum temperature, anything float() accepts.
+        """
+        # convert both temperatures first so a bad value leaves the series untouched
+        min_temp = float(min_temp)
+        max_temp = float(max_temp)
+        timestamp, utc_offset = _parse_timestamp(date)
+        self.dates.append(date)
+        self.timestamps.append(timestamp)
+        self.utc_offsets.append(utc_offset)
+        self.minimums.append(min_temp)
+        self.maximums.append(max_temp)
+
+    @classmethod
+    def from_columns(cls, dates, minimums, maximums):
+        """Builds a series from ready-made columns without copying them.
+
+        Args:
+            dates: A list of ISO date strings.
+            minimums: A float array of minimum temperatures.
+            maximums: A float array of maximum temperatures.
+        Returns:
+            A WeatherSeries using the given columns.
+        """
+        series = cls()
+        series.dates = dates
+        series.timestamps, series.utc_offsets = _parse_timestamps(dates)
+        series.minimums = minimums
+        series.maximums = maximums
+        return series
+
+    def extend(self, other):
+        """Appends every reading of another series to this one.
+
+        Args:
+            other: A WeatherSeries.
+        """
+        self.dates.extend(other.dates)
+        self.timestamps.extend(other.timestamps)
+        self.utc_offsets.extend(other.utc_offsets)
+        self.minimums.extend(other.minimums)
+        self.maximums.extend(other.maximums)
+
+    def __len__(self):
+        return len(self.dates)
+
+    def __iter__(self):
+        for date, min_temp, max_temp in zip(self.dates, self.minimums, self.maximums):
+            yield [date, min_temp, max_temp]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            part = WeatherSeries()
+            part.dates = self.dates[index]
+            part.timestamps = self.timestamps[index]
+            part.utc_offsets = self.utc_offsets[index]
+            part.minimums = self.minimums[index]
+            part.maximums = self.maximums[index]
+            return part
+        return [self.dates[index], self.minimums[index], self.maximums[index]]
+
+    def __repr__(self):
+        return f"WeatherSeries({len(self)} rows)"
+
+
+class DailyReading(namedtuple("DailyReading", ["date", "min_f", "max_f", "moment"])):
+    """One reading with its date parsed once, as made by load_data_from_csv(as_readings=True).
+
+    It's a tuple, so it can't be changed and takes no more memory than its
+    four fields, and row[0], row[1] and row[2] are the date and temperatures
+    like in the [date, min, max] lists; every function taking those rows
+    accepts readings too. The daily summary and WeatherSeries use the parsed
+    moment instead of parsing the date again.
+
+    Attributes:
+        date: The ISO date string.
+        min_f: The minimum temperature in Fahrenheit as a float.
+        max_f: The maximum temperature in Fahrenheit as a float.
+        moment: The date as a datetime, or None if it isn't an ISO date.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, date, min_f, max_f):
+        """Parses a reading.
+
+        Args:
+            date: An ISO date string.
+            min_f: The minimum temperature, anything float() accepts.
+            max_f: The maximum temperature, anything float() accepts.
+        """
+        return tuple.__new__(cls, (date, float(min_f), float(max_f), _parse_moment(date)))
+
+    def __getnewargs__(self):
+        # pickle and copy call __new__ with these, which parses the moment again
+        return self[:3]
+
+    def _replace(self, **fields):
+        """Returns a new reading with some of date, min_f and max_f replaced.
+
+        The moment always comes from the date, so it can't be replaced.
+        """
+        date = fields.pop("date", self[0])
+        min_f = fields.pop("min_f", self[1])
+        max_f = fields.pop("max_f", self[2])
+        if fields:
+            raise ValueError(f"Got unexpected field names: {list(fields)!r}")
+        return DailyReading(date, min_f, max_f)
+
+    @property
+    def min_c(self):
+        """The minimum temperature in Celsius, see convert_f_to_c."""
+        return convert_f_to_c(self[1])
+
+    @property
+    def max_c(self):
+        """The maximum temperature in Celsius, see convert_f_to_c."""
+        return convert_f_to_c(self[2])
+
+    @property
+    def day(self):
+        """The date formatted like convert_date, without parsing it again."""
+        moment = self[3]
+        if moment is None:
+            return convert_date(self[0])
+        return f"{_WEEKDAY_NAMES[moment.weekday()]} {moment.day:02} {_MONTH_NAMES[moment.month]} {moment.year}"
+
+
+def _parse_moment(iso_string):
+    """datetime.fromisoformat, or None if iso_string isn't an ISO date.
+
+    Dates with the same UTC offset share one timezone object (fromisoformat
+    makes a new one every time), which saves about 60 bytes per reading.
+    """
+    try:
+        moment = datetime.fromisoformat(iso_string)
+    except (TypeError, ValueError):
+        return None
+    zone = moment.tzinfo
+    if zone is None:
+        return moment
+    shared = _TIMEZONES.setdefault(zone, zone)
+    if shared is zone:
+        return moment
+    # the constructor is a lot quicker than moment.replace(tzinfo=shared)
+    return datetime(moment.year, moment.month, moment.day, moment.hour, moment.minute,
+                    moment.second, moment.microsecond, shared)
+
+
+def _parse_timestamp(iso_string):
+    """Parses an ISO date string into an epoch timestamp and a UTC offset.
+
+    Args:
+        iso_string: An ISO date string.
+    Returns:
+        A tuple of the epoch timestamp (NaN if the string can't be parsed) and
+        the UTC offset in seconds. Dates without an offset are treated as UTC.
+    """
+    try:
+        moment = datetime.fromisoformat(iso_string)
+    except (TypeError, ValueError):
+        return float("nan"), 0
+    return _moment_timestamp(moment)
+
+
+def _moment_timestamp(moment):
+    """The _parse_timestamp result for an already parsed datetime (or None)."""
+    if moment is None:
+        return float("nan"), 0
+    offset = moment.utcoffset()
+    if offset is None:
+        return moment.replace(tzinfo=timezone.utc).timestamp(), 0
+    return moment.timestamp(), int(offset.total_seconds())
+
+
+def _parse_timestamps(dates):
+    """_parse_timestamp for a whole column of dates.
+
+    A feed repeats the same days, times of day and UTC offsets, so a date
+    shaped like "2021-07-01T07:00:00+08:00" is split into those three parts
+    and each part is parsed only the first time it is seen. Dates of any other
+    shape go through _parse_timestamp.
+
+    Args:
+        dates: A list of ISO date strings.
+    Returns:
+        A tuple of the epoch timestamps and the UTC offsets as arrays.
+    """
+    timestamps, utc_offsets = array("d"), array("i")
+    days, clocks, zones = {}, {}, {}
+    day_of, clock_of, zone_of = days.get, clocks.get, zones.get
+    for iso_string in dates:
+        try:
+            day = day_of(iso_string[:10])
+            clock = clock_of(iso_string[10:19])
+            zone = zone_of(iso_string[19:])
+        except TypeError:
+            day = False
+        else:
+            if day is None or clock is None or zone is None:
+                day, clock, zone = _timestamp_parts(iso_string, days, clocks, zones)
+        if day is False or clock is False or zone is False:
+            timestamp, utc_offset = _parse_timestamp(iso_string)
+            timestamps.append(timestamp)
+            utc_offsets.append(utc_offset)
+        else:
+            timestamps.append(day + clock - zone)
+            utc_offsets.append(zone)
+    return timestamps, utc_offsets
+
+
+def _timestamp_parts(iso_string, days, clocks, zones):
+    """Parses the day, time of day and offset parts of a date for _parse_timestamps.
+
+    Each part is the seconds it adds to (or, for the offset, takes from) the
+    timestamp, or False if _parse_timestamp has to parse the date instead.
+    New parts are remembered in the days, clocks and zones dicts.
+    """
+    day_text, clock_text, zone_text = iso_string[:10], iso_string[10:19], iso_string[19:]
+    day = days.get(day_text)
+    if day is None:
+        day = False
+        digits = day_text[:4] + day_text[5:7] + day_text[8:]
+        if day_text[4:5] == day_text[7:8] == "-" and len(digits) == 8 and digits.isascii() and digits.isdigit():
+            try:
+                day = (date.fromisoformat(day_text).toordinal() - _EPOCH_ORDINAL) * 86400
+            except ValueError:
+                pass
+        days[day_text] = day
+    clock = clocks.get(clock_text)
+    if clock is None:
+        clock = False
+        digits = clock_text[1:3] + clock_text[4:6] + clock_text[7:]
+        if (clock_text[:1] in ("T", " ") and clock_text[3:4] == clock_text[6:7] == ":"
+                and len(digits) == 6 and digits.isascii() and digits.isdigit()):
+            hour, minute, second = int(digits[:2]), int(digits[2:4]), int(digits[4:])
+            if hour < 24 and minute < 60 and second < 60:
+                clock = hour * 3600 + minute * 60 + second
+        clocks[clock_text] = clock
+    zone = zones.get(zone_text)
+    if zone is None:
+        zone = False
+        # the offset parsed on its own, after a time of day that adds nothing
+        timestamp, utc_offset = _parse_timestamp("1970-01-01T00:00:00" + zone_text)
+        if timestamp == -utc_offset:
+            zone = utc_offset
+        zones[zone_text] = zone
+    return day, clock, zone
+
+
+def _is_float_column(values):
+    """Checks for a float array, or a memoryview of doubles as used by cached series."""
+    if isinstance(values, array):
+        return values.typecode == "d"
+    return isinstance(values, memoryview) and values.format == "d"
+
+
+def _last_extreme(values, smallest):
+    """Finds the last position of the smallest or largest value in a float array.
+
+    Args:
+        values: A non-empty float array or memoryview of doubles.
+        smallest: True to look for the minimum, False for the maximum.
+    Returns:
+        The value and it's position, using the same rules as find_min/find_max.
+    """
+    if not isinstance(values, array):
+        # a memoryview from the parsed-data cache, copied once so it can be searched
+        copy = array("d")
+        copy.frombytes(values.cast("B"))
+        values = copy
+    extreme = min(values) if smallest else max(values)
+    if extreme != extreme:
+        # NaN in the first position: the plain loop never moves away from it
+        return (values[0], 0)
+    # searching the reversed copy finds the *last* match at C speed
+    index = len(values) - 1 - values[::-1].index(extreme)
+    return (values[index], index)
+
+
+def _iter_readings(weather_data):
+    """Yields (date, min, max) tuples with float temperatures.
+
+    Args:
+        weather_data: A WeatherSeries or a list of lists.
+    """
+    if isinstance(weather_data, WeatherSeries):
+        yield from zip(weather_data.dates, weather_data.minimums, weather_data.maximums)
+        return
+    for row in weather_data:
+        yield row[0], float(row[1]), float(row[2])
+
 
 def format_temperature(temp):
     """Takes a temperature and returns it in string format with the degrees
@@ -15,9 +582,37 @@ def format_temperature(temp):
     """
     return f"{temp}{DEGREE_SYMBOL}"
 
+def _convert_fixed_iso_date(iso_string):
+    """Converts a "YYYY-MM-DDTHH:MM:SS+HH:MM" string without the general ISO parser.
+
+    Args:
+        iso_string: An ISO date string.
+    Returns:
+        The same text as convert_date, or None if the string doesn't have
+        exactly this shape (or isn't a valid date), so the caller can fall
+        back to datetime.fromisoformat.
+    """
+    global _FIXED_ISO_DATE
+    if _FIXED_ISO_DATE is None:
+        import re
+        _FIXED_ISO_DATE = re.compile(_FIXED_ISO_DATE_PATTERN, re.ASCII)
+    match = _FIXED_ISO_DATE.fullmatch(iso_string)
+    if match is None:
+        return None
+    try:
+        day = date.fromisoformat(match[1])
+    except ValueError:
+        return None
+    return f"{_WEEKDAY_NAMES[day.weekday()]} {match[2]} {_MONTH_NAMES[day.month]} {day.year}"
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
 def convert_date(iso_string):
     """Converts and ISO formatted date into a human-readable format.
 
+    Results are kept in an LRU cache of DATE_CACHE_SIZE entries, see
+    convert_date.cache_info() for the hit and miss counts.
+
     Args:
         iso_string: An ISO date string.
     Returns:
@@ -25,7 +620,10 @@ def convert_date(iso_string):
     """
     #this function assumes the input is a valid ISO date string
     #e.g. "2021-07-06T07:00:00+08:00"
-    #and converts it to a human-readable format
+    #and converts it to a human-readable format. That exact shape is handled without the general parser.
+    fixed = _convert_fixed_iso_date(iso_string)
+    if fixed is not None:
+        return fixed
     converted_date = datetime.fromisoformat(iso_string)
     # A stands for the full weekday name, d for day of the month, B for full month name, Y for year with century
     # %A %d %B %Y will format it as "Tuesday 06 July 2021"
@@ -33,6 +631,45 @@ def convert_date(iso_string):
     # where T is the time separator and +TZ
     return converted_date.strftime("%A %d %B %Y") 
 
+def _celsius_from_fahrenheit(float_temp):
+    """The plain C = (F - 32) * 5 / 9 conversion, rounded to 1 decimal place."""
+    # Convert Fahrenheit to Celsius using the formula: C = (F - 32) * 5 / 9
+    celsius_temp = (float_temp - 32) * 5 / 9
+    # Round the result to 1 decimal place
+    return round(celsius_temp, 1)
+
+
+def _fill_celsius_tables():
+    """Fills the Celsius value and text lookup tables for every tenth of a degree in range."""
+    # each entry is computed from the same float that index / 10 gives, so it is
+    # exactly what the plain conversion returns for that reading
+    values = [_celsius_from_fahrenheit(tenths / 10) for tenths in range(_TABLE_LOW, _TABLE_HIGH + 1)]
+    _CELSIUS_TEXTS[:] = [format_temperature(value) for value in values]
+    _CELSIUS_VALUES[:] = values
+
+
+def _table_index(float_temp):
+    """Finds the lookup table position of a Fahrenheit reading.
+
+    Args:
+        float_temp: float representing a temperature in Fahrenheit.
+    Returns:
+        The position in the Celsius tables, or None if the reading is out of
+        range or not a whole number of tenths of a degree.
+    """
+    tenths = float_temp * 10
+    # NaN and infinities fail this check as well
+    if not _TABLE_LOW <= tenths <= _TABLE_HIGH:
+        return None
+    index = round(tenths)
+    # only use the table when it holds exactly this float
+    if index / 10 != float_temp:
+        return None
+    if not _CELSIUS_VALUES:
+        _fill_celsius_tables()
+    return index - _TABLE_LOW
+
+
 def convert_f_to_c(temp_in_fahrenheit):
     """Converts a temperature from Fahrenheit to Celcius.
 
@@ -43,206 +680,3279 @@ def convert_f_to_c(temp_in_fahrenheit):
     """
     # Convert the input to float in case it's a string
     float_temp = float(temp_in_fahrenheit)
-    # Convert Fahrenheit to Celsius using the formula: C = (F - 32) * 5 / 9
-    celsius_temp = (float_temp - 32) * 5 / 9
-    # Round the result to 1 decimal place
-    return round(celsius_temp, 1) 
+    # readings like 64 or 64.4 come straight from the lookup table
+    index = _table_index(float_temp)
+    if index is not None:
+        return _CELSIUS_VALUES[index]
+    return _celsius_from_fahrenheit(float_temp)
+
+
+def _format_f_as_c(temp_in_fahrenheit):
+    """Converts a Fahrenheit reading to the formatted Celsius text.
+
+    Args:
+        temp_in_fahrenheit: float representing a temperature.
+    Returns:
+        The same string as format_temperature(convert_f_to_c(temp_in_fahrenheit)).
+    """
+    index = _table_index(float(temp_in_fahrenheit))
+    if index is not None:
+        return _CELSIUS_TEXTS[index]
+    return format_temperature(convert_f_to_c(temp_in_fahrenheit))
+
+
+def _load_numpy():
+    """Imports NumPy on first use.
+
+    Returns:
+        The numpy module, or None if it isn't installed.
+    """
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _numpy = numpy
+    return _numpy or None
+
+
+def set_backend(name):
+    """Chooses the implementation used by calculate_mean, find_min and find_max.
+
+    The WEATHER_BACKEND environment variable sets the starting value.
+
+    Args:
+        name: "auto" (the default) to use NumPy when it is installed and the
+            input is a float array, a series column or a NumPy array (except
+            calculate_mean of a float array or column, which the builtin sum
+            adds as fast), "numpy" to use it for every input, or "python" to
+            never use it.
+    """
+    if name not in _BACKENDS:
+        raise ValueError(f"unknown backend {name!r}, expected one of {', '.join(_BACKENDS)}")
+    if name == "numpy" and _load_numpy() is None:
+        raise ImportError("the numpy backend needs NumPy to be installed")
+    global _BACKEND
+    _BACKEND = name
+
+
+def _numpy_backend(values):
+    """Returns the numpy module if these values should go through the NumPy backend, otherwise None."""
+    if _BACKEND == "numpy" or (_BACKEND == "auto" and (_is_float_column(values) or type(values).__module__ == "numpy")):
+        return _load_numpy()
+    return None
+
+
+def _numpy_values(numpy, values):
+    """Converts values to a float64 NumPy array plus a validity mask.
+
+    Args:
+        numpy: the numpy module.
+        values: a list, float array, memoryview or NumPy array.
+    Returns:
+        A tuple of the float64 array and a boolean array marking the entries
+        float() accepts, or None instead of the mask when all of them are valid.
+    """
+    if _is_float_column(values):
+        return numpy.frombuffer(values, dtype=numpy.float64), None
+    data = numpy.asarray(values)
+    if data.dtype.kind in "biuf":
+        return data.astype(numpy.float64, copy=False), None
+    # strings or objects go through float() one by one, so the same values are accepted
+    converted = numpy.empty(data.shape, dtype=numpy.float64)
+    valid = numpy.ones(data.shape, dtype=bool)
+    for index, item in enumerate(data.tolist()):
+        try:
+            converted[index] = float(item)
+        except ValueError:
+            valid[index] = False
+    return converted, valid
+
+
+def _numpy_mean(numpy, values):
+    """calculate_mean on the NumPy backend."""
+    data, valid = _numpy_values(numpy, values)
+    if valid is not None:
+        data = data[valid]
+    if not data.size:
+        return 0.0
+    # the builtin sum adds in the same order (and with the same compensation on
+    # newer Pythons) as the pure Python path, so the result is identical; it
+    # reads the floats straight from the buffer, tolist() would first build a list
+    return sum(memoryview(numpy.ascontiguousarray(data))) / data.size
+
+
+def _numpy_extreme(numpy, values, smallest):
+    """find_min/find_max on the NumPy backend."""
+    data, valid = _numpy_values(numpy, values)
+    if not data.size:
+        return ()
+    if valid is not None and not valid.all():
+        bad = values[int(numpy.argmin(valid))]
+        raise ValueError(f"could not convert {type(bad).__name__} to float: {bad!r}")
+    if numpy.isnan(data).any():
+        # NaN compares false with everything, the plain search keeps its exact rules
+        return _last_extreme(array("d", data.tolist()), smallest)
+    # searching the reversed view returns the *last* position of the extreme
+    reversed_data = data[::-1]
+    position = numpy.argmin(reversed_data) if smallest else numpy.argmax(reversed_data)
+    index = data.size - 1 - int(position)
+    return (float(data[index]), index)
+
 
 def calculate_mean(weather_data):
     """Calculates the mean value from a list of numbers.
 
     Args:
-        weather_data: a list of numbers.
+        weather_data: a list of numbers, a float array such as
+            WeatherSeries.minimums, or a NumPy array.
     Returns:
         A float representing the mean value.
+    Raises:
+        TypeError: weather_data is a whole WeatherSeries; pass its minimums
+            or maximums column instead.
     """
+    if isinstance(weather_data, WeatherSeries):
+        raise TypeError("calculate_mean takes one column, such as series.minimums or series.maximums, "
+                        "not a whole WeatherSeries")
+    # typed columns only hold floats, so there is nothing to filter out; the
+    # builtin sum reads them as fast as NumPy can add them exactly, so the auto
+    # backend leaves them here
+    if _is_float_column(weather_data) and _BACKEND != "numpy":
+        if not weather_data:
+            return 0.0
+        return sum(weather_data) / len(weather_data)
+    numpy = _numpy_backend(weather_data)
+    if numpy is not None:
+        return _numpy_mean(numpy, weather_data)
+    if not isinstance(weather_data, (list, tuple)):
+        weather_data = list(weather_data)
     # start with empty list to store numeric values
     numeric_values =[]
-    # iterate through the weather_data list , this is done by for loops
-    for item in weather_data:
-        # try block attempts to convert each item to a float
+    # float() converts the values a group at a time, like the fast loader;
+    # only a group with a bad value is checked item by item
+    for start in range(0, len(weather_data), _FAST_GROUP_SIZE):
+        group = weather_data[start:start + _FAST_GROUP_SIZE]
         try:
-            numeric_values.append(float(item))
-        # If the conversion fails (e.g., item is "N/A" or "abc"), Python raises a ValueError.    # 
-        # except ValueError: pass tells Python to ignore that error and continue with the next item.
+            numeric_values += list(map(float, group))
+            continue
         except ValueError:
-           pass 
+            pass
+        # iterate through the group , this is done by for loops
+        for item in group:
+            # strings are checked without converting them (e.g. "N/A" or "abc" are
+            # skipped), anything else is converted and skipped if float() refuses it
+            if type(item) is str:
+                number = _classify_number(item)
+                if number is not _NOT_A_NUMBER:
+                    numeric_values.append(number)
+                continue
+            try:
+                numeric_values.append(float(item))
+            except ValueError:
+               pass 
     # if numeric_values is empty, return 0.0 to avoid division by zero
     # otherwise, return the mean value which is the sum of my appended list divided by length of the appended list.  
     if not numeric_values:
         return 0.0
     return sum(numeric_values) / len(numeric_values)
 
-def load_data_from_csv(csv_file):
-    """Reads a csv file and stores the data in a list.
+@lru_cache(maxsize=NUMBER_CACHE_SIZE)
+def _classify_number(text):
+    """Checks whether float() would accept a string, without it raising.
+
+    Results are kept in an LRU cache of NUMBER_CACHE_SIZE entries.
 
     Args:
-        csv_file: a string representing the file path to a csv file.
+        text: A string, such as a temperature cell from a csv file.
     Returns:
-        A list of lists, where each sublist is a (non-empty) line in the csv file.
+        The float value of text, or _NOT_A_NUMBER if it isn't a number.
     """
-    # This function need to load data from csv. To store my data I start with empty list.
-    data=[]
+    # Plain ASCII numbers like "-12.5" are converted without the regex. Placeholders
+    # such as "N/A", "--" or "" don't end in a digit; float() only refuses odd
+    # texts like "1,5" here.
+    if text.isascii() and "0" <= text[-1:] <= "9":
+        try:
+            return float(text)
+        except ValueError:
+            return _NOT_A_NUMBER
+    global _FLOAT_TEXT
+    if _FLOAT_TEXT is None:
+        import re
+        _FLOAT_TEXT = re.compile(_FLOAT_TEXT_PATTERN)
+    return float(text) if _FLOAT_TEXT.fullmatch(text) else _NOT_A_NUMBER
 
-    #With open is default method and csv_file is the argument in my function and it is as a file. 
-    with open(csv_file, "r") as file:
-        # if I get value error ,it ignores and continue and I return to this stored list which is data. 
-        reader=csv.reader(file)
-        next(reader) # Skip the header row
-        #To read each row in my reader I use for loop
-        for row in reader:
-            # If row is empty date is the 0th index of the row. 
-            if row!=[]:
-                date=row[0]
-                try:
-                    #And it converts the index 1 to to float and stores in min_temp, and index 2 to is converted float and stored max temp.     # 
-                    min_temp=float(row[1])
-                    max_temp=float(row[2])
-                    # I add each date to each other and min temp and max temp together. it is like apple by apple, orange by orange. 
-                    data.append([date, min_temp, max_temp])
-                    # if I get value error ,it ignores and continue and I return to this stored list which is data.     
-                except ValueError:
-                    continue
-    return data                
-        
-def find_min(weather_data):
-    """Calculates the minimum value in a list of numbers.
+
+def _compression(file):
+    """Tells which module decodes a file, from its first bytes.
 
     Args:
-        weather_data: A list of numbers.
+        file: a file opened in binary mode, at its start; nothing is consumed.
     Returns:
-        The minimum value and it's position in the list. (In case of multiple matches, return the index of the *last* example in the list.)
+        "gzip", "bz2" or "lzma", or None for a file that isn't compressed.
     """
-    if not weather_data:
-        return ()
-    min_index=0
-    min_value=float(weather_data[0])
-    for index, value in enumerate(weather_data):
-        if float(value)<=min_value:
-            min_index=index
-            min_value=float(value)
-    return (min_value,min_index)        
-   
-def find_max(weather_data):
-    """Calculates the maximum value in a list of numbers.
+    head = file.peek(6)[:6]
+    for magic, module in _COMPRESSION_MAGIC:
+        if head.startswith(magic):
+            return module
+    return None
+
+
+def _open_compressed(file, module, binary=False):
+    """Wraps a compressed file so that reading it gives the decoded bytes or text.
+
+    Args:
+        file: the compressed file, opened in binary mode; closing the
+            returned stream closes it too.
+        module: "gzip", "bz2" or "lzma", as _compression tells.
+        binary: if True, return a binary stream instead of a text one.
+    """
+    if module == "gzip":
+        import gzip
+        decoder = gzip.GzipFile(fileobj=file, mode="rb")
+    elif module == "bz2":
+        import bz2
+        decoder = bz2.BZ2File(file, "rb")
+    else:
+        import lzma
+        decoder = lzma.LZMAFile(file, "rb")
+    stream = io.BufferedReader(_DecodedStream(decoder, file), buffer_size=DECOMPRESS_BUFFER_SIZE)
+    return stream if binary else io.TextIOWrapper(stream)
+
+
+class _DecodedStream(io.RawIOBase):
+    """The raw side of a decompressing file, for io.BufferedReader.
+
+    GzipFile and friends are Python classes, so their closed property costs a
+    Python call, and TextIOWrapper asks for it on every line. Here it is the
+    built-in one.
+    """
+
+    def __init__(self, decoder, file):
+        self._decoder = decoder
+        # the decoders leave a file they were given open
+        self._file = file
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        return self._decoder.readinto(buffer)
+
+    def close(self):
+        if not self.closed:
+            try:
+                self._decoder.close()
+            finally:
+                self._file.close()
+        super().close()
+
+
+class _HashingReader(io.RawIOBase):
+    """The raw side of a file whose bytes are fed to a hash as they are read."""
+
+    def __init__(self, file, hasher):
+        self._file = file
+        self._hasher = hasher
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        count = self._file.readinto(buffer)
+        if count:
+            self._hasher.update(memoryview(buffer)[:count])
+        return count
+
+
+def _open_csv(csv_file, binary=False):
+    """Opens a csv file for reading, decompressing gzip, bz2 and xz files on the fly.
 
     Args:
-        weather_data: A list of numbers.
+        csv_file: a string representing the file path to a csv file, or a
+            buffered binary file at its start, which the returned one closes.
+        binary: if True, return a binary stream instead of a text one.
     Returns:
-        The maximum value and it's position in the list. (In case of multiple matches, return the index of the *last* example in the list.)
+        A file object, the same as open(csv_file, "r") (or "rb") gives for a
+        file that isn't compressed.
     """
-    # if my weather data doesnt store value, it will return to empty. 
-    if not weather_data:
-        return()
-    #To find it I need to have index and my value. I start with zeroth index and I convert zeroth value in weather data and store it in min value. 
-    max_index=0
-    max_value=float(weather_data[0])
-    #Now I need to do this for each item in my weather data. 
-    #I still need index and value and I use enumerate to get the index number of the each value.
-    for index, value in enumerate(weather_data):
-        # I convert my value to float and check if it is less than or equal to my min value which I get it from weather data and convert it to float.
-        if float(value)>=max_value:
-            #If this is true, it get the index if this and store it in the min index. and stores my value in min value until all list is gone thought the loop
-            max_index=index
-            max_value=float(value)
-    # I return to my min value and min index.         # 
-    return (max_value,max_index)   
-       
-def generate_summary(weather_data):
-    """Outputs a summary for the given weather data.
+    file = open(csv_file, "rb") if isinstance(csv_file, (str, bytes, os.PathLike)) else csv_file
+    try:
+        module = _compression(file)
+    except BaseException:
+        file.close()
+        raise
+    if module is None:
+        return file if binary else io.TextIOWrapper(file)
+    return _open_compressed(file, module, binary)
+
+
+def _parse_row(row):
+    """Turns one csv row into a [date, min, max] reading.
 
     Args:
-        weather_data: A list of lists, where each sublist represents a day of weather data.
+        row: A list of strings as produced by csv.reader.
     Returns:
-        A string containing the summary information.
+        A list with the date string and both temperatures as floats, or None if
+        the row is empty or one of the temperatures isn't a number.
     """
-    # for general summary, I need to store my summary, min and max temp and I assign them into a empty list. 
-    general_summary=[]
-    general_min_temp=[]
-    general_max_temp=[]
-    # for each item and index in the weather data  by their index number are added together. and converted to float. what I mean is index 1 is added together and index 2 are adde together. 
-    for index, value in enumerate(weather_data):
-        ###collecting data
-        general_min_temp.append(float(value[1]))
-        general_max_temp.append(float(value[2]))
-
-    #### finding min result
-    # we look at the values in the above stored indexed by using function
-    # min temp value gets the 0th value and stored it 
-    min_temp_value=find_min(general_min_temp)[0]
-    # min temp index get the first index and stores it 
-    min_temp_index=find_min(general_min_temp)[1]  
-    min_temp_date=convert_date(weather_data[min_temp_index][0] )     
-    #### finding max result
-    # same for the max temp value and index
-    max_temp_value=find_max(general_max_temp)[0]
-    max_temp_index=find_max(general_max_temp)[1]
-    max_temp_date=convert_date(weather_data[max_temp_index][0] )
-
-
-    ### calculate average for min
-    # I need to convert the sum of the general min temp to float and divide it by the length of the general min temp list.
-    # I also need to convert this to celsius and format it by using my pre defined
-    average_min_formatted=format_temperature(convert_f_to_c(sum(general_min_temp)/ len(general_min_temp)))
-
-    ### calculate average for max
-    # I need to convert the sum of the general max temp to float and divide it by the length of the general max temp list.
-    # I also need to convert this to celsius and format it by using my pre defined
-    average_max_formatted=format_temperature(convert_f_to_c(sum(general_max_temp)/ len(general_max_temp)))
-
-    ##summary
-    # I need to add all the information together in the general summary list.
-    # I need to use f string to format my string and add the information together.
-    general_summary.append(f"{len(weather_data)} Day Overview\n")
-    general_summary.append(f"  The lowest temperature will be {format_temperature(convert_f_to_c(min_temp_value))}, and will occur on {min_temp_date}.\n")
-    general_summary.append(f"  The highest temperature will be {format_temperature(convert_f_to_c(max_temp_value))}, and will occur on {max_temp_date}.\n")
-    general_summary.append(f"  The average low this week is {average_min_formatted}.\n")
-    general_summary.append(f"  The average high this week is {average_max_formatted}.\n")
-    return "".join(general_summary)        
+    # If row is empty there is nothing to read, date is the 0th index of the row.
+    if row==[]:
+        return None
+    try:
+        #And it converts the index 1 to to float and stores in min_temp, and index 2 to is converted float and stored max temp.
+        # float() is tried first: on clean rows it is cheaper than any check
+        # (_classify_number is for the callers that need to know why a value is bad)
+        return [row[0], float(row[1]), float(row[2])]
+    # if I get value error ,it ignores the row and the caller continues with the next one.
+    except ValueError:
+        if _stats is not None:
+            _stats.count("rows_rejected")
+        return None
 
-def generate_daily_summary(weather_data):
-    """Outputs a daily summary for the given weather data.
+
+def iter_data_from_csv(csv_file, chunk_size=None):
+    """Reads a csv file lazily, one row (or one chunk of rows) at a time.
+
+    The same rows are skipped as in load_data_from_csv: the header, empty rows
+    and rows where a temperature isn't a number. Compressed files are read
+    the same way as in load_data_from_csv.
 
     Args:
-        weather_data: A list of lists, where each sublist represents a day of weather data.
+        csv_file: a string representing the file path to a csv file (or an
+            open binary file, see _open_csv).
+        chunk_size: if given, yield lists of up to this many rows instead of
+            single rows.
     Returns:
-        A string containing the summary information.
+        A generator of [date, min, max] lists, or of lists of them when
+        chunk_size is given.
     """
-    #I need to store it in the daily_summary variable and sign it as aj empty list. 
-    daily_summary=[]
-    # I need to run each index of the weather data by using for loop. 
-    for i, value in enumerate(weather_data):
-        # I start with converting 0th index to a date by using my function which I described earlier.
-        date_string = convert_date(value[0])
-        # my first index is the min value which I convert to float and store it in min_f. 
-        # this is in fahrenheit  and I convert this to celsius by using my pre defined function. 
-        min_f = float(value[1])
-        # finally I format this Celsius by using the other function called format temp. 
-        min_temp = format_temperature(convert_f_to_c(min_f))
-        # I do the same for max which is the second index. 
-        #  I convert it to float and some in max_f variable .
-        max_f = float(value[2])
-        # I convert this to celsius by using my previous function. then I format this by using another function. 
-        max_temp = format_temperature(convert_f_to_c(max_f))
-        # I convert this to celsius by using my previous function. then I format this by using another function. 
-        daily_summary.append(f"---- {date_string} ----")
-        daily_summary.append(f"  Minimum Temperature: {min_temp}")
-        daily_summary.append(f"  Maximum Temperature: {max_temp}")
-        # This condition ensures:A blank line is added between each day’s summary
-        if i != len(weather_data) -1:
-            daily_summary.append("")
-
-    # daily_summary is a list of strings.
-    daily_summary.append("")
-    daily_summary.append("")
-    #"\n".join(...) joins all those strings into one big string with newlines between them.        
-    return "\n".join(daily_summary)  # Join the list into a single string       
-
-weather_data = [ 
-            ["2021-07-02T07:00:00+08:00", 49, 67],
-            ["2021-07-03T07:00:00+08:00", 57, 68],
-            ["2021-07-04T07:00:00+08:00", 56, 62],
-            ["2021-07-05T07:00:00+08:00", 55, 61],
-            ["2021-07-06T07:00:00+08:00", 53, 62]
-            ]
-print(generate_daily_summary(weather_data))
\ No newline at end of file
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    # a plain function returning the generator, so the rows don't go through a second one
+    if _stats is not None:
+        return _iter_data_timed(csv_file, chunk_size, _stats)
+    return _iter_csv_rows(csv_file, chunk_size)
+
+
+def _iter_csv_rows(csv_file, chunk_size):
+    """The iter_data_from_csv loop."""
+    import csv
+    #With open is default method and csv_file is the argument in my function and it is as a file.
+    # _open_csv decompresses gzip, bz2 and xz files while they are read.
+    with _open_csv(csv_file) as file:
+        reader=csv.reader(file)
+        next(reader, None) # Skip the header row
+        chunk=[]
+        #To read each row in my reader I use for loop
+        for row in reader:
+            reading=_parse_row(row)
+            if reading is None:
+                continue
+            if chunk_size is None:
+                yield reading
+                continue
+            chunk.append(reading)
+            if len(chunk)==chunk_size:
+                yield chunk
+                chunk=[]
+        if chunk:
+            yield chunk
+
+
+def _iter_data_timed(csv_file, chunk_size, stats):
+    """_iter_csv_rows while an Instrumentation is active, timing csv_parse."""
+    clock = perf_counter_ns
+    claim = stats.claim
+    parse_ns = 0
+    rows = 0
+    items = _iter_csv_rows(csv_file, chunk_size)
+    # the time between two rows belongs to whoever reads them, so the clock only
+    # runs until each yield; it is claimed right away in case a stage is running
+    started = clock()
+    try:
+        for item in items:
+            spent = clock() - started
+            parse_ns += spent
+            claim(spent)
+            started = None
+            rows += 1 if chunk_size is None else len(item)
+            yield item
+            started = clock()
+    finally:
+        # closes the file now if the caller stopped early
+        items.close()
+        if started is not None:
+            spent = clock() - started
+            parse_ns += spent
+            claim(spent)
+        stats.add_time("csv_parse", parse_ns, claimed=True)
+        stats.count("rows_loaded", rows)
+
+
+def iter_station_data(csv_file, station_column="station"):
+    """Reads a csv file that interleaves the readings of several stations.
+
+    The columns are found by the names in the header, so besides the station
+    column the file needs "date", "min" and "max" columns, in any order; other
+    columns are ignored. Rows are skipped the same way as in load_data_from_csv.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+        station_column: the header name of the column with the station.
+    Returns:
+        A generator of (station, [date, min, max]) pairs in file order.
+    """
+    import csv
+    with _open_csv(csv_file) as file:
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:
+            return
+        names = [name.strip() for name in header]
+        try:
+            station_index, date_index, min_index, max_index = (
+                names.index(name) for name in (station_column, "date", "min", "max"))
+        except ValueError:
+            raise ValueError(f"{csv_file} needs {station_column}, date, min and max columns, "
+                             f"found: {', '.join(names)}") from None
+        for row in reader:
+            if row == []:
+                continue
+            reading = _parse_row([row[date_index], row[min_index], row[max_index]])
+            if reading is not None:
+                yield row[station_index], reading
+
+
+def _scan_slow(lines, dates, minimums, maximums):
+    """Parses lines the fast loader couldn't match with csv.reader.
+
+    Args:
+        lines: a list of complete lines as strings, without line endings.
+        dates, minimums, maximums: the list and arrays the parsed columns are
+            appended to.
+    """
+    import csv
+    for row in csv.reader(lines):
+        reading = _parse_row(row)
+        if reading is not None:
+            dates.append(reading[0])
+            minimums.append(reading[1])
+            maximums.append(reading[2])
+
+
+def _scan_fields(lines, dates, minimums, maximums):
+    """Parses lines that all have exactly two commas, in bulk where it can.
+
+    The temperatures of all the lines go through float() at once. If one
+    isn't a number they are tried again in groups of _FAST_GROUP_SIZE, and
+    only a group with a bad temperature is checked row by row.
+
+    Args:
+        lines: a list of "date,min,max" strings, without line endings.
+        dates, minimums, maximums: the list and arrays the parsed columns are
+            appended to.
+    """
+    if not lines:
+        return
+    # with exactly two commas on every line, the fields line up in threes
+    fields = ",".join(lines).split(",")
+    try:
+        line_minimums = array("d", map(float, fields[1::3]))
+        line_maximums = array("d", map(float, fields[2::3]))
+    except ValueError:
+        pass
+    else:
+        dates.extend(fields[0::3])
+        minimums.extend(line_minimums)
+        maximums.extend(line_maximums)
+        return
+    step = 3 * _FAST_GROUP_SIZE
+    for start in range(0, len(fields), step):
+        group = fields[start:start + step]
+        try:
+            group_minimums = array("d", map(float, group[1::3]))
+            group_maximums = array("d", map(float, group[2::3]))
+        except ValueError:
+            # _parse_row inlined, the lines are known to have three fields
+            for date, low, high in zip(group[0::3], group[1::3], group[2::3]):
+                min_temp = _classify_number(low)
+                if min_temp is not _NOT_A_NUMBER:
+                    max_temp = _classify_number(high)
+                    if max_temp is not _NOT_A_NUMBER:
+                        dates.append(date)
+                        minimums.append(min_temp)
+                        maximums.append(max_temp)
+                        continue
+                if _stats is not None:
+                    _stats.count("rows_rejected")
+        else:
+            dates.extend(group[0::3])
+            minimums.extend(group_minimums)
+            maximums.extend(group_maximums)
+
+
+def _scan_text(text, dates, minimums, maximums):
+    """Parses a block of complete lines, see _scan_blocks.
+
+    Empty lines are skipped (like csv.reader does), runs of "date,min,max"
+    lines are parsed in bulk by _scan_fields and any other line goes through
+    csv.reader on its own, keeping the rows in file order.
+
+    Args:
+        text: the lines as a string, without carriage returns.
+        dates, minimums, maximums: the list and arrays the parsed columns are
+            appended to.
+    """
+    lines = text.split("\n")
+    if not lines[-1]:
+        lines.pop()
+    if "" in lines:
+        lines = list(filter(None, lines))
+    comma_counts = list(map(str.count, lines, repeat(",")))
+    if comma_counts.count(2) == len(lines):
+        _scan_fields(lines, dates, minimums, maximums)
+        return
+    start = 0
+    for index, count in enumerate(comma_counts):
+        if count != 2:
+            _scan_fields(lines[start:index], dates, minimums, maximums)
+            _scan_slow(lines[index:index + 1], dates, minimums, maximums)
+            start = index + 1
+    _scan_fields(lines[start:], dates, minimums, maximums)
+
+
+def _scan_columns(buffer):
+    """Splits a csv buffer into its date, min and max columns without csv.reader.
+
+    Args:
+        buffer: bytes or an mmap holding a whole csv file.
+    Returns:
+        A tuple of the date strings and the min and max temperatures as float
+        arrays, or None if the file uses quoting or bare carriage returns and
+        has to go through csv.reader as a whole.
+    """
+    dates, minimums, maximums = [], array("d"), array("d")
+    if buffer.find(b'"') != -1:
+        return None
+    # Skip the header row
+    start = buffer.find(b"\n") + 1
+    if start == 0 or b"\r" in buffer[:start - 2]:
+        return None if start else (dates, minimums, maximums)
+    if not _scan_blocks(buffer, start, dates, minimums, maximums):
+        return None
+    return dates, minimums, maximums
+
+
+def _scan_blocks(buffer, start, dates, minimums, maximums):
+    """Parses the lines of buffer[start:] block by block, see _scan_columns.
+
+    Args:
+        buffer: bytes or an mmap without quotes, start being a line start.
+        start: where the first line begins.
+        dates, minimums, maximums: the list and arrays the parsed columns are
+            appended to.
+    Returns:
+        False if a bare carriage return means csv.reader has to be used.
+    """
+    size = len(buffer)
+    while start < size:
+        # every block ends on a line boundary
+        stop = min(start + _FAST_BLOCK_SIZE, size)
+        if stop < size:
+            newline = buffer.rfind(b"\n", start, stop)
+            if newline == -1:
+                newline = buffer.find(b"\n", stop)
+            stop = size if newline == -1 else newline + 1
+        block = buffer[start:stop]
+        start = stop
+        if b"\r" in block:
+            block = block.replace(b"\r\n", b"\n")
+            if b"\r" in block:
+                return False
+        _scan_text(block.decode(), dates, minimums, maximums)
+    return True
+
+
+def _load_columns_fast(csv_file):
+    """Reads a csv file through mmap and returns its columns.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+    Returns:
+        A tuple of the date strings and the min and max temperatures as float
+        arrays, or None if the file has to be read by csv.reader instead.
+    """
+    import mmap
+    with open(csv_file, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return [], array("d"), array("d")
+        module = _compression(file)
+        if module is None:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                return _scan_columns(buffer)
+        with _open_compressed(file, module, binary=True) as stream:
+            return _scan_stream(stream)
+
+
+def _rows_from_columns(dates, minimums, maximums):
+    """Builds the [date, min, max] lists load_data_from_csv returns from the fast loader's columns.
+
+    The rows only hold strings and floats, so they can't be part of a
+    reference cycle, and the garbage collector is paused while they are made;
+    otherwise it goes through every row made so far again and again.
+    """
+    import gc
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return list(map(list, zip(dates, minimums.tolist(), maximums.tolist())))
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _scan_stream(stream):
+    """_scan_columns for a stream that can only be read front to back, like a compressed file.
+
+    Args:
+        stream: a binary file object at the start of the csv text.
+    Returns:
+        The same as _scan_columns.
+    """
+    dates, minimums, maximums = [], array("d"), array("d")
+    header = stream.readline()
+    if b'"' in header:
+        return None
+    if not header.endswith(b"\n"):
+        return dates, minimums, maximums
+    if b"\r" in header[:-2]:
+        return None
+    rest = b""
+    while True:
+        block = stream.read(DECOMPRESS_BUFFER_SIZE)
+        if not block:
+            block, rest = rest, b""
+        else:
+            # parse up to the last complete line, the rest waits for the next block
+            block = rest + block
+            cut = block.rfind(b"\n") + 1
+            block, rest = block[:cut], block[cut:]
+        if block.find(b'"') != -1 or not _scan_blocks(block, 0, dates, minimums, maximums):
+            return None
+        if not block and not rest:
+            return dates, minimums, maximums
+
+
+class _PackedDates:
+    """A read-only list of date strings stored as one UTF-8 blob plus offsets.
+
+    Used by series loaded from the parsed-data cache, so the dates are only
+    decoded when they are looked at.
+    """
+
+    __slots__ = ("_blob", "_offsets")
+
+    def __init__(self, blob, offsets):
+        self._blob = blob
+        self._offsets = offsets
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("date index out of range")
+        return str(self._blob[self._offsets[index]:self._offsets[index + 1]], "utf8")
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+
+def _cache_path(csv_file):
+    """The sidecar file that holds the parsed columns of a csv file."""
+    return os.fspath(csv_file) + CACHE_SUFFIX
+
+
+def _cache_layout(rows, blob_size):
+    """Works out where each column starts in a cache file.
+
+    Args:
+        rows: the number of readings.
+        blob_size: the length of the UTF-8 encoded dates.
+    Returns:
+        A tuple of the start offsets of the timestamps, minimums, maximums,
+        date offsets, UTC offsets and date blob, followed by the file size.
+    """
+    # every column starts on an 8 byte boundary so it can be cast in place
+    timestamps = _CACHE_HEADER_SIZE
+    minimums = timestamps + 8 * rows
+    maximums = minimums + 8 * rows
+    date_offsets = maximums + 8 * rows
+    utc_offsets = date_offsets + 8 * (rows + 1)
+    blob = utc_offsets + (4 * rows + 7) // 8 * 8
+    return timestamps, minimums, maximums, date_offsets, utc_offsets, blob, blob + blob_size
+
+
+def _read_series_cache(csv_file, source):
+    """Loads a series from the cache sidecar without copying the columns.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+        source: the os.stat() result of the csv file.
+    Returns:
+        A WeatherSeries whose columns are memoryviews into the mapped cache
+        file, or None if there is no cache or it doesn't match the csv file.
+    """
+    import mmap
+    import struct
+    try:
+        file = open(_cache_path(csv_file), "rb")
+    except OSError:
+        return None
+    with file:
+        size = os.fstat(file.fileno()).st_size
+        if size < _CACHE_HEADER_SIZE:
+            return None
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, source_size, source_mtime, rows, blob_size = struct.unpack_from(_CACHE_HEADER_FORMAT, buffer)
+    if magic != _CACHE_MAGIC or (source_size, source_mtime) != (source.st_size, source.st_mtime_ns):
+        return None
+    timestamps, minimums, maximums, date_offsets, utc_offsets, blob, end = _cache_layout(rows, blob_size)
+    if end != size:
+        return None
+    view = memoryview(buffer)
+    series = WeatherSeries()
+    series.timestamps = view[timestamps:minimums].cast("d")
+    series.minimums = view[minimums:maximums].cast("d")
+    series.maximums = view[maximums:date_offsets].cast("d")
+    series.utc_offsets = view[utc_offsets:utc_offsets + 4 * rows].cast("i")
+    series.dates = _PackedDates(view[blob:end], view[date_offsets:utc_offsets].cast("q"))
+    return series
+
+
+def _write_series_cache(csv_file, source, series):
+    """Writes the cache sidecar for a csv file.
+
+    The file is written under a temporary name and renamed into place, so
+    readers and other writers never see a half-written cache.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+        source: the os.stat() result of the csv file before it was parsed.
+        series: the WeatherSeries parsed from the csv file.
+    """
+    import struct
+    import tempfile
+    encoded = [date.encode("utf8") for date in series.dates]
+    date_offsets = array("q", [0])
+    for date in encoded:
+        date_offsets.append(date_offsets[-1] + len(date))
+    columns = [array("d", series.timestamps), array("d", series.minimums), array("d", series.maximums),
+               date_offsets, array("i", series.utc_offsets)]
+    if sys.byteorder != "little":
+        for column in columns:
+            column.byteswap()
+    utc_offsets_padding = b"\0" * ((-4 * len(series)) % 8)
+    path = _cache_path(csv_file)
+    handle, temporary = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".weather-", suffix=".tmp")
+    try:
+        with os.fdopen(handle, "wb") as file:
+            file.write(struct.pack(_CACHE_HEADER_FORMAT, _CACHE_MAGIC, source.st_size, source.st_mtime_ns,
+                                   len(series), date_offsets[-1]))
+            for column in columns:
+                file.write(column.tobytes())
+            file.write(utc_offsets_padding)
+            file.write(b"".join(encoded))
+        os.replace(temporary, path)
+    except BaseException:
+        os.remove(temporary)
+        raise
+
+
+def load_series_cached(csv_file):
+    """Loads a csv file as a WeatherSeries, reusing a parsed binary sidecar when possible.
+
+    The sidecar (csv_file + CACHE_SUFFIX) holds the epoch timestamps, UTC
+    offsets and float64 min/max columns. It is keyed by the size and
+    modification time of the csv file and rebuilt when either changes. A
+    cached series is mapped into memory rather than read, so its columns are
+    read-only memoryviews.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+    Returns:
+        A WeatherSeries with the same rows as load_data_from_csv.
+    """
+    source = os.stat(csv_file)
+    series = _read_series_cache(csv_file, source)
+    if series is not None:
+        return series
+    series = load_data_from_csv(csv_file, as_series=True, fast=True)
+    # only cache what was parsed if the file didn't change in the meantime
+    current = os.stat(csv_file)
+    if (current.st_size, current.st_mtime_ns) == (source.st_size, source.st_mtime_ns):
+        try:
+            _write_series_cache(csv_file, source, series)
+        except OSError:
+            # a read-only directory just means there is no cache
+            pass
+    return series
+
+
+def load_data_from_csv(csv_file, as_series=False, fast=False, as_readings=False):
+    """Reads a csv file and stores the data in a list.
+
+    Files compressed with gzip, bz2 or xz are recognised by their first bytes
+    and decompressed while they are read (fast=True reads them in blocks
+    instead of memory-mapping them), whatever their name.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+        as_series: if True, return a WeatherSeries instead of a list.
+        fast: if True, memory-map the file and parse its "date,min,max"
+            lines in bulk, a block at a time. Malformed lines still go
+            through csv.reader, so the result is the same as the default
+            loader.
+        as_readings: if True, return a list of DailyReading instead of lists.
+    Returns:
+        A list of lists, where each sublist is a (non-empty) line in the csv file.
+    """
+    if as_readings:
+        if as_series:
+            raise ValueError("as_series and as_readings can't both be used")
+        return _load_readings(csv_file, fast)
+    if _stats is not None:
+        return _load_data_timed(csv_file, as_series, fast, _stats)
+    if fast:
+        columns = _load_columns_fast(csv_file)
+        if columns is not None:
+            dates, minimums, maximums = columns
+            if as_series:
+                return WeatherSeries.from_columns(dates, minimums, maximums)
+            return _rows_from_columns(dates, minimums, maximums)
+    if as_series:
+        return WeatherSeries(iter_data_from_csv(csv_file))
+    # This function need to load data from csv, iter_data_from_csv reads it row by row and I store every row in a list.
+    return list(iter_data_from_csv(csv_file))
+
+
+def _load_readings(csv_file, fast):
+    """load_data_from_csv(as_readings=True), building each DailyReading from the parsed row."""
+    stats = _stats
+    columns = None
+    if fast:
+        if stats is not None:
+            stats.start("csv_parse")
+        try:
+            columns = _load_columns_fast(csv_file)
+        finally:
+            if stats is not None:
+                stats.stop("csv_parse")
+    if columns is not None:
+        rows = zip(*columns)
+        if stats is not None:
+            stats.count("rows_loaded", len(columns[0]))
+    else:
+        # iter_data_from_csv counts its rows and claims its own csv_parse time
+        rows = iter_data_from_csv(csv_file)
+    if stats is not None:
+        stats.start("date_parse")
+    # the rows are already checked, so the readings are made without DailyReading.__new__
+    new = tuple.__new__
+    try:
+        return [new(DailyReading, (date, min_temp, max_temp, _parse_moment(date)))
+                for date, min_temp, max_temp in rows]
+    finally:
+        if stats is not None:
+            stats.stop("date_parse")
+
+
+def _load_data_timed(csv_file, as_series, fast, stats):
+    """load_data_from_csv while an Instrumentation is active."""
+    if fast:
+        stats.start("csv_parse")
+        try:
+            columns = _load_columns_fast(csv_file)
+            if columns is not None and not as_series:
+                rows = _rows_from_columns(*columns)
+                stats.count("rows_loaded", len(rows))
+                return rows
+        finally:
+            stats.stop("csv_parse")
+        if columns is not None:
+            stats.count("rows_loaded", len(columns[0]))
+            stats.start("date_parse")
+            try:
+                return WeatherSeries.from_columns(*columns)
+            finally:
+                stats.stop("date_parse")
+    if not as_series:
+        return list(iter_data_from_csv(csv_file))
+    # the rows are parsed (csv_parse) while the series parses their timestamps
+    stats.start("date_parse")
+    try:
+        return WeatherSeries(iter_data_from_csv(csv_file))
+    finally:
+        stats.stop("date_parse")
+
+
+# One csv row load_data_with_report skipped: line is the line number in the
+# file (the header is line 1) and row the list of fields csv.reader gave.
+RejectedRow = namedtuple("RejectedRow", ["line", "reason", "row"])
+
+
+class ValidationReport:
+    """What load_data_with_report loaded and what it skipped, and why.
+
+    Attributes:
+        rows_read: rows after the header, empty ones included.
+        rows_loaded: rows that became readings.
+        empty_rows: empty rows, which are skipped without being rejected.
+        rejected: RejectedRow entries in file order (at most max_rejected of
+            them, see load_data_with_report).
+        reasons: how many rows were rejected for each reason, over all rows.
+    """
+
+    def __init__(self, max_rejected=None):
+        self.rows_read = 0
+        self.rows_loaded = 0
+        self.empty_rows = 0
+        self.rejected = []
+        self.reasons = {}
+        self.max_rejected = max_rejected
+
+    @property
+    def rows_rejected(self):
+        return sum(self.reasons.values())
+
+    def reject(self, line, reason, row):
+        """Records a rejected row.
+
+        Args:
+            line: The line number of the row.
+            reason: A short description such as "invalid min".
+            row: The list of fields in the row.
+        """
+        self.reasons[reason] = self.reasons.get(reason, 0) + 1
+        if self.max_rejected is None or len(self.rejected) < self.max_rejected:
+            self.rejected.append(RejectedRow(line, reason, row))
+
+    def format(self, limit=10):
+        """Formats the counts and the first rejected rows as text.
+
+        Args:
+            limit: how many rejected rows to list, None for all of them.
+        Returns:
+            A string with one line of totals, the count of each reason (most
+            common first) and then one line per listed rejected row.
+        """
+        lines = [f"{self.rows_read} rows read: {self.rows_loaded} loaded, "
+                 f"{self.empty_rows} empty, {self.rows_rejected} rejected"]
+        for reason, count in sorted(self.reasons.items(), key=lambda item: -item[1]):
+            lines.append(f"  {reason}: {count}")
+        listed = self.rejected if limit is None else self.rejected[:limit]
+        for rejected in listed:
+            lines.append(f"line {rejected.line}: {rejected.reason}: {','.join(rejected.row)}")
+        if len(listed) < self.rows_rejected:
+            lines.append(f"... {self.rows_rejected - len(listed)} more rejected rows")
+        return "".join(line + "\n" for line in lines)
+
+
+def _rejection_reason(row, min_temp):
+    """Says why load_data_with_report rejects a row with a bad temperature.
+
+    Args:
+        row: The csv row, with at least three fields.
+        min_temp: What the min field was classified as.
+    Returns:
+        "empty min", "invalid min", "empty max" or "invalid max", for the
+        first bad one of the two temperatures.
+    """
+    name, text = ("min", row[1]) if min_temp is _NOT_A_NUMBER else ("max", row[2])
+    if text.strip() == "":
+        return f"empty {name}"
+    return f"invalid {name}"
+
+
+def load_data_with_report(csv_file, as_series=False, max_rejected=None):
+    """Reads a csv file like load_data_from_csv and reports the rows it skipped.
+
+    Nothing is raised for bad rows: the temperatures are checked against the
+    number syntax float() accepts before they are converted. Rows with fewer
+    than three fields, which load_data_from_csv fails on, are rejected as
+    "too few columns".
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+        as_series: if True, return a WeatherSeries instead of a list.
+        max_rejected: keep at most this many RejectedRow entries in the report
+            (the counts still cover every row), None to keep them all.
+    Returns:
+        A (data, report) pair: the same data load_data_from_csv returns and a
+        ValidationReport.
+    """
+    import csv
+    report = ValidationReport(max_rejected)
+    rows = []
+    append = rows.append
+    rows_read = 0
+    if _stats is not None:
+        _stats.start("csv_parse")
+    try:
+        with _open_csv(csv_file) as file:
+            reader = csv.reader(file)
+            next(reader, None)
+            for row in reader:
+                rows_read += 1
+                if len(row) < 3:
+                    if row == []:
+                        report.empty_rows += 1
+                    else:
+                        report.reject(reader.line_num, "too few columns", row)
+                    continue
+                # the same checks as _parse_row, the reason is only worked out for bad rows
+                min_temp = _classify_number(row[1])
+                max_temp = _classify_number(row[2])
+                if min_temp is _NOT_A_NUMBER or max_temp is _NOT_A_NUMBER:
+                    report.reject(reader.line_num, _rejection_reason(row, min_temp), row)
+                    continue
+                append([row[0], min_temp, max_temp])
+    finally:
+        if _stats is not None:
+            _stats.stop("csv_parse")
+    report.rows_read = rows_read
+    report.rows_loaded = len(rows)
+    if _stats is not None:
+        _stats.count("rows_loaded", report.rows_loaded)
+        _stats.count("rows_rejected", report.rows_rejected)
+    if as_series:
+        return WeatherSeries(rows), report
+    return rows, report
+
+
+def find_min(weather_data):
+    """Calculates the minimum value in a list of numbers.
+
+    Args:
+        weather_data: A list of numbers, a float array, a NumPy array, or a
+            WeatherSeries (in which case its minimums column is searched).
+    Returns:
+        The minimum value and it's position in the list. (In case of multiple matches, return the index of the *last* example in the list.)
+    """
+    if isinstance(weather_data, WeatherSeries):
+        weather_data = weather_data.minimums
+    numpy = _numpy_backend(weather_data)
+    if numpy is not None:
+        return _numpy_extreme(numpy, weather_data, smallest=True)
+    if not weather_data:
+        return ()
+    if _is_float_column(weather_data):
+        return _last_extreme(weather_data, smallest=True)
+    min_index=0
+    min_value=float(weather_data[0])
+    for index, value in enumerate(weather_data):
+        if float(value)<=min_value:
+            min_index=index
+            min_value=float(value)
+    return (min_value,min_index)        
+   
+def find_max(weather_data):
+    """Calculates the maximum value in a list of numbers.
+
+    Args:
+        weather_data: A list of numbers, a float array, a NumPy array, or a
+            WeatherSeries (in which case its maximums column is searched).
+    Returns:
+        The maximum value and it's position in the list. (In case of multiple matches, return the index of the *last* example in the list.)
+    """
+    if isinstance(weather_data, WeatherSeries):
+        weather_data = weather_data.maximums
+    numpy = _numpy_backend(weather_data)
+    if numpy is not None:
+        return _numpy_extreme(numpy, weather_data, smallest=False)
+    # if my weather data doesnt store value, it will return to empty. 
+    if not weather_data:
+        return()
+    if _is_float_column(weather_data):
+        return _last_extreme(weather_data, smallest=False)
+    #To find it I need to have index and my value. I start with zeroth index and I convert zeroth value in weather data and store it in min value. 
+    max_index=0
+    max_value=float(weather_data[0])
+    #Now I need to do this for each item in my weather data. 
+    #I still need index and value and I use enumerate to get the index number of the each value.
+    for index, value in enumerate(weather_data):
+        # I convert my value to float and check if it is less than or equal to my min value which I get it from weather data and convert it to float.
+        if float(value)>=max_value:
+            #If this is true, it get the index if this and store it in the min index. and stores my value in min value until all list is gone thought the loop
+            max_index=index
+            max_value=float(value)
+    # I return to my min value and min index.         # 
+    return (max_value,max_index)   
+       
+RankedDay = namedtuple("RankedDay", ["temperature", "index", "date"])
+
+
+def hottest_days(weather_data, k=3):
+    """Finds the k days with the highest maximum temperature.
+
+    Only a heap of the k hottest days seen so far is kept, so this takes
+    O(n log k) time and O(k) memory, and works on iterators too.
+
+    Args:
+        weather_data: A list of lists, where each sublist represents a day of weather data,
+            a WeatherSeries, or an iterator of rows such as iter_data_from_csv.
+        k: how many days to return.
+    Returns:
+        A list of up to k RankedDay tuples (temperature, position, date),
+        hottest first. Of days with the same temperature the *last* ones are
+        kept and listed first, the same rule as find_max. NaN readings are
+        left out.
+    """
+    return _top_days(((max_temp, date) for date, _, max_temp in _iter_readings(weather_data)), k, 1.0)
+
+
+def coldest_days(weather_data, k=3):
+    """Finds the k days with the lowest minimum temperature.
+
+    Works like hottest_days, see there.
+
+    Returns:
+        A list of up to k RankedDay tuples (temperature, position, date),
+        coldest first, the last of equally cold days first.
+    """
+    return _top_days(((min_temp, date) for date, min_temp, _ in _iter_readings(weather_data)), k, -1.0)
+
+
+def _top_days(readings, k, sign):
+    """Keeps the k readings with the largest sign * temperature in a min-heap."""
+    if k < 1:
+        return []
+    # the heap holds (sign * temperature, position, date); the root is the
+    # reading that goes first, and a later position wins a tie
+    heap = []
+    for index, (temperature, date) in enumerate(readings):
+        key = sign * temperature
+        if len(heap) < k:
+            # NaN compares false, so once the heap is full it never gets in either
+            if key == key:
+                heappush(heap, (key, index, date))
+        elif key >= heap[0][0]:
+            heapreplace(heap, (key, index, date))
+    return [RankedDay(sign * key, index, date) for key, index, date in sorted(heap, reverse=True)]
+
+
+def _select_ranks(values, ranks):
+    """Finds the values at some positions of the sorted values by sampling selection.
+
+    This is Floyd and Rivest's selection: a sorted random sample gives two
+    values that almost surely bracket the wanted ones, a pass counts the
+    values below the lower one and keeps the (few) in between, and the
+    search goes on among those. The expected time is linear, about two passes
+    over the values per group of neighbouring ranks, and the values never
+    get sorted as a whole.
+
+    Args:
+        values: a list of floats without NaN.
+        ranks: a sorted list of positions in the sorted values.
+    Returns:
+        A dict from rank to value.
+    """
+    import random
+    found = {}
+    # neighbouring ranks (the two sides of an interpolated quantile) are found together
+    groups = []
+    for rank in ranks:
+        if groups and rank - groups[-1][-1] <= 1:
+            groups[-1].append(rank)
+        else:
+            groups.append([rank])
+    for group in groups:
+        part, offset = values, 0
+        while len(part) > 1024:
+            size = len(part)
+            sample_size = int(size ** (2 / 3))
+            sample = sorted(random.sample(part, sample_size))
+            gap = 3 * int(sample_size ** 0.5)
+            first = (group[0] - offset) * sample_size // size - gap
+            last = (group[-1] - offset) * sample_size // size + gap
+            # near either end (p0, p100) the sample's own ends would rarely
+            # bracket the ranks, and every miss costs a pass; infinity always does
+            low = sample[first] if first >= 0 else float("-inf")
+            high = sample[last] if last < sample_size else float("inf")
+            below = sum(map(low.__gt__, part))
+            middle = [value for value in part if low <= value <= high]
+            if offset + below <= group[0] and group[-1] < offset + below + len(middle) and len(middle) < size:
+                part, offset = middle, offset + below
+            elif len(middle) == size:
+                break
+            else:
+                # the sample missed, which is rare: start again with a new one
+                continue
+        ordered = sorted(part)
+        for rank in group:
+            found[rank] = ordered[rank - offset]
+    return found
+
+
+def _interpolate(probabilities, count, value_at):
+    """Turns order statistics into quantiles by linear interpolation.
+
+    Args:
+        probabilities: the quantiles wanted, each from 0 to 1.
+        count: the number of values.
+        value_at: a function from rank to the value at that position of the sorted values.
+    """
+    results = []
+    for probability in probabilities:
+        position = probability * (count - 1)
+        low = int(position)
+        fraction = position - low
+        value = value_at(low)
+        if fraction:
+            value += (value_at(low + 1) - value) * fraction
+        results.append(value)
+    return results
+
+
+def _wanted_ranks(probabilities, count):
+    """Returns the sorted ranks _interpolate will need."""
+    ranks = set()
+    for probability in probabilities:
+        if not 0 <= probability <= 1:
+            raise ValueError(f"quantile probabilities must be between 0 and 1, got {probability!r}")
+        position = probability * (count - 1)
+        ranks.add(int(position))
+        if position != int(position):
+            ranks.add(int(position) + 1)
+    return sorted(ranks)
+
+
+def quantiles(values, probabilities=(0.05, 0.5, 0.95)):
+    """Calculates exact quantiles of a list of numbers without sorting it.
+
+    The result is exact, with linear interpolation between the two nearest
+    values (numpy.quantile's default, statistics.quantiles' "inclusive"
+    method): the median of 1, 2, 3, 4 is 2.5. The values are found by
+    selection, which takes linear time on average and doesn't sort the
+    values (numpy.partition on the NumPy backend, see set_backend).
+
+    Args:
+        values: A list of numbers, a float array or a NumPy array. NaN values
+            are left out.
+        probabilities: the quantiles wanted, each from 0 to 1, e.g. 0.95 for p95.
+    Returns:
+        A list with one float per probability, or an empty list if there are
+        no values.
+    """
+    probabilities = list(probabilities)
+    numpy = _numpy_backend(values)
+    if numpy is not None:
+        data, valid = _numpy_values(numpy, values)
+        if valid is not None and not valid.all():
+            bad = values[int(numpy.argmin(valid))]
+            raise ValueError(f"could not convert {type(bad).__name__} to float: {bad!r}")
+        data = data[~numpy.isnan(data)]
+        if not data.size:
+            return []
+        ranks = _wanted_ranks(probabilities, data.size)
+        selected = numpy.partition(data, ranks)
+        return _interpolate(probabilities, data.size, lambda rank: float(selected[rank]))
+    data = [value for value in map(float, values) if value == value]
+    if not data:
+        return []
+    found = _select_ranks(data, _wanted_ranks(probabilities, len(data)))
+    return _interpolate(probabilities, len(data), found.__getitem__)
+
+
+class QuantileSketch:
+    """Approximate quantiles of a stream of temperatures, in bounded memory.
+
+    Readings are counted in buckets resolution wide, centred on multiples of
+    the resolution. Memory grows with the spread of the temperatures divided
+    by the resolution (about 2500 buckets for -100 to 150 degrees at 0.1),
+    not with the number of readings.
+
+    Error bound: quantiles() returns values within resolution / 2 (plus float
+    rounding) of the exact quantiles() function on the same readings. Bucketing
+    keeps the order of the readings, so each order statistic moves by at most
+    half a bucket, and so does the interpolation between two of them. With the
+    default resolution of 0.1 and readings in tenths of a degree the answers
+    are exact up to rounding.
+
+    Sketches with the same resolution merge without any extra error, so
+    several files (or worker processes) can each build one and merge them.
+    NaN and infinite readings are left out.
+
+    Args:
+        resolution: the bucket width in degrees.
+    """
+
+    def __init__(self, resolution=0.1):
+        if not resolution > 0:
+            raise ValueError("resolution must be positive")
+        self.resolution = resolution
+        self.count = 0
+        # bucket number -> readings in it; the bucket holds resolution * number
+        self.buckets = {}
+
+    def __len__(self):
+        return self.count
+
+    def add(self, value):
+        """Adds a single reading."""
+        value = float(value)
+        if isfinite(value):
+            key = round(value / self.resolution)
+            self.buckets[key] = self.buckets.get(key, 0) + 1
+            self.count += 1
+
+    def update(self, values):
+        """Adds every reading of a list of numbers, a float array or a series column.
+
+        Returns:
+            The sketch itself, so calls can be chained.
+        """
+        buckets = self.buckets
+        resolution = self.resolution
+        for value in map(float, values):
+            if isfinite(value):
+                key = round(value / resolution)
+                buckets[key] = buckets.get(key, 0) + 1
+                self.count += 1
+        return self
+
+    def merge(self, other):
+        """Adds the readings counted by another sketch with the same resolution.
+
+        Returns:
+            The sketch itself.
+        """
+        if other.resolution != self.resolution:
+            raise ValueError("only sketches with the same resolution can be merged")
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.count += other.count
+        return self
+
+    def quantiles(self, probabilities=(0.05, 0.5, 0.95)):
+        """Estimates quantiles, see the class docstring for the error bound.
+
+        Args:
+            probabilities: the quantiles wanted, each from 0 to 1.
+        Returns:
+            A list with one float per probability, or an empty list if the
+            sketch is empty.
+        """
+        probabilities = list(probabilities)
+        if not self.count:
+            return []
+        _wanted_ranks(probabilities, self.count)
+        keys = sorted(self.buckets)
+        # ends[i] is the rank just past the readings of the i-th bucket
+        ends = list(accumulate(self.buckets[key] for key in keys))
+        return _interpolate(probabilities, self.count,
+                            lambda rank: keys[bisect_right(ends, rank)] * self.resolution)
+
+
+def _add_compensated(total, error, value):
+    """Adds value to a running sum the way sum() does.
+
+    Args:
+        total: the running sum.
+        error: the compensation collected so far (always 0.0 before Python 3.12).
+        value: the float to add.
+    Returns:
+        The new (total, error) pair.
+    """
+    if not _COMPENSATED_SUM:
+        return total + value, error
+    result = total + value
+    # the rounding error of that addition, exactly
+    if abs(total) >= abs(value):
+        error += (total - result) + value
+    else:
+        error += (value - result) + total
+    return result, error
+
+
+def _compensated_total(total, error):
+    """Returns the sum() result for a running sum and its compensation."""
+    # sum() leaves out a compensation that isn't finite, so an infinite sum stays infinite
+    if error and isfinite(error):
+        return total + error
+    return total
+
+
+def _sum_error_bound(count, magnitude):
+    """A bound on how far sum() of count floats can be from their exact sum.
+
+    Args:
+        count: the number of floats.
+        magnitude: the sum of their absolute values.
+    """
+    if _COMPENSATED_SUM:
+        # within a couple of units in the last place of the sum, plus a
+        # second-order term that grows with the count
+        return 2.0 ** -52 * magnitude * (1 + count * 2.0 ** -50)
+    return 2.0 ** -52 * count * magnitude
+
+
+def _bounded_average_text(total, rounding, magnitude, count):
+    """Formats an average the way generate_summary gets it, from sum() of the values.
+
+    Args:
+        total: the sum of the values, added up some other way.
+        rounding: a bound on how far total is from the exact sum.
+        magnitude: the sum of the absolute values.
+        count: the number of values.
+    Returns:
+        The formatted average, or None if the text could depend on how the
+        values are added up.
+    """
+    average = total / count
+    # sum() of the values is off from the exact sum by at most
+    # _sum_error_bound, and both divisions round too. The format is
+    # monotonic, so the same text at both ends of the bound means the same
+    # text for both sums.
+    error = (rounding + _sum_error_bound(count, magnitude)) / count + 2.0 ** -52 * abs(average)
+    if not isfinite(error):
+        return None
+    text = _format_f_as_c(average - error)
+    if text != _format_f_as_c(average + error):
+        return None
+    return text
+
+
+class SummaryAccumulator:
+    """Builds the generate_summary overview one reading at a time.
+
+    Only the running minimum and maximum (with their position and date), the
+    sums and the count are kept, so memory use stays the same no matter how
+    many readings are added. The sums are added up the way sum() adds the
+    values, so the averages are the same as sum(values) / len(values): from
+    Python 3.12 on, min_error and max_error hold the compensation of
+    min_total and max_total (see averages()).
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.min_value = None
+        self.min_index = None
+        self.min_date = None
+        self.max_value = None
+        self.max_index = None
+        self.max_date = None
+        self.min_total = 0.0
+        self.max_total = 0.0
+        self.min_error = 0.0
+        self.max_error = 0.0
+
+    def add(self, date, min_temp, max_temp):
+        """Adds a single reading.
+
+        Args:
+            date: An ISO date string.
+            min_temp: The minimum temperature, anything float() accepts.
+            max_temp: The maximum temperature, anything float() accepts.
+        """
+        min_temp = float(min_temp)
+        max_temp = float(max_temp)
+        # <= and >= keep the *last* match, the same rule as find_min/find_max
+        if self.count == 0 or min_temp <= self.min_value:
+            self.min_value, self.min_index, self.min_date = min_temp, self.count, date
+        if self.count == 0 or max_temp >= self.max_value:
+            self.max_value, self.max_index, self.max_date = max_temp, self.count, date
+        self.min_total, self.min_error = _add_compensated(self.min_total, self.min_error, min_temp)
+        self.max_total, self.max_error = _add_compensated(self.max_total, self.max_error, max_temp)
+        self.count += 1
+
+    def update(self, weather_data):
+        """Adds every reading from the given weather data.
+
+        Args:
+            weather_data: A WeatherSeries, a list of lists or any iterable of
+                [date, min, max] rows.
+        Returns:
+            The accumulator itself, so calls can be chained.
+        """
+        # the loop works on local variables and writes the state back once at the end
+        count = self.count
+        min_value, min_index, min_date = self.min_value, self.min_index, self.min_date
+        max_value, max_index, max_date = self.max_value, self.max_index, self.max_date
+        min_total, max_total = self.min_total, self.max_total
+        min_error, max_error = self.min_error, self.max_error
+        if _COMPENSATED_SUM:
+            for date, min_temp, max_temp in _iter_readings(weather_data):
+                if count == 0 or min_temp <= min_value:
+                    min_value, min_index, min_date = min_temp, count, date
+                if count == 0 or max_temp >= max_value:
+                    max_value, max_index, max_date = max_temp, count, date
+                # _add_compensated, inlined
+                total = min_total + min_temp
+                if abs(min_total) >= abs(min_temp):
+                    min_error += (min_total - total) + min_temp
+                else:
+                    min_error += (min_temp - total) + min_total
+                min_total = total
+                total = max_total + max_temp
+                if abs(max_total) >= abs(max_temp):
+                    max_error += (max_total - total) + max_temp
+                else:
+                    max_error += (max_temp - total) + max_total
+                max_total = total
+                count += 1
+        else:
+            for date, min_temp, max_temp in _iter_readings(weather_data):
+                if count == 0 or min_temp <= min_value:
+                    min_value, min_index, min_date = min_temp, count, date
+                if count == 0 or max_temp >= max_value:
+                    max_value, max_index, max_date = max_temp, count, date
+                min_total += min_temp
+                max_total += max_temp
+                count += 1
+        self.count = count
+        self.min_value, self.min_index, self.min_date = min_value, min_index, min_date
+        self.max_value, self.max_index, self.max_date = max_value, max_index, max_date
+        self.min_total, self.max_total = min_total, max_total
+        self.min_error, self.max_error = min_error, max_error
+        return self
+
+    def merge(self, other):
+        """Adds the readings of another accumulator, as if they came after these.
+
+        The result is the same as adding all the readings to one accumulator,
+        except for the sums' rounding and when other's first reading is NaN
+        (which add never moves away from, so other's later readings are lost).
+
+        Args:
+            other: A SummaryAccumulator of the readings that follow.
+        Returns:
+            The accumulator itself, so calls can be chained.
+        """
+        if other.count == 0:
+            return self
+        # a later equal value wins, the same rule as add
+        if self.count == 0 or other.min_value <= self.min_value:
+            self.min_value, self.min_index, self.min_date = other.min_value, self.count + other.min_index, other.min_date
+        if self.count == 0 or other.max_value >= self.max_value:
+            self.max_value, self.max_index, self.max_date = other.max_value, self.count + other.max_index, other.max_date
+        self.min_total, self.min_error = _add_compensated(self.min_total, self.min_error + other.min_error, other.min_total)
+        self.max_total, self.max_error = _add_compensated(self.max_total, self.max_error + other.max_error, other.max_total)
+        self.count += other.count
+        return self
+
+    def averages(self):
+        """Returns the averages of the minimums and maximums added so far.
+
+        Returns:
+            An (average min, average max) tuple, the same as sum() of each
+            column divided by the count.
+        """
+        if self.count == 0:
+            raise ValueError("no readings to summarise")
+        return (_compensated_total(self.min_total, self.min_error) / self.count,
+                _compensated_total(self.max_total, self.max_error) / self.count)
+
+    def summary(self):
+        """Outputs the summary for every reading added so far.
+
+        Returns:
+            A string formatted exactly like generate_summary.
+        """
+        average_min, average_max = self.averages()
+        return _format_overview(
+            self.count,
+            self.min_value, convert_date(self.min_date),
+            self.max_value, convert_date(self.max_date),
+            average_min,
+            average_max,
+        )
+
+
+def _format_overview(count, min_value, min_date, max_value, max_date, average_min, average_max):
+    """Formats the "N Day Overview" block used by generate_summary.
+
+    Args:
+        count: The number of days in the overview.
+        min_value: The lowest temperature in Fahrenheit.
+        min_date: The human-readable date of the lowest temperature.
+        max_value: The highest temperature in Fahrenheit.
+        max_date: The human-readable date of the highest temperature.
+        average_min: The mean of the minimum temperatures in Fahrenheit.
+        average_max: The mean of the maximum temperatures in Fahrenheit.
+    Returns:
+        A string containing the summary information.
+    """
+    return _overview_text(count, _format_f_as_c(min_value), min_date, _format_f_as_c(max_value), max_date,
+                          _format_f_as_c(average_min), _format_f_as_c(average_max))
+
+
+def _overview_text(count, min_text, min_date, max_text, max_date, average_min_text, average_max_text):
+    """Puts the "N Day Overview" block together from already formatted parts."""
+    # I need to use f string to format my string and add the information together.
+    return (
+        f"{count} Day Overview\n"
+        f"  The lowest temperature will be {min_text}, and will occur on {min_date}.\n"
+        f"  The highest temperature will be {max_text}, and will occur on {max_date}.\n"
+        f"  The average low this week is {average_min_text}.\n"
+        f"  The average high this week is {average_max_text}.\n"
+    )
+
+
+def generate_summary(weather_data):
+    """Outputs a summary for the given weather data.
+
+    Args:
+        weather_data: A list of lists, where each sublist represents a day of weather data,
+            a WeatherSeries, or an iterator of rows such as iter_data_from_csv.
+    Returns:
+        A string containing the summary information.
+    """
+    if _stats is not None:
+        return _generate_summary_timed(weather_data, _stats)
+    # a single pass collects the min, max, sums and count, see SummaryAccumulator
+    return SummaryAccumulator().update(weather_data).summary()
+
+
+def _generate_summary_timed(weather_data, stats):
+    """generate_summary while an Instrumentation is active."""
+    accumulator = SummaryAccumulator()
+    stats.start("aggregation")
+    try:
+        accumulator.update(weather_data)
+        stats.count("rows_summarised", accumulator.count)
+        average_min, average_max = accumulator.averages()
+    finally:
+        stats.stop("aggregation")
+    stats.start("date_parse")
+    min_date, max_date = convert_date(accumulator.min_date), convert_date(accumulator.max_date)
+    stats.stop("date_parse")
+    stats.start("unit_conversion")
+    texts = [_format_f_as_c(value) for value in (accumulator.min_value, accumulator.max_value, average_min, average_max)]
+    stats.stop("unit_conversion")
+    stats.start("formatting")
+    summary = _overview_text(accumulator.count, texts[0], min_date, texts[1], max_date, texts[2], texts[3])
+    stats.stop("formatting")
+    return summary
+
+def _ordinal(number):
+    """Writes a percentile like 5, 50 or 99.9 as "5th", "50th", "99.9th"."""
+    text = f"{number:g}"
+    if text.isdigit() and int(text) % 100 not in (11, 12, 13):
+        return text + {1: "st", 2: "nd", 3: "rd"}.get(int(text) % 10, "th")
+    return text + "th"
+
+
+def generate_percentile_summary(weather_data, percentiles=(5, 50, 95), top=3):
+    """Outputs percentiles of the lows and highs and the hottest and coldest days.
+
+    The percentiles are exact, see quantiles.
+
+    Args:
+        weather_data: A list of lists, where each sublist represents a day of weather data,
+            a WeatherSeries, or an iterator of rows such as iter_data_from_csv.
+        percentiles: the percentiles to show, each from 0 to 100.
+        top: how many of the hottest and coldest days to list, 0 for none.
+    Returns:
+        A string containing the percentile information.
+    """
+    if not isinstance(weather_data, WeatherSeries):
+        weather_data = WeatherSeries(weather_data)
+    if not len(weather_data):
+        raise ValueError("no readings to summarise")
+    probabilities = [percentile / 100 for percentile in percentiles]
+    lines = []
+    if probabilities:
+        lows = quantiles(weather_data.minimums, probabilities)
+        highs = quantiles(weather_data.maximums, probabilities)
+        lines.append(f"Percentiles ({', '.join(_ordinal(percentile) for percentile in percentiles)})")
+        lines.append(f"  Lows: {', '.join(_format_f_as_c(value) for value in lows)}")
+        lines.append(f"  Highs: {', '.join(_format_f_as_c(value) for value in highs)}")
+    if top > 0:
+        for title, days in (("Hottest", hottest_days(weather_data, top)), ("Coldest", coldest_days(weather_data, top))):
+            lines.append(f"{len(days)} {title} Days")
+            for day in days:
+                lines.append(f"  {_format_f_as_c(day.temperature)} on {convert_date(day.date)}")
+    return "".join(line + "\n" for line in lines)
+
+
+PeriodSummary = namedtuple("PeriodSummary", ["period", "first_date", "last_date", "summary"])
+
+
+def rolling_summaries(weather_data, window):
+    """Outputs a summary for every run of window consecutive days.
+
+    The lowest and highest temperatures of each window come from monotonic
+    deques and the averages from prefix sums, so the whole series is handled
+    in linear time however large the window is. The prefix sums start over
+    from the window's first day every window days, which keeps their rounding
+    small; an average whose text could still come out differently (or that
+    isn't finite) is added up with sum() instead, like generate_summary does.
+
+    Args:
+        weather_data: A list of lists, where each sublist represents a day of weather data,
+            a WeatherSeries, or an iterator of rows such as iter_data_from_csv.
+        window: the number of days in each summary.
+    Returns:
+        A generator of PeriodSummary tuples, one per window, where period is
+        the position of the window's first day and summary is formatted like
+        generate_summary. Nothing is yielded if there are fewer days than window.
+    """
+    if window < 1:
+        raise ValueError("window must be at least 1")
+    rows = deque()
+    # (position, temperature, date) of the days that can still become the
+    # window's minimum (or maximum): their temperatures only go up (or down),
+    # and a later equal reading replaces an earlier one, so ties keep the last
+    # day like find_min and find_max. NaN is left out: generate_summary only
+    # ends up with it when it is the first reading, which is checked below.
+    lows = deque()
+    highs = deque()
+    # prefix sums of the temperatures and of their absolute values, from
+    # `base` days before the window's first day up to each day in the window
+    min_sums, max_sums, min_magnitudes, max_magnitudes = deque([0.0]), deque([0.0]), deque([0.0]), deque([0.0])
+    base = 0
+    for index, (date, min_temp, max_temp) in enumerate(_iter_readings(weather_data)):
+        if min_temp == min_temp:
+            while lows and lows[-1][1] >= min_temp:
+                lows.pop()
+            lows.append((index, min_temp, date))
+        if max_temp == max_temp:
+            while highs and highs[-1][1] <= max_temp:
+                highs.pop()
+            highs.append((index, max_temp, date))
+        rows.append((date, min_temp, max_temp))
+        min_sums.append(min_sums[-1] + min_temp)
+        max_sums.append(max_sums[-1] + max_temp)
+        min_magnitudes.append(min_magnitudes[-1] + abs(min_temp))
+        max_magnitudes.append(max_magnitudes[-1] + abs(max_temp))
+        if len(rows) > window:
+            rows.popleft()
+            min_sums.popleft()
+            max_sums.popleft()
+            min_magnitudes.popleft()
+            max_magnitudes.popleft()
+            base += 1
+            if base == window:
+                # start over from the window's first day; this also drops a
+                # NaN or infinity that has left the window
+                min_sums = deque(accumulate((row[1] for row in rows), initial=0.0))
+                max_sums = deque(accumulate((row[2] for row in rows), initial=0.0))
+                min_magnitudes = deque(accumulate((abs(row[1]) for row in rows), initial=0.0))
+                max_magnitudes = deque(accumulate((abs(row[2]) for row in rows), initial=0.0))
+                base = 0
+        start = index - window + 1
+        if start < 0:
+            continue
+        if lows and lows[0][0] < start:
+            lows.popleft()
+        if highs and highs[0][0] < start:
+            highs.popleft()
+        first_date, first_min, first_max = rows[0]
+        low = (start, first_min, first_date) if first_min != first_min else lows[0]
+        high = (start, first_max, first_date) if first_max != first_max else highs[0]
+        average_min_text = _prefix_average_text(min_sums[0], min_sums[-1], min_magnitudes[0], min_magnitudes[-1],
+                                                base, base + window)
+        if average_min_text is None:
+            average_min_text = _format_f_as_c(sum(row[1] for row in rows) / window)
+        average_max_text = _prefix_average_text(max_sums[0], max_sums[-1], max_magnitudes[0], max_magnitudes[-1],
+                                                base, base + window)
+        if average_max_text is None:
+            average_max_text = _format_f_as_c(sum(row[2] for row in rows) / window)
+        yield PeriodSummary(start, first_date, date, _overview_text(
+            window,
+            _format_f_as_c(low[1]), convert_date(low[2]),
+            _format_f_as_c(high[1]), convert_date(high[2]),
+            average_min_text,
+            average_max_text,
+        ))
+
+
+def _prefix_average_text(first_sum, stop_sum, first_magnitude, stop_magnitude, first, stop):
+    """Formats the average of the values between two prefix sums like generate_summary does.
+
+    Args:
+        first_sum, stop_sum: the prefix sums before the first value and after the last.
+        first_magnitude, stop_magnitude: the same prefix sums of the absolute values.
+        first, stop: how many values each prefix sum added up.
+    Returns:
+        The formatted average, or None if the values have to be added up with sum().
+    """
+    total = stop_sum - first_sum
+    # each prefix sum is off by its rounding, and the subtraction rounds once more
+    rounding = 2.0 ** -52 * (stop * stop_magnitude + first * first_magnitude + abs(total))
+    return _bounded_average_text(total, rounding, stop_magnitude - first_magnitude, stop - first)
+
+
+def group_by_station(station_rows):
+    """Builds a SummaryAccumulator per station in a single pass.
+
+    Args:
+        station_rows: an iterable of (station, [date, min, max]) pairs, such
+            as iter_station_data.
+    Returns:
+        A dict from station to its SummaryAccumulator (count, lowest and
+        highest temperature with their dates, and the totals for the means),
+        in the order the stations first appear.
+    """
+    accumulators = {}
+    for station, (date_string, min_temp, max_temp) in station_rows:
+        accumulator = accumulators.get(station)
+        if accumulator is None:
+            accumulator = accumulators[station] = SummaryAccumulator()
+        accumulator.add(date_string, min_temp, max_temp)
+    return accumulators
+
+
+def generate_station_summaries(station_rows):
+    """Outputs a summary for every station.
+
+    Args:
+        station_rows: an iterable of (station, [date, min, max]) pairs, such
+            as iter_station_data.
+    Returns:
+        A dict from station to a string formatted like generate_summary, in
+        the order the stations first appear.
+    """
+    return {station: accumulator.summary() for station, accumulator in group_by_station(station_rows).items()}
+
+
+def _calendar_day(iso_string):
+    """Returns the local calendar date of an ISO timestamp."""
+    try:
+        return date.fromisoformat(iso_string[:10])
+    except ValueError:
+        return datetime.fromisoformat(iso_string).date()
+
+
+def calendar_summaries(weather_data, period="week"):
+    """Outputs a summary for every calendar week or month in the weather data.
+
+    The days are expected in date order: consecutive days in the same week or
+    month are summarised together.
+
+    Args:
+        weather_data: A list of lists, where each sublist represents a day of weather data,
+            a WeatherSeries, or an iterator of rows such as iter_data_from_csv.
+        period: "week" for ISO weeks (Monday to Sunday) or "month".
+    Returns:
+        A generator of PeriodSummary tuples, where period is a label such as
+        "2021-W27" or "2021-07" and summary is formatted like generate_summary.
+    """
+    if period == "week":
+        def label(day):
+            year, week, _ = day.isocalendar()
+            return f"{year}-W{week:02}"
+    elif period == "month":
+        def label(day):
+            return f"{day.year}-{day.month:02}"
+    else:
+        raise ValueError(f"unknown period {period!r}, expected 'week' or 'month'")
+    current = None
+    first_date = last_date = None
+    accumulator = SummaryAccumulator()
+    day = None
+    for date_string, min_temp, max_temp in _iter_readings(weather_data):
+        # readings of the same day share a bucket, so only a new day is parsed
+        if date_string[:10] != day:
+            day = date_string[:10]
+            bucket = label(_calendar_day(date_string))
+        if bucket != current:
+            if accumulator.count:
+                yield PeriodSummary(current, first_date, last_date, accumulator.summary())
+                accumulator = SummaryAccumulator()
+            current, first_date = bucket, date_string
+        accumulator.add(date_string, min_temp, max_temp)
+        last_date = date_string
+    if accumulator.count:
+        yield PeriodSummary(current, first_date, last_date, accumulator.summary())
+
+
+class RangeIndex:
+    """Answers summaries of any time range of a series without scanning it.
+
+    Building the index sorts the readings by time and precomputes prefix sums
+    of both temperature columns and sparse tables of the positions of the
+    lowest and highest readings of every power-of-two run. A range is then
+    found with bisect in O(log n), and its lowest and highest readings and
+    sums are read in O(1).
+
+    Prefix sums aren't added up the same way as in generate_summary, so an
+    average may differ from its result in the last bits. When that could
+    change the rounded text, the range is added up the slow way instead, so
+    summary_for_range always gives exactly what generate_summary gives for
+    the same readings.
+
+    Readings whose date can't be parsed aren't part of the index.
+
+    Memory: besides the series, the index holds four prefix sum arrays (32
+    bytes per reading) and two sparse tables of about 4 * log2(n) bytes per
+    reading each, so about 200 MB for a million readings.
+
+    Args:
+        weather_data: A WeatherSeries or a list of lists, where each sublist represents a day of weather data.
+    """
+
+    def __init__(self, weather_data):
+        if not isinstance(weather_data, WeatherSeries):
+            weather_data = WeatherSeries(weather_data)
+        timestamps = weather_data.timestamps
+        # NaN isn't equal to itself: this drops the unparsable dates
+        order = [index for index in range(len(timestamps)) if timestamps[index] == timestamps[index]]
+        in_order = all(timestamps[a] <= timestamps[b] for a, b in zip(order, order[1:]))
+        if in_order and len(order) == len(timestamps):
+            series = weather_data
+        else:
+            if not in_order:
+                order.sort(key=timestamps.__getitem__)
+            series = WeatherSeries()
+            series.dates = [weather_data.dates[index] for index in order]
+            series.timestamps = array("d", (timestamps[index] for index in order))
+            series.utc_offsets = array("i", (weather_data.utc_offsets[index] for index in order))
+            series.minimums = array("d", (weather_data.minimums[index] for index in order))
+            series.maximums = array("d", (weather_data.maximums[index] for index in order))
+        self.series = series
+        minimums, maximums = series.minimums, series.maximums
+        self._min_sums = array("d", accumulate(minimums, initial=0.0))
+        self._max_sums = array("d", accumulate(maximums, initial=0.0))
+        self._min_magnitudes = array("d", accumulate(map(abs, minimums), initial=0.0))
+        self._max_magnitudes = array("d", accumulate(map(abs, maximums), initial=0.0))
+        self._min_table = self._sparse_table(minimums, smallest=True)
+        self._max_table = self._sparse_table(maximums, smallest=False)
+
+    @staticmethod
+    def _sparse_table(values, smallest):
+        """Builds the levels of a sparse table of positions.
+
+        Level k holds, for every start position, the position of the lowest
+        (or highest) value of the 2**k values from there, the last one on ties.
+        The levels are unsigned int arrays, about 4 * n * log2(n) bytes in
+        all (80 MB per table for a million readings); lists would take twice
+        that in pointers alone.
+        """
+        typecode = "I" if len(values) <= 0xFFFFFFFF else "Q"
+        # each level is worked out from the previous one as a list, which is quicker to read
+        previous = list(range(len(values)))
+        levels = [array(typecode, previous)]
+        width = 1
+        while width * 2 <= len(values):
+            if smallest:
+                previous = [b if values[b] <= values[a] else a for a, b in zip(previous, previous[width:])]
+            else:
+                previous = [b if values[b] >= values[a] else a for a, b in zip(previous, previous[width:])]
+            levels.append(array(typecode, previous))
+            width *= 2
+        return levels
+
+    def __len__(self):
+        return len(self.series)
+
+    def _bound(self, value, end):
+        """Turns a range bound into an epoch timestamp, see locate.
+
+        Returns:
+            The timestamp and whether the bound was a whole day.
+        """
+        if isinstance(value, str):
+            if len(value) != 10:
+                timestamp, _ = _parse_timestamp(value)
+                if timestamp != timestamp:
+                    raise ValueError(f"can't parse the date {value!r}")
+                return timestamp, False
+            value = date.fromisoformat(value)
+        if isinstance(value, datetime):
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=timezone.utc)
+            return value.timestamp(), False
+        if isinstance(value, date):
+            offset = self.series.utc_offsets[0] if len(self.series) else 0
+            midnight = datetime(value.year, value.month, value.day, tzinfo=timezone(timedelta(seconds=offset)))
+            # an end date takes in the whole day
+            return (midnight + timedelta(days=1) if end else midnight).timestamp(), True
+        return float(value), False
+
+    def locate(self, start=None, end=None):
+        """Finds the positions of the readings in a time range.
+
+        Args:
+            start: the first moment of the range, or None for the beginning.
+            end: the last moment of the range (included), or None for the end.
+                Both can be epoch seconds, datetimes (naive ones are UTC), ISO
+                strings, or dates ("YYYY-MM-DD" strings too). A date stands for
+                the whole day in the UTC offset of the first reading.
+        Returns:
+            A (first, stop) tuple, so self.series[first:stop] holds the readings.
+        """
+        timestamps = self.series.timestamps
+        first = 0 if start is None else bisect_left(timestamps, self._bound(start, False)[0])
+        if end is None:
+            return first, len(timestamps)
+        timestamp, whole_day = self._bound(end, True)
+        # a whole day ends just before the next midnight
+        stop = (bisect_left if whole_day else bisect_right)(timestamps, timestamp)
+        return first, max(first, stop)
+
+    def _extreme(self, table, values, first, stop, smallest):
+        # two runs of the largest power of two that fits cover the range
+        level = (stop - first).bit_length() - 1
+        a, b = table[level][first], table[level][stop - (1 << level)]
+        if smallest:
+            return b if values[b] <= values[a] else a
+        return b if values[b] >= values[a] else a
+
+    def extremes(self, first, stop):
+        """Returns the positions of the lowest minimum and the highest maximum.
+
+        Args:
+            first, stop: a non-empty range of positions, as returned by locate.
+        Returns:
+            A tuple of both positions, the last one in case of ties.
+        """
+        if not 0 <= first < stop <= len(self.series):
+            raise ValueError("empty or invalid range")
+        series = self.series
+        return (self._extreme(self._min_table, series.minimums, first, stop, True),
+                self._extreme(self._max_table, series.maximums, first, stop, False))
+
+    def _average_text(self, sums, magnitudes, values, first, stop):
+        """Formats the average of values[first:stop] like generate_summary does."""
+        text = _prefix_average_text(sums[first], sums[stop], magnitudes[first], magnitudes[stop], first, stop)
+        if text is None:
+            text = _format_f_as_c(sum(values[first:stop]) / (stop - first))
+        return text
+
+    def summary_for_range(self, start=None, end=None):
+        """Outputs a summary of the readings in a time range.
+
+        Args:
+            start, end: the range, see locate.
+        Returns:
+            A string formatted like generate_summary, the same as
+            generate_summary(self.series[first:stop]).
+        Raises:
+            ValueError: if there are no readings in the range.
+        """
+        first, stop = self.locate(start, end)
+        if first == stop:
+            raise ValueError("no readings to summarise")
+        series = self.series
+        min_index, max_index = self.extremes(first, stop)
+        return _overview_text(
+            stop - first,
+            _format_f_as_c(series.minimums[min_index]), convert_date(series.dates[min_index]),
+            _format_f_as_c(series.maximums[max_index]), convert_date(series.dates[max_index]),
+            self._average_text(self._min_sums, self._min_magnitudes, series.minimums, first, stop),
+            self._average_text(self._max_sums, self._max_magnitudes, series.maximums, first, stop),
+        )
+
+
+def _iter_daily_readings(weather_data):
+    """Yields (date, min, max, day) tuples for the daily summary.
+
+    Like _iter_readings, plus the formatted day of DailyReading rows (which
+    don't need convert_date), or None for the other rows.
+
+    Args:
+        weather_data: A WeatherSeries or an iterable of rows.
+    """
+    if isinstance(weather_data, WeatherSeries):
+        for date, min_temp, max_temp in zip(weather_data.dates, weather_data.minimums, weather_data.maximums):
+            yield date, min_temp, max_temp, None
+        return
+    for row in weather_data:
+        if type(row) is DailyReading:
+            yield row[0], row[1], row[2], row.day
+        else:
+            yield row[0], float(row[1]), float(row[2]), None
+
+
+def _daily_block(date, min_f, max_f, day=None):
+    """Formats the daily summary lines for one day, including the blank line after them.
+
+    Args:
+        date: An ISO date string.
+        min_f: The minimum temperature in Fahrenheit as a float.
+        max_f: The maximum temperature in Fahrenheit as a float.
+        day: The date already formatted by convert_date, if known.
+    Returns:
+        A string with the date heading, both temperatures and a blank line.
+    """
+    # I start with converting the date by using my function which I described earlier.
+    # min_f and max_f are in fahrenheit and I convert them to formatted celsius in one step,
+    # most readings come straight from the lookup table.
+    # A blank line is added after each day’s summary, so the days are separated and the
+    # last one ends with an empty line.
+    if day is None:
+        day = convert_date(date)
+    return _daily_text(day, _format_f_as_c(min_f), _format_f_as_c(max_f))
+
+
+def _daily_text(day, min_text, max_text):
+    """Puts one day's block together from already formatted parts."""
+    return (
+        f"---- {day} ----\n"
+        f"  Minimum Temperature: {min_text}\n"
+        f"  Maximum Temperature: {max_text}\n"
+        "\n"
+    )
+
+
+def _is_binary_stream(fileobj):
+    """Checks whether a file-like object expects bytes rather than text."""
+    if isinstance(fileobj, io.TextIOBase):
+        return False
+    return isinstance(fileobj, (io.RawIOBase, io.BufferedIOBase)) or "b" in getattr(fileobj, "mode", "")
+
+
+def write_daily_summary(weather_data, fileobj):
+    """Writes a daily summary for the given weather data to a stream, day by day.
+
+    Days are collected in batches of DAILY_SUMMARY_BATCH before each write, so
+    the whole summary is never held in memory.
+
+    Args:
+        weather_data: A list of lists, where each sublist represents a day of weather data,
+            a WeatherSeries, or an iterator of rows such as iter_data_from_csv.
+        fileobj: A text stream, or a binary stream which gets UTF-8 encoded text.
+    Returns:
+        The number of days written.
+    """
+    if _stats is not None:
+        return _write_daily_summary_timed(weather_data, fileobj, _stats)
+    binary = _is_binary_stream(fileobj)
+    write = fileobj.write
+    batch = []
+    days = 0
+    # _iter_daily_readings gives me the date and both temperatures already converted to float.
+    for date, min_f, max_f, day in _iter_daily_readings(weather_data):
+        batch.append(_daily_block(date, min_f, max_f, day))
+        days += 1
+        if len(batch) == DAILY_SUMMARY_BATCH:
+            text = "".join(batch)
+            write(text.encode("utf8") if binary else text)
+            batch = []
+    # without any days the summary is a single empty line
+    if days == 0:
+        batch.append("\n")
+    if batch:
+        text = "".join(batch)
+        write(text.encode("utf8") if binary else text)
+    return days
+
+
+def _write_daily_summary_timed(weather_data, fileobj, stats):
+    """write_daily_summary while an Instrumentation is active."""
+    binary = _is_binary_stream(fileobj)
+    write = fileobj.write
+    clock = perf_counter_ns
+    date_ns = conversion_ns = formatting_ns = 0
+    batch = []
+    days = 0
+    try:
+        # the clock is read in the loop body only, so the time spent getting
+        # the next row (csv_parse for a lazy iterator) isn't counted here
+        for date, min_f, max_f, day in _iter_daily_readings(weather_data):
+            started = clock()
+            date_text = convert_date(date) if day is None else day
+            dated = clock()
+            min_text = _format_f_as_c(min_f)
+            max_text = _format_f_as_c(max_f)
+            converted = clock()
+            # _daily_block in three timed steps
+            batch.append(_daily_text(date_text, min_text, max_text))
+            days += 1
+            if len(batch) == DAILY_SUMMARY_BATCH:
+                text = "".join(batch)
+                write(text.encode("utf8") if binary else text)
+                batch = []
+            date_ns += dated - started
+            conversion_ns += converted - dated
+            formatting_ns += clock() - converted
+        started = clock()
+        if days == 0:
+            batch.append("\n")
+        if batch:
+            text = "".join(batch)
+            write(text.encode("utf8") if binary else text)
+        formatting_ns += clock() - started
+    finally:
+        stats.add_time("date_parse", date_ns)
+        stats.add_time("unit_conversion", conversion_ns)
+        stats.add_time("formatting", formatting_ns)
+        stats.count("days_written", days)
+    return days
+
+
+def generate_daily_summary(weather_data):
+    """Outputs a daily summary for the given weather data.
+
+    Args:
+        weather_data: A list of lists, where each sublist represents a day of weather data,
+            a WeatherSeries, or an iterator of rows such as iter_data_from_csv.
+    Returns:
+        A string containing the summary information.
+    """
+    # the text is written to an in-memory stream, see write_daily_summary
+    daily_summary = io.StringIO()
+    write_daily_summary(weather_data, daily_summary)
+    return daily_summary.getvalue()
+
+def station_file_name(station):
+    """Returns the file name write_station_daily_summaries uses for a station."""
+    from urllib.parse import quote
+    # quoting keeps "/" and other awkward characters out of the name and
+    # different stations apart
+    return quote(station, safe="") + ".txt"
+
+
+def write_station_daily_summaries(station_rows, directory):
+    """Writes the daily summary of every station to its own file, streaming.
+
+    Each station's days are collected in batches of DAILY_SUMMARY_BATCH and
+    appended to directory/<station>.txt (see station_file_name), so only one
+    file is open at a time and memory use doesn't grow with the input.
+    Existing files of the stations in the input are replaced.
+
+    Args:
+        station_rows: an iterable of (station, [date, min, max]) pairs, such
+            as iter_station_data.
+        directory: the directory the files are written to; it must exist.
+    Returns:
+        A dict from station to the number of days written, in the order the
+        stations first appear.
+    """
+    batches = {}
+    days = {}
+
+    def flush(station):
+        # the first write of a station replaces an old file, later ones append
+        mode = "w" if days[station] <= DAILY_SUMMARY_BATCH else "a"
+        with open(os.path.join(directory, station_file_name(station)), mode, encoding="utf8") as file:
+            file.write("".join(batches[station]))
+        batches[station] = []
+
+    for station, (date_string, min_temp, max_temp) in station_rows:
+        batch = batches.get(station)
+        if batch is None:
+            batch = batches[station] = []
+            days[station] = 0
+        batch.append(_daily_block(date_string, float(min_temp), float(max_temp)))
+        days[station] += 1
+        if len(batch) == DAILY_SUMMARY_BATCH:
+            flush(station)
+    for station, batch in batches.items():
+        if batch:
+            flush(station)
+    return days
+
+
+class SummaryFollower:
+    """Keeps the generate_summary overview of a growing csv file up to date.
+
+    Each refresh() only parses the bytes appended since the previous one and
+    adds them to a SummaryAccumulator. If the file was truncated, replaced
+    (a different inode) or its beginning no longer matches what was read,
+    the summary is rebuilt from the start of the file.
+
+    A last line without a trailing newline is left for the next refresh, as
+    it may still be being written. Compressed files can't be followed: their
+    appended bytes don't decode on their own.
+    """
+
+    # how many bytes from the start of the file are compared to detect a rewrite
+    _PREFIX_SIZE = 256
+
+    def __init__(self, csv_file):
+        self.csv_file = csv_file
+        self.rebuilds = 0
+        self._reset(None)
+
+    def _reset(self, identity):
+        self.accumulator = SummaryAccumulator()
+        self.offset = 0
+        self._identity = identity
+        self._prefix = b""
+        self._header_skipped = False
+
+    def refresh(self):
+        """Reads the rows appended since the last refresh.
+
+        Returns:
+            The number of rows added to the summary.
+        Raises:
+            ValueError: if the file is compressed.
+        """
+        import csv
+        with open(self.csv_file, "rb") as file:
+            if _compression(file) is not None:
+                raise ValueError(f"{self.csv_file} is compressed; only a plain csv file can be followed")
+            stat = os.fstat(file.fileno())
+            identity = (stat.st_dev, stat.st_ino)
+            if identity != self._identity or stat.st_size < self.offset or file.read(len(self._prefix)) != self._prefix:
+                if self._identity is not None:
+                    self.rebuilds += 1
+                self._reset(identity)
+            file.seek(self.offset)
+            data = file.read()
+        end = data.rfind(b"\n") + 1
+        if end == 0:
+            return 0
+        if len(self._prefix) < self._PREFIX_SIZE:
+            self._prefix = (self._prefix + data[:end])[:self._PREFIX_SIZE]
+        self.offset += end
+        lines = data[:end]
+        if not self._header_skipped:
+            # Skip the header row
+            lines = lines[lines.find(b"\n") + 1:]
+            self._header_skipped = True
+        before = self.accumulator.count
+        for row in csv.reader(io.StringIO(lines.decode(), newline=None)):
+            reading = _parse_row(row)
+            if reading is not None:
+                self.accumulator.add(*reading)
+        return self.accumulator.count - before
+
+    def summary(self):
+        """Outputs the summary of every complete row read so far.
+
+        Returns:
+            A string formatted exactly like generate_summary.
+        """
+        return self.accumulator.summary()
+
+
+# ResultCache keys start with this, so a release that changes the summary
+# text can bump it instead of serving old results.
+_RESULT_KEY_VERSION = b"weather-result-1"
+_RESULT_MAGIC = b"WSRESULT1 "
+_RESULT_SUFFIX = ".result"
+# worker process -> its ResultCache per directory, see _summarise_chunk
+_worker_caches = {}
+
+
+class ResultCache:
+    """Remembers generate_summary and generate_daily_summary results by the content of their input.
+
+    The key is a BLAKE2b hash of the file bytes (or of the rows) and of the
+    summary kind, so a copy of a file, or the same file touched without
+    changes, is a hit, and any changed byte is a miss. Results are kept in
+    memory, least recently used first, and, if a directory is given, also
+    in one file per key there. Other processes can use the same directory:
+    files are written under a temporary name and renamed into place, and a
+    file that disappears or doesn't check out is just a miss. When the
+    files take more than max_disk_bytes, the least recently used ones are
+    removed until they take at most three quarters of it. The directory is
+    only listed then: each cache keeps a running total of the bytes there,
+    counted on its first write and grown by each file it writes, so files
+    written by other processes are only noticed at the next listing.
+
+    Counters:
+        hits: results found in memory.
+        disk_hits: results found in the directory.
+        misses: results that had to be computed.
+        evictions: results dropped from memory.
+        disk_evictions: files removed from the directory by this process.
+
+    Args:
+        max_entries: how many results are kept in memory.
+        directory: the directory for the on-disk results, or None for memory only.
+        max_disk_bytes: how many bytes of result files the directory may hold.
+    """
+
+    def __init__(self, max_entries=128, directory=None, max_disk_bytes=64 << 20):
+        if max_entries < 0 or max_disk_bytes < 0:
+            raise ValueError("cache sizes can't be negative")
+        self.max_entries = max_entries
+        self.directory = os.fspath(directory) if directory is not None else None
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_evictions = 0
+        # key -> text, least recently used first
+        self._memory = OrderedDict()
+        # bytes of result files in the directory as last counted, None before the first write
+        self._disk_bytes = None
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def key(source, daily=False):
+        """Returns the cache key of a summary.
+
+        Args:
+            source: a csv file path, or rows as generate_summary takes them
+                (a list of rows or a WeatherSeries, not an iterator).
+            daily: if True, the key of the daily summary instead of the overview.
+        Returns:
+            A hex string.
+        """
+        hasher = ResultCache._hasher(daily)
+        if isinstance(source, (str, bytes, os.PathLike)):
+            hasher.update(b"file\n")
+            with open(source, "rb") as file:
+                for block in iter(lambda: file.read(DECOMPRESS_BUFFER_SIZE), b""):
+                    hasher.update(block)
+        elif isinstance(source, WeatherSeries):
+            hasher.update(b"series\n")
+            hasher.update(memoryview(source.minimums).cast("B"))
+            hasher.update(memoryview(source.maximums).cast("B"))
+            hasher.update("\n".join(source.dates).encode("utf8", "surrogatepass"))
+        else:
+            # repr is exact for floats and strings, so equal keys mean equal rows
+            hasher.update(b"rows\n")
+            for start in range(0, len(source), DAILY_SUMMARY_BATCH):
+                hasher.update("\n".join(map(repr, source[start:start + DAILY_SUMMARY_BATCH])).encode("utf8", "surrogatepass"))
+                hasher.update(b"\n")
+        return hasher.hexdigest()
+
+    @staticmethod
+    def _hasher(daily):
+        import hashlib
+        return hashlib.blake2b(_RESULT_KEY_VERSION + (b" daily\n" if daily else b" summary\n"), digest_size=20)
+
+    @staticmethod
+    def _summarise_path(path, daily):
+        """Summarises a csv file and hashes the bytes it reads on the way.
+
+        The file may have changed since key() read it (a file being written
+        to, say), so the result is stored under the key of what was parsed.
+
+        Returns:
+            The summary text and its cache key.
+        """
+        hasher = ResultCache._hasher(daily)
+        hasher.update(b"file\n")
+        with open(path, "rb") as file:
+            stream = io.BufferedReader(_HashingReader(file, hasher), buffer_size=DECOMPRESS_BUFFER_SIZE)
+            rows = iter_data_from_csv(stream)
+            text = generate_daily_summary(rows) if daily else generate_summary(rows)
+            # whatever the parser left unread still belongs to the file
+            for block in iter(lambda: file.read(DECOMPRESS_BUFFER_SIZE), b""):
+                hasher.update(block)
+        return text, hasher.hexdigest()
+
+    def summary(self, source, daily=False):
+        """Returns the summary of a csv file or of rows, from the cache when possible.
+
+        Args:
+            source: a csv file path, or rows as generate_summary takes them.
+                An iterator is read into a list first, to hash it.
+            daily: if True, return generate_daily_summary instead of generate_summary.
+        Returns:
+            The summary text.
+        """
+        is_path = isinstance(source, (str, bytes, os.PathLike))
+        if not is_path and not isinstance(source, (list, tuple, WeatherSeries)):
+            source = list(source)
+        key = self.key(source, daily)
+        text = self.get(key)
+        if text is None:
+            if is_path:
+                text, key = self._summarise_path(source, daily)
+            else:
+                text = generate_daily_summary(source) if daily else generate_summary(source)
+            self.put(key, text)
+        return text
+
+    def get(self, key):
+        """Returns the result stored under a key, or None."""
+        text = self._memory.get(key)
+        if text is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return text
+        text = self._read_file(key)
+        if text is not None:
+            self.disk_hits += 1
+            self._remember(key, text)
+            return text
+        self.misses += 1
+        return None
+
+    def put(self, key, text):
+        """Stores a result under a key, in memory and in the directory."""
+        self._remember(key, text)
+        if self.directory is not None:
+            try:
+                self._write_file(key, text)
+            except OSError:
+                # a full or read-only disk just means the result isn't shared
+                pass
+
+    def _remember(self, key, text):
+        if self.max_entries == 0:
+            return
+        self._memory[key] = text
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + _RESULT_SUFFIX)
+
+    def _read_file(self, key):
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+            # reading it counts as a use for the eviction order
+            os.utime(path)
+        except OSError:
+            return None
+        header = _RESULT_MAGIC + key.encode("ascii") + b"\n"
+        if not data.startswith(header):
+            return None
+        try:
+            return data[len(header):].decode("utf8")
+        except UnicodeDecodeError:
+            return None
+
+    def _write_file(self, key, text):
+        import tempfile
+        data = _RESULT_MAGIC + key.encode("ascii") + b"\n" + text.encode("utf8")
+        if len(data) > self.max_disk_bytes:
+            return
+        handle, temporary = tempfile.mkstemp(dir=self.directory, prefix=".weather-", suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as file:
+                file.write(data)
+            os.replace(temporary, self._path(key))
+        except BaseException:
+            os.remove(temporary)
+            raise
+        # replacing an existing file counts it twice, which only brings the next listing forward
+        if self._disk_bytes is not None:
+            self._disk_bytes += len(data)
+        if self._disk_bytes is None or self._disk_bytes > self.max_disk_bytes:
+            self._trim_directory()
+
+    def _trim_directory(self):
+        """Counts the result files and removes the least recently used ones if they take too much.
+
+        Past max_disk_bytes they are trimmed to three quarters of it, so that
+        the next few writes don't list the directory again.
+        """
+        files = []
+        total = 0
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if not entry.name.endswith(_RESULT_SUFFIX):
+                    continue
+                try:
+                    status = entry.stat()
+                except OSError:
+                    continue
+                files.append((status.st_mtime_ns, entry.path, status.st_size))
+                total += status.st_size
+        files.sort()
+        if total > self.max_disk_bytes:
+            target = self.max_disk_bytes * 3 // 4
+            for _, path, size in files:
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    # another process removed it first, or it is open elsewhere
+                    continue
+                total -= size
+                self.disk_evictions += 1
+        self._disk_bytes = total
+
+    def stats(self):
+        """Returns the counters as a dict, with the number of results held in memory."""
+        return {"hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses,
+                "evictions": self.evictions, "disk_evictions": self.disk_evictions, "entries": len(self._memory)}
+
+    def clear(self):
+        """Forgets the results held in memory; the directory is left alone."""
+        self._memory.clear()
+
+
+# One file's outcome in summarise_files: either summary or error is None.
+BatchResult = namedtuple("BatchResult", ["path", "summary", "error"])
+
+
+def _expand_paths(paths):
+    """Turns directories, glob patterns and file names into a list of csv files.
+
+    Args:
+        paths: a path, directory or glob pattern, or a list of them.
+    Returns:
+        A list of file paths. Directories contribute their *.csv files
+        (compressed ones too, see _CSV_SUFFIXES) and patterns their matches,
+        both sorted by name.
+    """
+    import glob
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+    files = []
+    for path in paths:
+        path = os.fspath(path)
+        if os.path.isdir(path):
+            entries = glob.glob(os.path.join(glob.escape(path), "*"))
+            files.extend(sorted(entry for entry in entries if entry.endswith(_CSV_SUFFIXES)))
+        elif glob.has_magic(path):
+            files.extend(sorted(glob.glob(path)))
+        else:
+            files.append(path)
+    return files
+
+
+def _summarise_file(path, daily=False, cache=None):
+    """Loads one csv file and summarises it, catching any error.
+
+    Args:
+        path: a string representing the file path to a csv file.
+        daily: if True, produce the daily summary instead of the overview.
+        cache: a ResultCache to look the summary up in first, or None.
+    Returns:
+        A BatchResult for the file.
+    """
+    try:
+        if cache is not None:
+            summary = cache.summary(path, daily)
+        else:
+            rows = iter_data_from_csv(path)
+            summary = generate_daily_summary(rows) if daily else generate_summary(rows)
+    except Exception as error:
+        return BatchResult(path, None, f"{type(error).__name__}: {error}")
+    return BatchResult(path, summary, None)
+
+
+def _summarise_chunk(paths, daily=False, cache_dir=None):
+    """Summarises a group of files inside one worker process."""
+    cache = None
+    if cache_dir is not None:
+        # kept for the life of the worker, so its memory tier serves later chunks too
+        cache = _worker_caches.get(cache_dir)
+        if cache is None:
+            cache = _worker_caches[cache_dir] = ResultCache(directory=cache_dir)
+    return [_summarise_file(path, daily, cache) for path in paths]
+
+
+def summarise_files(paths, workers=None, chunk_size=1, ordered=True, daily=False, cache_dir=None):
+    """Summarises many csv files in parallel worker processes.
+
+    A file that can't be read or summarised is reported through the error
+    field of its result and doesn't stop the rest of the batch.
+
+    Args:
+        paths: a path, directory or glob pattern, or a list of them.
+        workers: the number of worker processes, os.cpu_count() by default.
+        chunk_size: how many files each task sent to a worker holds.
+        ordered: if True, yield results in input order, otherwise as soon as
+            each chunk completes.
+        daily: if True, produce daily summaries instead of overviews.
+        cache_dir: a directory the workers share a ResultCache in, so files
+            with the same content are only summarised once, also across runs.
+    Returns:
+        A generator of BatchResult tuples, one per file.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    files = _expand_paths(paths)
+    chunks = [files[start:start + chunk_size] for start in range(0, len(files), chunk_size)]
+    if not chunks:
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_summarise_chunk, chunk, daily, cache_dir): chunk for chunk in chunks}
+        for future in (futures if ordered else as_completed(futures)):
+            try:
+                results = future.result()
+            except Exception as error:
+                # the worker itself failed (e.g. it was killed), so every file in its chunk did
+                results = [BatchResult(path, None, f"{type(error).__name__}: {error}") for path in futures[future]]
+            yield from results
+
+
+# generate_summary_parallel splits a file into byte ranges of at most this
+# many bytes, so a worker only ever holds the columns of one range.
+PARALLEL_CHUNK_SIZE = 32 << 20
+
+
+def _line_ranges(csv_file, workers, chunk_size):
+    """Splits the lines after a csv file's header into byte ranges.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+        workers: the number of worker processes, None for os.cpu_count().
+        chunk_size: the size of each range, see generate_summary_parallel.
+    Returns:
+        A list of (start, stop) offsets, each range starting at a line start
+        and ending after a newline (or at the end of the file), or None if the
+        file can't be split at the byte level (it's compressed, or the header
+        could confuse the split).
+    """
+    with open(csv_file, "rb") as file:
+        # a compressed file can't be read from the middle
+        if _compression(file) is not None:
+            return None
+        header = file.readline()
+        # a quote could start a field spanning several lines, and a bare
+        # carriage return ends the header early for csv.reader
+        if b'"' in header or b"\r" in header[:-2]:
+            return None
+        start = file.tell()
+        size = os.fstat(file.fileno()).st_size
+        if chunk_size is None:
+            chunk_size = min(max((size - start) // (4 * (workers or os.cpu_count() or 1)), 1 << 16),
+                             PARALLEL_CHUNK_SIZE)
+        ranges = []
+        while start < size:
+            stop = start + chunk_size
+            if stop >= size:
+                stop = size
+            else:
+                # the range ends with the line holding its last byte
+                file.seek(stop - 1)
+                file.readline()
+                stop = file.tell()
+            ranges.append((start, stop))
+            start = stop
+    return ranges
+
+
+def _summarise_byte_range(csv_file, start, stop):
+    """Summarises the lines in bytes start to stop of a csv file, inside a worker process.
+
+    Returns:
+        A (SummaryAccumulator, min magnitude, max magnitude) tuple, where the
+        sums are exact (fsum) and the magnitudes are the sums of the absolute
+        temperatures, or None if the lines need csv.reader (quoting or bare
+        carriage returns).
+    """
+    with open(csv_file, "rb") as file:
+        file.seek(start)
+        buffer = file.read(stop - start)
+    if buffer.find(b'"') != -1:
+        return None
+    dates, minimums, maximums = [], array("d"), array("d")
+    if not _scan_blocks(buffer, 0, dates, minimums, maximums):
+        return None
+    accumulator = SummaryAccumulator()
+    if dates:
+        # the same values and last-index ties as adding the rows one by one
+        accumulator.count = len(dates)
+        accumulator.min_value, accumulator.min_index = _last_extreme(minimums, smallest=True)
+        accumulator.max_value, accumulator.max_index = _last_extreme(maximums, smallest=False)
+        accumulator.min_date = dates[accumulator.min_index]
+        accumulator.max_date = dates[accumulator.max_index]
+        accumulator.min_total = fsum(minimums)
+        accumulator.max_total = fsum(maximums)
+    return accumulator, fsum(map(abs, minimums)), fsum(map(abs, maximums))
+
+
+def generate_summary_parallel(csv_file, workers=None, chunk_size=None):
+    """Outputs the generate_summary overview of one csv file, parsed on several cores.
+
+    The lines after the header are split into byte ranges, which worker
+    processes parse like the fast loader into a SummaryAccumulator each; the
+    accumulators are merged in file order, so ties still go to the last
+    reading across range borders. Only the averages could come out
+    differently (the sums are added in another order), so they are checked
+    against a bound on the rounding. When the text could differ, or the file
+    has quoting, bare carriage returns, NaN or infinite readings, the file is
+    summarised in a single pass instead.
+
+    Args:
+        csv_file: a string representing the file path to a csv file.
+        workers: the number of worker processes, os.cpu_count() by default.
+        chunk_size: the size of each byte range; by default 4 ranges per
+            worker, of 64 KiB to PARALLEL_CHUNK_SIZE bytes.
+    Returns:
+        The same string as generate_summary(load_data_from_csv(csv_file)).
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    ranges = _line_ranges(csv_file, workers, chunk_size)
+    if ranges:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parts = list(executor.map(_summarise_byte_range, repeat(csv_file),
+                                      [start for start, _ in ranges], [stop for _, stop in ranges]))
+        summary = _merge_range_summaries(parts)
+        if summary is not None:
+            return summary
+    # also raises generate_summary's error for a file without readings
+    return generate_summary(iter_data_from_csv(csv_file))
+
+
+def _merge_range_summaries(parts):
+    """Puts the overview together from the _summarise_byte_range results, in file order.
+
+    Returns:
+        The overview text, or None if the file has to be summarised in one pass.
+    """
+    accumulator = SummaryAccumulator()
+    min_magnitude = max_magnitude = 0.0
+    for part in parts:
+        if part is None:
+            return None
+        accumulator.merge(part[0])
+        min_magnitude += part[1]
+        max_magnitude += part[2]
+    if accumulator.count == 0:
+        return None
+    # finite magnitudes also mean the extremes are neither NaN nor infinite
+    # each part's exact sum is rounded once, and once more when it is added
+    average_min_text = _bounded_average_text(accumulator.min_total, 2.0 ** -52 * len(parts) * min_magnitude,
+                                             min_magnitude, accumulator.count)
+    average_max_text = _bounded_average_text(accumulator.max_total, 2.0 ** -52 * len(parts) * max_magnitude,
+                                             max_magnitude, accumulator.count)
+    if average_min_text is None or average_max_text is None:
+        return None
+    return _overview_text(accumulator.count,
+                          _format_f_as_c(accumulator.min_value), convert_date(accumulator.min_date),
+                          _format_f_as_c(accumulator.max_value), convert_date(accumulator.max_date),
+                          average_min_text, average_max_text)
+
+
+_HTTP_REASONS = {200: "OK", 400: "Bad Request", 403: "Forbidden", 404: "Not Found",
+                 405: "Method Not Allowed", 422: "Unprocessable Entity", 500: "Internal Server Error"}
+
+
+class SummaryService:
+    """Serves generate_summary and generate_daily_summary results over HTTP.
+
+    Summaries are computed in an executor (worker processes by default) so
+    the event loop keeps answering while files are parsed. A request for a
+    file that is already being summarised waits for that computation instead
+    of starting another one. Results are cached by file identity (path, size,
+    modification time and inode), so a changed file is summarised again; the
+    cache drops the least recently used entry when it is full and entries
+    older than ttl seconds.
+
+    Routes, all GET:
+        /summary?path=FILE   the generate_summary overview of FILE
+        /daily?path=FILE     the generate_daily_summary text of FILE
+        /stats               the cache counters as JSON
+    FILE is relative to the root directory; paths outside it are refused.
+
+    Args:
+        root: the directory the csv files are served from.
+        cache_size: how many results the cache holds.
+        ttl: how many seconds a cached result is used.
+        executor: a concurrent.futures executor for the summaries. By default
+            a process pool is created on first use (and shut down by close()).
+        workers: the number of worker processes of the default pool.
+    """
+
+    def __init__(self, root, cache_size=128, ttl=60.0, executor=None, workers=None):
+        self.root = os.path.realpath(root)
+        self.cache_size = cache_size
+        self.ttl = ttl
+        self.workers = workers
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._executor = executor
+        self._owns_executor = executor is None
+        # key -> (expiry time, text), least recently used first
+        self._cache = OrderedDict()
+        # key -> the task computing it
+        self._pending = {}
+
+    def resolve(self, path):
+        """Returns the real path of a file under root.
+
+        Raises:
+            PermissionError: if the path leads outside root.
+        """
+        full_path = os.path.realpath(os.path.join(self.root, path))
+        if os.path.commonpath([self.root, full_path]) != self.root:
+            raise PermissionError(f"{path} is outside the served directory")
+        return full_path
+
+    async def get(self, path, kind="summary"):
+        """Returns the summary of a file, from the cache when possible.
+
+        Args:
+            path: the file, relative to root.
+            kind: "summary" for the overview or "daily" for the daily summary.
+        Returns:
+            The summary text.
+        Raises:
+            FileNotFoundError: if the file doesn't exist.
+            PermissionError: if the path leads outside root.
+            ValueError: if kind is unknown or the file can't be summarised.
+        """
+        import asyncio
+        if kind not in ("summary", "daily"):
+            raise ValueError(f"unknown summary kind {kind!r}")
+        full_path = self.resolve(path)
+        status = os.stat(full_path)
+        key = (kind, full_path, status.st_size, status.st_mtime_ns, status.st_ino)
+        loop = asyncio.get_running_loop()
+        cached = self._cache.get(key)
+        if cached is not None:
+            if cached[0] > loop.time():
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cached[1]
+            del self._cache[key]
+        task = self._pending.get(key)
+        if task is None:
+            self.misses += 1
+            task = self._pending[key] = loop.create_task(self._compute(key, full_path, kind))
+        else:
+            self.coalesced += 1
+        # shielded, so one caller giving up doesn't cancel the others
+        return await asyncio.shield(task)
+
+    async def _compute(self, key, full_path, kind):
+        """Summarises a file in the executor and caches the result."""
+        import asyncio
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(self._get_executor(), _summarise_file, full_path, kind == "daily")
+        finally:
+            del self._pending[key]
+        if result.error is not None:
+            raise ValueError(result.error)
+        self._cache[key] = (loop.time() + self.ttl, result.summary)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return result.summary
+
+    def _get_executor(self):
+        if self._executor is None:
+            from concurrent.futures import ProcessPoolExecutor
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def stats(self):
+        """Returns the cache counters as a dict."""
+        return {"hits": self.hits, "misses": self.misses, "coalesced": self.coalesced,
+                "cached": len(self._cache), "pending": len(self._pending)}
+
+    def close(self):
+        """Shuts down the executor if the service created it."""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def start(self, host="127.0.0.1", port=8080):
+        """Starts listening for HTTP requests.
+
+        Returns:
+            The asyncio.Server; use port 0 to pick a free port and read it
+            from server.sockets.
+        """
+        import asyncio
+        return await asyncio.start_server(self._handle_connection, host, port)
+
+    async def _handle_connection(self, reader, writer):
+        """Answers the requests of one connection, keeping it open for HTTP/1.1."""
+        import asyncio
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                # a request body isn't used, but has to be read past
+                if headers.get("content-length", "0").isdigit() and int(headers.get("content-length", "0")):
+                    await reader.readexactly(int(headers["content-length"]))
+                parts = request_line.decode("latin-1").split()
+                code, content_type, body = await self._respond(parts)
+                keep_alive = (len(parts) == 3 and parts[2] == "HTTP/1.1"
+                              and headers.get("connection", "").lower() != "close")
+                writer.write(
+                    f"HTTP/1.1 {code} {_HTTP_REASONS[code]}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+                    "\r\n".encode("latin-1") + body
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, parts):
+        """Handles one request line and returns (status code, content type, body)."""
+        import json
+        from urllib.parse import parse_qs, urlsplit
+        text = "text/plain; charset=utf-8"
+        if len(parts) != 3:
+            return 400, text, b"malformed request line\n"
+        method, target, _ = parts
+        if method != "GET":
+            return 405, text, b"only GET is supported\n"
+        url = urlsplit(target)
+        if url.path == "/stats":
+            return 200, "application/json", json.dumps(self.stats()).encode("utf8")
+        kind = {"/summary": "summary", "/daily": "daily"}.get(url.path)
+        if kind is None:
+            return 404, text, b"unknown route\n"
+        paths = parse_qs(url.query).get("path")
+        if not paths:
+            return 400, text, b"missing path parameter\n"
+        try:
+            summary = await self.get(paths[0], kind)
+        except (FileNotFoundError, NotADirectoryError):
+            # NotADirectoryError: a path going through a file, like example.csv/x
+            return 404, text, f"{paths[0]} not found\n".encode("utf8")
+        except PermissionError as error:
+            return 403, text, f"{error}\n".encode("utf8")
+        except ValueError as error:
+            return 422, text, f"{error}\n".encode("utf8")
+        except OSError as error:
+            # a name that is too long, a symlink loop and the like
+            return 400, text, f"{paths[0]}: {error.strerror or error}\n".encode("utf8")
+        except Exception:
+            # a bug, but the client still gets an answer and the connection stays usable
+            import traceback
+            traceback.print_exc()
+            return 500, text, b"internal error\n"
+        return 200, text, summary.encode("utf8")
+
+
+def _read_inputs(arguments):
+    """Reads the input files of the summary and daily commands as one sequence of rows."""
+    if arguments.fast:
+        series = WeatherSeries()
+        for path in arguments.paths:
+            series.extend(load_data_from_csv(path, as_series=True, fast=True))
+        return series
+    return (row for path in arguments.paths for row in iter_data_from_csv(path))
+
+
+def _open_output(arguments):
+    """Opens the --output file, or returns stdout when there is none."""
+    import contextlib
+    if arguments.output in (None, "-"):
+        return contextlib.nullcontext(sys.stdout)
+    return open(arguments.output, "w", encoding="utf8")
+
+
+def _run_summary(arguments):
+    """Runs the summary command and returns the exit code."""
+    if arguments.window is None and arguments.period is None:
+        rows = _read_inputs(arguments)
+        if arguments.percentiles is None and arguments.top is None:
+            summary = generate_summary(rows)
+        else:
+            # both summaries read the rows, so they are loaded first
+            rows = rows if isinstance(rows, WeatherSeries) else WeatherSeries(rows)
+            summary = generate_summary(rows) + "\n" + generate_percentile_summary(
+                rows, arguments.percentiles if arguments.percentiles is not None else (5, 50, 95),
+                arguments.top if arguments.top is not None else 3)
+        with _open_output(arguments) as output:
+            output.write(summary)
+        return 0
+    if arguments.window is not None:
+        periods = rolling_summaries(_read_inputs(arguments), arguments.window)
+    else:
+        periods = calendar_summaries(_read_inputs(arguments), arguments.period)
+    with _open_output(arguments) as output:
+        for period in periods:
+            output.write(f"==> {period.first_date} to {period.last_date} <==\n{period.summary}\n")
+    return 0
+
+
+def _run_daily(arguments):
+    """Runs the daily command and returns the exit code."""
+    with _open_output(arguments) as output:
+        write_daily_summary(_read_inputs(arguments), output)
+    return 0
+
+
+def _run_stations(arguments):
+    """Runs the stations command and returns the exit code."""
+    rows = (pair for path in arguments.paths for pair in iter_station_data(path, arguments.column))
+    if arguments.daily_dir is not None:
+        os.makedirs(arguments.daily_dir, exist_ok=True)
+        days = write_station_daily_summaries(rows, arguments.daily_dir)
+        with _open_output(arguments) as output:
+            for station, count in days.items():
+                output.write(f"{os.path.join(arguments.daily_dir, station_file_name(station))}: {count} days\n")
+        return 0
+    summaries = generate_station_summaries(rows)
+    with _open_output(arguments) as output:
+        for station, summary in summaries.items():
+            output.write(f"==> {station} <==\n{summary}\n")
+    return 0
+
+
+def _run_validate(arguments):
+    """Runs the validate command and returns the exit code (1 if rows were rejected)."""
+    rejected = 0
+    with _open_output(arguments) as output:
+        for path in arguments.paths:
+            report = load_data_with_report(path, max_rejected=arguments.limit)[1]
+            rejected += report.rows_rejected
+            if len(arguments.paths) > 1:
+                output.write(f"==> {path} <==\n")
+            output.write(report.format(limit=arguments.limit))
+    return 1 if rejected else 0
+
+
+def _run_batch(arguments):
+    """Runs the batch command and returns the exit code."""
+    failed = 0
+    with _open_output(arguments) as output:
+        for result in summarise_files(arguments.paths, workers=arguments.workers, chunk_size=arguments.chunk_size,
+                                      ordered=not arguments.unordered, daily=arguments.daily,
+                                      cache_dir=arguments.cache_dir):
+            if result.error is not None:
+                failed += 1
+                print(f"{result.path}: {result.error}", file=sys.stderr)
+                continue
+            output.write(f"==> {result.path} <==\n{result.summary}\n")
+    return 1 if failed else 0
+
+
+def _run_follow(arguments):
+    """Runs the follow command and returns the exit code."""
+    import time
+    follower = SummaryFollower(arguments.path)
+    refreshes = 0
+    while arguments.count is None or refreshes < arguments.count:
+        if refreshes:
+            time.sleep(arguments.interval)
+        refreshes += 1
+        rebuilds = follower.rebuilds
+        if follower.refresh() or follower.rebuilds != rebuilds or refreshes == 1:
+            if follower.accumulator.count:
+                sys.stdout.write(follower.summary() + "\n")
+                sys.stdout.flush()
+    return 0
+
+
+async def _serve(service, host, port):
+    """Runs a SummaryService until it is cancelled, which SIGTERM does too."""
+    import asyncio
+    import signal
+    server = await service.start(host, port)
+    port = server.sockets[0].getsockname()[1]
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+    except NotImplementedError:
+        # Windows event loops have no signal handlers
+        pass
+    print(f"serving {service.root} on http://{host}:{port}/", file=sys.stderr, flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def _run_serve(arguments):
+    """Runs the serve command and returns the exit code.
+
+    Ctrl+C and SIGTERM both stop the server and close the service, so its
+    worker processes exit with it.
+    """
+    import asyncio
+    service = SummaryService(arguments.root, cache_size=arguments.cache_size, ttl=arguments.ttl,
+                             workers=arguments.workers)
+    try:
+        asyncio.run(_serve(service, arguments.host, arguments.port))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+    finally:
+        service.close()
+    return 0
+
+
+def main(argv=None):
+    """Command line entry point, used by "python -m weather".
+
+    Args:
+        argv: the arguments to parse, sys.argv[1:] by default.
+    Returns:
+        The exit code.
+    """
+    import argparse
+    parser = argparse.ArgumentParser(prog="weather", description="Summarise weather csv files.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    for name, run, description in (("summary", _run_summary, "print the overview of the input files"),
+                                   ("daily", _run_daily, "print the daily summary of the input files")):
+        command = commands.add_parser(name, help=description, description=description + ", read in order as one dataset")
+        command.add_argument("paths", nargs="+", help="csv files")
+        command.add_argument("-o", "--output", help="write to this file instead of stdout")
+        command.add_argument("--fast", action="store_true", help="load each file at once with the mmap loader")
+        command.add_argument("--stats", action="store_true",
+                             help="print stage timings and row counts to stderr (Prometheus text format)")
+        command.set_defaults(run=run)
+        if name == "summary":
+            grouping = command.add_mutually_exclusive_group()
+            grouping.add_argument("--window", type=int, help="print an overview of every run of this many days")
+            grouping.add_argument("--period", choices=("week", "month"), help="print an overview of every week or month")
+            command.add_argument("--percentiles", type=lambda text: [float(part) for part in text.split(",") if part],
+                                 help="also print these percentiles of the lows and highs, e.g. 5,50,95")
+            command.add_argument("--top", type=int, help="also list this many of the hottest and coldest days")
+
+    stations = commands.add_parser("stations", help="summarise each station of files that interleave several")
+    stations.add_argument("paths", nargs="+", help="csv files with station, date, min and max columns")
+    stations.add_argument("-o", "--output", help="write to this file instead of stdout")
+    stations.add_argument("--column", default="station", help="header name of the station column")
+    stations.add_argument("--daily-dir", help="write each station's daily summary to DIR/<station>.txt instead")
+    stations.set_defaults(run=_run_stations)
+
+    validate = commands.add_parser("validate", help="report the rows the loaders skip and why")
+    validate.add_argument("paths", nargs="+", help="csv files")
+    validate.add_argument("-o", "--output", help="write to this file instead of stdout")
+    validate.add_argument("--limit", type=int, default=10, help="number of rejected rows to list per file")
+    validate.set_defaults(run=_run_validate)
+
+    batch = commands.add_parser("batch", help="summarise many files in parallel")
+    batch.add_argument("paths", nargs="+", help="csv files, directories or glob patterns")
+    batch.add_argument("-o", "--output", help="write to this file instead of stdout")
+    batch.add_argument("-j", "--workers", type=int, default=None, help="number of worker processes")
+    batch.add_argument("--chunk-size", type=int, default=1, help="files per worker task")
+    batch.add_argument("--unordered", action="store_true", help="print results as they complete")
+    batch.add_argument("--daily", action="store_true", help="print daily summaries instead of overviews")
+    batch.add_argument("--cache-dir", help="reuse the summaries of files with the same content, stored in DIR")
+    batch.set_defaults(run=_run_batch)
+
+    follow = commands.add_parser("follow", help="print the overview again whenever rows are appended")
+    follow.add_argument("path", help="csv file")
+    follow.add_argument("--interval", type=float, default=5.0, help="seconds between checks")
+    follow.add_argument("--count", type=int, default=None, help="stop after this many checks")
+    follow.set_defaults(run=_run_follow)
+
+    serve = commands.add_parser("serve", help="serve summaries over HTTP")
+    serve.add_argument("root", help="directory the csv files are served from")
+    serve.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    serve.add_argument("--port", type=int, default=8080, help="port to listen on, 0 for any free port")
+    serve.add_argument("-j", "--workers", type=int, default=None, help="number of worker processes")
+    serve.add_argument("--cache-size", type=int, default=128, help="number of summaries to cache")
+    serve.add_argument("--ttl", type=float, default=60.0, help="seconds a cached summary is used")
+    serve.set_defaults(run=_run_serve)
+
+    arguments = parser.parse_args(argv)
+    if getattr(arguments, "stats", False):
+        with Instrumentation() as stats:
+            code = arguments.run(arguments)
+        sys.stderr.write(stats.to_prometheus())
+        return code
+    return arguments.run(arguments)
+
+
+if __name__ == "__main__":
+    sys.exit(main())